@@ -0,0 +1 @@
+"""Benchmarks of Cihai Python API."""
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Benchmark peak memory of importing UNIHAN, buffered against streamed."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import pathlib
+import tempfile
+import tracemalloc
+import typing as t
+from collections.abc import Callable
+
+import sqlalchemy
+
+from cihai.data.unihan import bootstrap
+from cihai.data.unihan.constants import (
+    BOOTSTRAP_CHUNK_SIZE,
+    UNIHAN_ETL_DEFAULT_OPTIONS,
+    UNIHAN_FIELDS,
+)
+from unihan_etl import core as unihan
+from unihan_etl.util import merge_dict
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def buffered(engine: sqlalchemy.Engine, options: dict[str, t.Any]) -> None:
+    """Import the way bootstrap did before streaming: export(), then insert."""
+    metadata = sqlalchemy.MetaData()
+    packager = unihan.Packager(options)
+    packager.download()
+    data = [
+        {**row, bootstrap.CODEPOINT_COLUMN: ord(row["char"])}
+        for row in packager.export() or []
+    ]
+    table = bootstrap.create_unihan_table(UNIHAN_FIELDS, metadata)
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.insert(table), data)
+
+
+def streamed(
+    engine: sqlalchemy.Engine,
+    options: dict[str, t.Any],
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> None:
+    """Import with :func:`cihai.data.unihan.bootstrap.bootstrap_unihan`."""
+    bootstrap.bootstrap_unihan(
+        engine,
+        sqlalchemy.MetaData(),
+        options,
+        indexes=[],
+        chunk_size=chunk_size,
+    )
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> dict[str, float]:
+    """Return peak traced memory of each import, in bytes, on fresh databases.
+
+    The streamed import holds ``chunk_size`` values at a time, lower it to see
+    the bound on data smaller than UNIHAN, e.g. the test fixtures.
+    """
+    options = merge_dict(UNIHAN_ETL_DEFAULT_OPTIONS.copy(), unihan_options or {})
+
+    peaks: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        loads: dict[str, Callable[[sqlalchemy.Engine, dict[str, t.Any]], None]] = {
+            "buffered": buffered,
+            "streamed": functools.partial(streamed, chunk_size=chunk_size),
+        }
+        for name, load in loads.items():
+            engine = sqlalchemy.create_engine(
+                f"sqlite:///{pathlib.Path(tmp_dir) / name}.db",
+            )
+            tracemalloc.start()
+            load(engine, options)
+            _, peaks[name] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            engine.dispose()
+            log.info("%s: %.1f KB peak", name, peaks[name] / 1024)
+    return peaks
+
+
+if __name__ == "__main__":
+    run()
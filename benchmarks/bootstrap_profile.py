@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Benchmark UNIHAN bootstrap with and without the bulk load profile."""
+
+from __future__ import annotations
+
+import logging
+import pathlib
+import tempfile
+import time
+import typing as t
+
+import sqlalchemy
+
+from cihai.data.unihan import bootstrap
+from cihai.data.unihan.constants import UNIHAN_ETL_DEFAULT_OPTIONS
+from unihan_etl.util import merge_dict
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    number: int = 3,
+) -> dict[str, float]:
+    """Return best end-to-end bootstrap time of each mode, on fresh databases."""
+    options: dict[str, t.Any] = merge_dict(
+        UNIHAN_ETL_DEFAULT_OPTIONS.copy(),
+        unihan_options or {},
+    )
+
+    timings: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, bulk_load in (("default", False), ("bulk_load", True)):
+            runs = []
+            for i in range(number):
+                db = pathlib.Path(tmp_dir) / f"{name}-{i}.db"
+                engine = sqlalchemy.create_engine(f"sqlite:///{db}")
+                start = time.perf_counter()
+                bootstrap.bootstrap_unihan(
+                    engine,
+                    sqlalchemy.MetaData(),
+                    options,
+                    bulk_load=bulk_load,
+                )
+                runs.append(time.perf_counter() - start)
+                engine.dispose()
+            timings[name] = min(runs)
+            log.info("%s: %.3fs", name, timings[name])
+    return timings
+
+
+if __name__ == "__main__":
+    run()
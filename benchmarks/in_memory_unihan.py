@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark the in-memory UNIHAN dataset against the SQL-backed one."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+import tracemalloc
+import typing as t
+
+from cihai.core import Cihai
+from cihai.data.unihan.memory import InMemoryUnihan
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    config: dict[str, object] | None = None,
+    number: int = 5,
+) -> dict[str, dict[str, float]]:
+    """Time lookups, reverse lookups and field filters on both datasets."""
+    if unihan_options is None:
+        unihan_options = {}
+
+    c = Cihai(config=config)
+    if not c.unihan.is_bootstrapped:  # download and install Unihan to db
+        c.unihan.bootstrap(unihan_options)
+
+    c.add_dataset(InMemoryUnihan, namespace="memory")
+    memory: InMemoryUnihan = c.memory
+
+    tracemalloc.start()
+    columns = memory.columns
+    load_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    log.info(
+        "in-memory table: %d rows, %.1f KB (nbytes), %.1f KB (traced)",
+        len(columns),
+        columns.nbytes / 1024,
+        load_bytes / 1024,
+    )
+
+    chars = [row.char for row in c.unihan.with_fields(["kDefinition"])]
+
+    def time_dataset(dataset: t.Any) -> dict[str, float]:
+        def lookup_char() -> None:
+            for char in chars:
+                dataset.lookup_char(char).first()
+
+        def reverse_char() -> None:
+            list(dataset.reverse_char("wood", fields=["kDefinition"], match="token"))
+
+        def with_fields() -> None:
+            list(dataset.with_fields(["kSemanticVariant"]))
+
+        results = {
+            fn.__name__: min(timeit.repeat(fn, number=1, repeat=number))
+            for fn in (lookup_char, reverse_char, with_fields)
+        }
+        c.sql.session.expunge_all()
+        return results
+
+    timings = {"sql": time_dataset(c.unihan), "memory": time_dataset(memory)}
+    for operation in timings["sql"]:
+        log.info(
+            "%s: sql %.4fs, memory %.4fs",
+            operation,
+            timings["sql"][operation],
+            timings["memory"][operation],
+        )
+    return timings
+
+
+if __name__ == "__main__":
+    run()
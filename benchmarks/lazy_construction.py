@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Benchmark constructing Cihai eagerly and lazily."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+
+from cihai.core import Cihai
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    config: dict[str, object] | None = None,
+    number: int = 5,
+) -> dict[str, float]:
+    """Return best construction time of each mode, and of a first lookup after it."""
+    c = Cihai(config=config)
+    if not c.unihan.is_bootstrapped:  # download and install Unihan to db
+        c.unihan.bootstrap(unihan_options or {})
+    c.sql.engine.dispose()
+
+    def eager() -> None:
+        Cihai(config=config).sql.engine.dispose()
+
+    def lazy() -> None:
+        Cihai(config=config, lazy=True)
+
+    def lazy_first_lookup() -> None:
+        app = Cihai(config=config, lazy=True)
+        app.unihan.lookup_char("好").first()
+        app.sql.engine.dispose()
+
+    timings = {
+        fn.__name__: min(timeit.repeat(fn, number=1, repeat=number))
+        for fn in (eager, lazy, lazy_first_lookup)
+    }
+    for name, seconds in timings.items():
+        log.info("%s: %.4fs", name, seconds)
+    return timings
+
+
+if __name__ == "__main__":
+    run()
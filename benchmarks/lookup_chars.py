@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Benchmark batched UNIHAN lookups against a per-character loop."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import timeit
+
+from cihai.core import Cihai
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    config: dict[str, object] | None = None,
+    text_length: int = 2000,
+    number: int = 5,
+) -> dict[str, float]:
+    """Time annotating ``text_length`` characters with both lookup styles."""
+    if unihan_options is None:
+        unihan_options = {}
+
+    c = Cihai(config=config)
+    if not c.unihan.is_bootstrapped:  # download and install Unihan to db
+        c.unihan.bootstrap(unihan_options)
+
+    chars = [row.char for row in c.unihan.with_fields(["kDefinition"])]
+    text = "".join(itertools.islice(itertools.cycle(chars), text_length))
+
+    def per_char() -> None:
+        for char in text:
+            c.unihan.lookup_char(char).first()
+        c.sql.session.expunge_all()
+
+    def batched() -> None:
+        c.unihan.lookup_chars(text)
+        c.sql.session.expunge_all()
+
+    timings = {
+        "lookup_char": min(timeit.repeat(per_char, number=1, repeat=number)),
+        "lookup_chars": min(timeit.repeat(batched, number=1, repeat=number)),
+    }
+    for name, seconds in timings.items():
+        log.info("%s: %d characters in %.4fs", name, len(text), seconds)
+    log.info("speedup: %.1fx", timings["lookup_char"] / timings["lookup_chars"])
+    return timings
+
+
+if __name__ == "__main__":
+    run()
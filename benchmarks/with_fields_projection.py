@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Benchmark ORM rows against Core projections for a one-field walk."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+import tracemalloc
+import typing as t
+
+from cihai.core import Cihai
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def run(
+    unihan_options: dict[str, object] | None = None,
+    config: dict[str, object] | None = None,
+    field: str = "kTraditionalVariant",
+    number: int = 5,
+) -> dict[str, dict[str, float]]:
+    """Time and trace walking ``field`` of every character that has it."""
+    if unihan_options is None:
+        unihan_options = {}
+
+    c = Cihai(config=config)
+    if not c.unihan.is_bootstrapped:  # download and install Unihan to db
+        c.unihan.bootstrap(unihan_options)
+
+    columns = ["char", field]
+    styles: dict[str, t.Callable[[], list[t.Any]]] = {
+        "orm": lambda: [
+            (r.char, getattr(r, field)) for r in c.unihan.with_fields([field])
+        ],
+        "orm_columns": lambda: [
+            (r.char, getattr(r, field))
+            for r in c.unihan.with_fields([field], columns=columns)
+        ],
+        "raw": lambda: list(c.unihan.with_fields([field], columns=columns, raw=True)),
+    }
+
+    results: dict[str, dict[str, float]] = {}
+    for name, walk in styles.items():
+
+        def walk_once(walk: t.Callable[[], list[t.Any]] = walk) -> None:
+            walk()
+            c.sql.session.expunge_all()
+
+        tracemalloc.start()
+        walk_once()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "seconds": min(timeit.repeat(walk_once, number=1, repeat=number)),
+            "peak_kb": peak / 1024,
+        }
+        log.info(
+            "%s: %.4fs, peak %.1f KB",
+            name,
+            results[name]["seconds"],
+            results[name]["peak_kb"],
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -10,6 +10,7 @@ https://docs.pytest.org/en/stable/deprecations.html
 
 from __future__ import annotations
 
+import copy
 import getpass
 import pathlib
 import typing as t
@@ -80,6 +81,19 @@ def setup(
     """Bootstrap pytest fixtures."""
 
 
+@pytest.fixture(autouse=True)
+def cache_path(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> pathlib.Path:
+    """Keep caches of :class:`~cihai.core.Cihai` out of the user's cache directory."""
+    from cihai.constants import DEFAULT_CONFIG
+    from cihai.core import Cihai
+
+    path = tmp_path / "cache"
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    t.cast("dict[str, object]", config["dirs"])["cache"] = path
+    monkeypatch.setattr(Cihai, "default_config", config)
+    return path
+
+
 @pytest.fixture(autouse=True)
 def cwd_default(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
     """Set current working directory to random path."""
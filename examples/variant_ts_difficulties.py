@@ -32,7 +32,8 @@ def run(unihan_options: dict[str, object] | None = None) -> None:
     log.info("https://www.unicode.org/reports/tr38/#N10211")
     log.info("3.7.1 bullet 4")
 
-    for char in c.unihan.with_fields(["kTraditionalVariant", "kSimplifiedVariant"]):
+    fields = ["kTraditionalVariant", "kSimplifiedVariant"]
+    for char in c.unihan.iter_with_fields(fields, columns=fields):
         log.info(f"Character: {char.char}")
         trad = set(char.untagged_vars("kTraditionalVariant"))
         simp = set(char.untagged_vars("kSimplifiedVariant"))
@@ -0,0 +1,322 @@
+"""Asyncio API of cihai, over SQLAlchemy's asyncio engine.
+
+:class:`AsyncCihai` looks characters up without blocking the event loop:
+
+.. code-block:: python
+
+    from cihai.aio import AsyncCihai
+
+    async with AsyncCihai() as c:
+        rows = await c.unihan.lookup_char("好")
+        async for row in c.unihan.iter_with_fields(["kDefinition"], raw=True):
+            print(row.char, row.kDefinition)
+
+The lookups are those of :class:`~cihai.data.unihan.dataset.Unihan`, run in
+SQLAlchemy's greenlet bridge over an async driver, ``aiosqlite`` for SQLite.
+Install them with the ``async`` extra, ``pip install "cihai[async]"``.
+
+Bootstrap UNIHAN with :class:`~cihai.core.Cihai` beforehand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+import typing as t
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.util import greenlet_spawn
+
+from .constants import app_dirs
+from .core import Cihai
+from .db import Database, engine_options
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from sqlalchemy.engine import URL
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from .data.unihan.dataset import ReverseMatch, Unihan
+    from .types import ConfigDict
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+T = t.TypeVar("T")
+
+#: Async driver used for database URLs of each backend naming no driver
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+def async_url(url: str) -> URL:
+    """Return database ``url`` with the async driver of its backend.
+
+    URLs naming a driver, e.g. ``postgresql+psycopg://``, are kept.
+
+    Parameters
+    ----------
+    url : str
+        ``url`` of the ``database`` config
+
+    Returns
+    -------
+    :class:`sqlalchemy.engine.URL`
+
+    Examples
+    --------
+    >>> async_url("sqlite:///cihai.db").render_as_string()
+    'sqlite+aiosqlite:///cihai.db'
+    >>> async_url("postgresql+psycopg://localhost/cihai").drivername
+    'postgresql+psycopg'
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return parsed
+    return parsed.set(drivername=f"{parsed.drivername}+{driver}")
+
+
+class AsyncDatabase:
+    """Database of :class:`AsyncCihai`, created by :meth:`connect`.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.ext.asyncio.AsyncEngine`
+    database : :class:`cihai.db.Database`
+        over the ``sync_engine`` of ``engine``, with a session per task
+    """
+
+    def __init__(self, engine: AsyncEngine, database: Database) -> None:
+        #: :class:`sqlalchemy.ext.asyncio.AsyncEngine` instance.
+        self.engine = engine
+        #: :class:`cihai.db.Database` the datasets query, see :meth:`run_sync`.
+        self.database = database
+
+    @classmethod
+    async def connect(cls, config: ConfigDict) -> AsyncDatabase:
+        """Create engine of the ``database`` config and reflect the database.
+
+        Parameters
+        ----------
+        config : dict
+            :attr:`cihai.core.Cihai.config`, its ``url`` is given an async
+            driver by :func:`async_url`
+
+        Returns
+        -------
+        :class:`AsyncDatabase`
+        """
+        engine = create_async_engine(
+            async_url(config["database"]["url"]),
+            **engine_options(config),
+        )
+        database = await greenlet_spawn(
+            Database,
+            config,
+            engine.sync_engine,
+            asyncio.current_task,
+        )
+        return cls(engine, database)
+
+    async def run_sync(self, fn: Callable[..., T], *args: t.Any, **kwargs: t.Any) -> T:
+        """Return ``fn(*args, **kwargs)``, querying :attr:`database` without blocking.
+
+        ``fn`` uses the session of the current task, closed once it returns:
+        return rows, not queries, and load the columns needed beforehand.
+        """
+
+        def call() -> T:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.database.remove_session()
+
+        return await greenlet_spawn(call)
+
+    async def dispose(self) -> None:
+        """Close the connections of the pool."""
+        await self.engine.dispose()
+
+
+class AsyncUnihan:
+    """Awaitable lookups of :class:`~cihai.data.unihan.dataset.Unihan`.
+
+    Lookups return lists of rows. ORM objects are detached from their
+    session, so columns not loaded raise on access.
+
+    Parameters
+    ----------
+    dataset : :class:`~cihai.data.unihan.dataset.Unihan`
+        dataset over :attr:`AsyncDatabase.database`
+    sql : :class:`AsyncDatabase`
+    """
+
+    def __init__(self, dataset: Unihan, sql: AsyncDatabase) -> None:
+        self.dataset = dataset
+        self.sql = sql
+
+    async def lookup_char(
+        self,
+        char: str,
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> list[t.Any]:
+        """Return rows of ``char``.
+
+        See :meth:`~cihai.data.unihan.dataset.Unihan.lookup_char`.
+        """
+
+        def lookup() -> list[t.Any]:
+            if raw:
+                return list(self.dataset.lookup_char(char, columns, raw=True))
+            return self.dataset.lookup_char(char, columns).all()
+
+        return await self.sql.run_sync(lookup)
+
+    async def lookup_chars(
+        self,
+        chars: str | Iterable[str],
+        columns: list[str] | None = None,
+    ) -> dict[str, t.Any]:
+        """Return rows of many characters at once, None for those missing.
+
+        See :meth:`~cihai.data.unihan.dataset.Unihan.lookup_chars`.
+        """
+        return await self.sql.run_sync(
+            self.dataset.lookup_chars,
+            list(chars),
+            columns,
+        )
+
+    async def reverse_char(
+        self,
+        hints: str | list[str],
+        fields: list[str] | None = None,
+        match: ReverseMatch = "substring",
+    ) -> list[t.Any]:
+        """Return rows whose ``fields`` match ``hints``.
+
+        See :meth:`~cihai.data.unihan.dataset.Unihan.reverse_char`.
+        """
+        return await self.sql.run_sync(
+            lambda: self.dataset.reverse_char(hints, fields, match).all(),
+        )
+
+    async def with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> list[t.Any]:
+        """Return rows with information for ``fields``.
+
+        See :meth:`~cihai.data.unihan.dataset.Unihan.with_fields`, and
+        :meth:`iter_with_fields` to stream many rows.
+        """
+
+        def lookup() -> list[t.Any]:
+            if raw:
+                return list(self.dataset.with_fields(fields, columns, raw=True))
+            return self.dataset.with_fields(fields, columns).all()
+
+        return await self.sql.run_sync(lookup)
+
+    async def iter_with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = None,
+        raw: bool = False,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[t.Any]:
+        """Stream rows with information for ``fields``, ``batch_size`` at a time.
+
+        See :meth:`~cihai.data.unihan.dataset.Unihan.iter_with_fields`.
+
+        Yields
+        ------
+        :class:`~cihai.data.unihan.dataset.Unihan` | :class:`sqlalchemy.engine.Row`
+        """
+        statement = self.dataset.with_fields_statement(fields, columns, raw)
+        options = {"yield_per": batch_size}
+        if raw:
+            async with self.sql.engine.connect() as conn:
+                result = await conn.stream(statement, execution_options=options)
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield row
+            return
+
+        async with AsyncSession(self.sql.engine) as session:
+            rows = await session.stream(statement, execution_options=options)
+            async for partition in rows.scalars().partitions():
+                for row in partition:
+                    yield row
+                for row in partition:
+                    session.expunge(row)
+
+
+class AsyncCihai:
+    """Asyncio counterpart of :class:`~cihai.core.Cihai`.
+
+    Datasets are added by :meth:`connect`, or entering ``async with``. UNIHAN
+    is at :attr:`unihan`, other datasets at :attr:`cihai`, to query through
+    :meth:`AsyncDatabase.run_sync`.
+
+    Parameters
+    ----------
+    config : dict | None
+        see :class:`~cihai.core.Cihai`
+    unihan : bool
+        add the UNIHAN dataset
+    """
+
+    #: :class:`AsyncDatabase` instance, set by :meth:`connect`.
+    sql: AsyncDatabase
+    #: :class:`AsyncUnihan` instance, set by :meth:`connect`.
+    unihan: AsyncUnihan
+
+    def __init__(
+        self,
+        config: dict[str, object] | None = None,
+        unihan: bool = True,
+    ) -> None:
+        #: :class:`~cihai.core.Cihai` holding the datasets, over :attr:`sql`
+        self.cihai = Cihai(config, unihan=unihan, lazy=True)
+        self.config = self.cihai.config
+
+    async def connect(self) -> Self:
+        """Connect :attr:`sql` and add the configured datasets.
+
+        Returns
+        -------
+        :class:`AsyncCihai` :
+            this instance
+        """
+        pathlib.Path(app_dirs.user_data_dir).mkdir(parents=True, exist_ok=True)
+        self.sql = await AsyncDatabase.connect(self.config)
+        self.cihai.sql = self.sql.database
+        await self.sql.run_sync(self.cihai.bootstrap)
+        if "unihan" in self.config.get("datasets", {}):
+            self.unihan = AsyncUnihan(self.cihai.unihan, self.sql)
+        return self
+
+    async def close(self) -> None:
+        """Close the connections of :attr:`sql`."""
+        await self.sql.dispose()
+
+    async def __aenter__(self) -> Self:
+        """Connect, see :meth:`connect`."""
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close, see :meth:`close`."""
+        await self.close()
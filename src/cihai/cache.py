@@ -0,0 +1,229 @@
+"""Bounded result caches for cihai datasets.
+
+Caches are configured per dataset namespace under the ``cache`` key of the
+:class:`~cihai.core.Cihai` config:
+
+.. code-block:: python
+
+    Cihai(config={"cache": {"unihan": {"maxsize": 4096, "maxbytes": 32_000_000}}})
+
+:meth:`cihai.db.Database.cache` creates them, and
+:meth:`cihai.db.Database.reflect_db` empties them, so a bootstrap never serves
+rows from before it. Writes made to the database by other means are not
+tracked; call :meth:`LRUCache.clear` after them.
+
+SQLAlchemy-backed datasets opt a query into its dataset's cache with the
+:class:`FromCache` option.
+"""
+
+from __future__ import annotations
+
+import collections
+import sys
+import threading
+import typing as t
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, merge_frozen_result
+from sqlalchemy.orm.interfaces import UserDefinedOption
+
+if t.TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    from sqlalchemy.engine import FrozenResult, Result
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlalchemy.sql import Select
+
+
+class CacheInfo(t.NamedTuple):
+    """Counters and bounds of an :class:`LRUCache`."""
+
+    #: Lookups answered from the cache
+    hits: int
+    #: Lookups that had to run
+    misses: int
+    #: Entries dropped to stay within ``maxsize`` / ``maxbytes``
+    evictions: int
+    #: Entries held
+    currsize: int
+    #: Approximate bytes held by the entries
+    currbytes: int
+    #: Entry limit, None if unbounded
+    maxsize: int | None
+    #: Byte limit, None if unbounded
+    maxbytes: int | None
+
+
+class LRUCache:
+    """Least-recently-used cache, bounded by entry count and approximate size.
+
+    Parameters
+    ----------
+    maxsize : int | None
+        maximum number of entries, unbounded if None
+    maxbytes : int | None
+        maximum approximate size of the entries, in bytes, unbounded if None
+
+    Examples
+    --------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.set("a", 1)
+    >>> cache.set("b", 2)
+    >>> cache.get("a")
+    1
+    >>> cache.set("c", 3)
+    >>> cache.get("b") is None
+    True
+    >>> cache.info().hits, cache.info().misses, cache.info().evictions
+    (1, 1, 1)
+    """
+
+    def __init__(self, maxsize: int | None = 1024, maxbytes: int | None = None) -> None:
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = self.misses = self.evictions = 0
+        self.currbytes = 0
+        self._entries: collections.OrderedDict[Hashable, tuple[t.Any, int]] = (
+            collections.OrderedDict()
+        )
+        #: Compiled SQL of the statements cached, keyed by statement cache key
+        self.statements: dict[t.Any, str] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return number of entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> t.Any | None:
+        """Return value of ``key`` and mark it recently used, None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: t.Any, nbytes: int = 0) -> None:
+        """Store ``value``, evicting least recently used entries past the bounds.
+
+        Parameters
+        ----------
+        key : Hashable
+        value : Any
+        nbytes : int
+            approximate size of ``value``, values larger than ``maxbytes`` are
+            not stored
+        """
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.currbytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self.currbytes += nbytes
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+                self.maxbytes is not None and self.currbytes > self.maxbytes
+            ):
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.currbytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries, counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.statements.clear()
+            self.currbytes = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit, miss and eviction counters, and current size."""
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(self._entries),
+                currbytes=self.currbytes,
+                maxsize=self.maxsize,
+                maxbytes=self.maxbytes,
+            )
+
+
+def _sizeof(obj: object) -> int:
+    """Return approximate size of a value, with the attributes of mapped objects."""
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+        size += sum(
+            sys.getsizeof(value)
+            for name, value in attrs.items()
+            if name != "_sa_instance_state"
+        )
+    return size
+
+
+def sizeof_frozen_result(frozen: FrozenResult[t.Any]) -> int:
+    """Return approximate size of a frozen ORM result, in bytes.
+
+    Counts the rows, and the loaded attribute values of mapped objects in them.
+    """
+    size = sys.getsizeof(frozen.data)
+    for row in frozen.data:
+        if hasattr(row, "__dict__"):  # single entity, rows are objects
+            size += _sizeof(row)
+        else:
+            size += sys.getsizeof(row) + sum(_sizeof(item) for item in row)
+    return size
+
+
+class FromCache(UserDefinedOption):
+    """ORM query option answering the query from ``cache``.
+
+    Parameters
+    ----------
+    cache : :class:`LRUCache`
+    """
+
+    payload: LRUCache
+
+    def __init__(self, cache: LRUCache) -> None:
+        super().__init__(cache)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> Result[t.Any] | None:
+    """Serve ORM selects carrying :class:`FromCache` from their cache."""
+    if not orm_execute_state.is_select:
+        return None
+    for option in orm_execute_state.user_defined_options:
+        if isinstance(option, FromCache):
+            break
+    else:
+        return None
+
+    statement = t.cast("Select[t.Any]", orm_execute_state.statement)
+    cache_key = statement._generate_cache_key()
+    if cache_key is None:
+        return None
+
+    cache = option.payload
+    key = cache_key.to_offline_string(
+        cache.statements,
+        statement,
+        t.cast("Mapping[str, t.Any]", orm_execute_state.parameters or {}),
+    )
+    frozen = cache.get(key)
+    if frozen is None:
+        frozen = orm_execute_state.invoke_statement().freeze()
+        cache.set(key, frozen, nbytes=sizeof_frozen_result(frozen))
+    merged: FrozenResult[t.Any] = merge_frozen_result(  # type: ignore[no-untyped-call]
+        orm_execute_state.session,
+        statement,
+        frozen,
+        load=False,
+    )
+    return merged()
@@ -64,6 +64,7 @@ from __future__ import annotations
 import logging
 import re
 import typing as t
+import unicodedata
 from collections.abc import Generator, Iterator
 
 log = logging.getLogger(__name__)
@@ -175,6 +176,20 @@ def ucn_to_unicode(ucn: str) -> str:
     return char
 
 
+def ucn_to_codepoint(ucn: str) -> int:
+    """Convert Unicode Universal Character Number (e.g. "U+4E00" or "4E00") to int.
+
+    Examples
+    --------
+    >>> ucn_to_codepoint("U+4E00")
+    19968
+
+    >>> ucn_to_codepoint("20000")
+    131072
+    """
+    return int(ucn.upper().removeprefix("U+"), 16)
+
+
 def euc_to_unicode(hexstr: bytes) -> str:
     r"""Return EUC-CN (GB2312) hex to a Python unicode.
 
@@ -330,3 +345,82 @@ UntaggedVars: t.TypeAlias = Iterator[t.Any]
 def parse_untagged(_vars: str) -> Iterator[t.Any]:
     """Return an iterator of chars."""
     return (char for char, _tag in parse_vars(_vars))
+
+
+#: Fields whose readings follow a dictionary location, ``loc,loc:r1,r2``
+LOCATED_READING_FIELDS = {"kHanyuPinyin", "kXHC1983"}
+
+#: Combining marks kept by :func:`normalize_reading`, the diaeresis of ``ü``
+KEPT_MARKS = {"\u0308"}
+
+
+def parse_readings(field: str, value: str) -> Iterator[str]:
+    """Return an iterator of the readings in ``value`` of UNIHAN ``field``.
+
+    Dictionary locations, frequencies and the like are dropped.
+
+    >>> list(parse_readings("kMandarin", "bǐ bì"))
+    ['bǐ', 'bì']
+    >>> list(parse_readings("kXHC1983", "0295.011:fā 0884.081:pō"))
+    ['fā', 'pō']
+    >>> list(parse_readings("kHanyuPinyin", "10019.020,10021.010:tiàn,diàn"))
+    ['tiàn', 'diàn']
+    >>> list(parse_readings("kHanyuPinlu", "xià(6430) xia(249)"))
+    ['xià', 'xia']
+    >>> list(parse_readings("kHangul", "일:0E"))
+    ['일']
+    >>> list(parse_readings("kTang", "*qiet"))
+    ['qiet']
+    """
+    for entry in value.split(" "):
+        if field in LOCATED_READING_FIELDS:
+            readings = entry.split(":", 1)[-1].split(",")
+        elif field == "kHanyuPinlu":
+            readings = [entry.split("(", 1)[0]]
+        elif field == "kHangul":
+            readings = [entry.split(":", 1)[0]]
+        else:
+            readings = [entry]
+        for reading in readings:
+            reading = reading.lstrip("*")
+            if reading:
+                yield reading
+
+
+def parse_radical_strokes(value: str) -> Iterator[tuple[int, int, int]]:
+    """Return an iterator of the radical/stroke counts of a ``kRSUnicode`` value.
+
+    Each is ``(radical, simplified, residual_strokes)``, ``simplified`` the
+    number of apostrophes marking a simplified form of the radical.
+
+    >>> list(parse_radical_strokes("85.5"))
+    [(85, 0, 5)]
+    >>> list(parse_radical_strokes("120'.3 120.6"))
+    [(120, 1, 3), (120, 0, 6)]
+    >>> list(parse_radical_strokes("4.-1"))
+    [(4, 0, -1)]
+    """
+    for entry in value.split(" "):
+        radical, _, strokes = entry.partition(".")
+        yield int(radical.rstrip("'")), radical.count("'"), int(strokes)
+
+
+def normalize_reading(reading: str) -> str:
+    """Return ``reading`` without case and tones, marked or numbered.
+
+    >>> normalize_reading("hǎo")
+    'hao'
+    >>> normalize_reading("hou2")
+    'hou'
+    >>> normalize_reading("KOU")
+    'kou'
+    >>> normalize_reading("lǘ")
+    'lü'
+    >>> normalize_reading("nộm")
+    'nom'
+    """
+    decomposed = unicodedata.normalize("NFD", reading.lower())
+    stripped = "".join(
+        c for c in decomposed if not unicodedata.combining(c) or c in KEPT_MARKS
+    )
+    return unicodedata.normalize("NFC", stripped).rstrip("0123456789")
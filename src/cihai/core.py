@@ -5,6 +5,7 @@ from __future__ import annotations
 import inspect
 import logging
 import pathlib
+import threading
 import typing as t
 
 from cihai._internal.config_reader import ConfigReader
@@ -67,6 +68,12 @@ class Cihai:
 
     :attr:`~cihai.data.unihan.dataset.Unihan.is_bootstrapped` can check
     if the system has the database installed.
+
+    **Lazy construction**
+
+    With ``lazy=True``, the database (:attr:`sql`) is connected and reflected,
+    and each dataset imported and added with its plugins, on first access.
+    Until then, constructing :class:`Cihai` only reads the configuration.
     """
 
     #: :py:class:`dict` of default config, can be monkey-patched during tests
@@ -79,6 +86,7 @@ class Cihai:
         self,
         config: dict[str, object] | None = None,
         unihan: bool = True,
+        lazy: bool = False,
     ) -> None:
         """Initialize Cihai application.
 
@@ -87,6 +95,8 @@ class Cihai:
         config : dict | None
         unihan : bool
             Bootstrap the core UNIHAN dataset (recommended)
+        lazy : bool
+            Defer the database and datasets to their first access
         """
         config_: dict[str, object] = config if config is not None else {}
         if config is None:
@@ -107,6 +117,24 @@ class Cihai:
 
         self.config = config_
 
+        #: Namespaces of configured datasets not added yet, see :meth:`__getattr__`
+        self._pending_datasets: set[str] = set()
+        self._lock = threading.RLock()
+
+        if lazy:
+            self._pending_datasets.update(self.config.get("datasets", {}))
+        else:
+            self.connect()
+            self.bootstrap()
+
+    def connect(self) -> Database:
+        """Create the user data directory and connect :attr:`sql`.
+
+        Returns
+        -------
+        :class:`cihai.db.Database` :
+            database of this instance
+        """
         user_data_dir = pathlib.Path(app_dirs.user_data_dir)
 
         if not user_data_dir.exists():
@@ -114,48 +142,106 @@ class Cihai:
 
         #: :class:`cihai.db.Database` : Database instance
         self.sql = Database(self.config)
+        return self.sql
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Connect :attr:`sql` or add a pending dataset on first access.
 
-        self.bootstrap()
+        Only called for attributes not set yet, as in a ``lazy`` instance.
+
+        Raises
+        ------
+        AttributeError
+            if ``name`` is neither :attr:`sql` nor a pending dataset
+        """
+        pending = self.__dict__.get("_pending_datasets")
+        lock = self.__dict__.get("_lock")
+        if pending is not None and lock is not None:
+            with lock:
+                # another thread may have added it while this one waited
+                if name in self.__dict__:
+                    return self.__dict__[name]
+                if name == "sql":
+                    return self.connect()
+                if name in pending:
+                    self.add_configured_dataset(name)
+                    return self.__dict__[name]
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
 
     def bootstrap(self) -> None:
         """Initialize Cihai."""
-        for namespace, class_string in self.config.get("datasets", {}).items():
+        with self._lock:
+            for namespace in self.config.get("datasets", {}):
+                assert isinstance(namespace, str)
+                self.add_configured_dataset(namespace, plugins=False)
+
+            for dataset, plugins in self.config.get("plugins", {}).items():
+                assert isinstance(dataset, str)
+                assert isinstance(plugins, dict)
+                self.add_plugins(dataset, plugins)
+
+    def add_configured_dataset(self, namespace: str, plugins: bool = True) -> None:
+        """Add dataset ``namespace`` of the config, with its plugins if ``plugins``.
+
+        The dataset is set on this instance once complete, so other threads of
+        a ``lazy`` instance never see it without :attr:`sql` or plugins.
+        """
+        class_string = self.config["datasets"][namespace]
+        assert isinstance(class_string, str) or (
+            inspect.isclass(class_string)
+            and (
+                issubclass(class_string, extend.Dataset)
+                or class_string == extend.Dataset
+            )
+        )
+        with self._lock:
+            dataset = self._create_dataset(class_string, namespace)
+            if plugins:
+                configured = self.config.get("plugins", {}).get(namespace, {})
+                assert isinstance(configured, dict)
+                self._add_plugins(dataset, configured)
+            setattr(self, namespace, dataset)
+            self._pending_datasets.discard(namespace)
+
+    def add_plugins(self, dataset: str, plugins: dict[str, t.Any]) -> None:
+        """Add ``plugins``, by namespace, to ``dataset``."""
+        self._add_plugins(getattr(self, dataset), plugins)
+
+    def _add_plugins(self, dataset: extend.Dataset, plugins: dict[str, t.Any]) -> None:
+        """Add ``plugins``, by namespace, to the ``dataset`` instance."""
+        for namespace, class_string in plugins.items():
+            assert isinstance(namespace, str)
             assert isinstance(class_string, str) or (
                 inspect.isclass(class_string)
                 and (
-                    issubclass(class_string, extend.Dataset)
-                    or class_string == extend.Dataset
+                    issubclass(class_string, extend.DatasetPlugin)
+                    or class_string == extend.DatasetPlugin
                 )
             )
-            assert isinstance(namespace, str)
-            self.add_dataset(class_string, namespace)
-
-        for dataset, plugins in self.config.get("plugins", {}).items():
-            assert isinstance(dataset, str)
-            assert isinstance(plugins, dict)
-            for namespace, class_string in plugins.items():
-                assert isinstance(namespace, str)
-                assert isinstance(class_string, str) or (
-                    inspect.isclass(class_string)
-                    and (
-                        issubclass(class_string, extend.DatasetPlugin)
-                        or class_string == extend.DatasetPlugin
-                    )
-                )
-                getattr(self, dataset).add_plugin(class_string, namespace)
+            dataset.add_plugin(class_string, namespace)
 
     def add_dataset(self, cls: type[extend.Dataset] | str, namespace: str) -> None:
         """Add dataset to Cihai."""
+        setattr(self, namespace, self._create_dataset(cls, namespace))
+
+    def _create_dataset(
+        self,
+        cls: type[extend.Dataset] | str,
+        namespace: str,
+    ) -> extend.Dataset:
+        """Return dataset ``cls`` connected to :attr:`sql`, not added yet."""
         if isinstance(cls, str):
             cls = import_string(cls)
 
         assert callable(cls)
 
-        setattr(self, namespace, cls())
-        dataset = getattr(self, namespace)
+        dataset = cls()
 
         if isinstance(dataset, extend.SQLAlchemyMixin):
             dataset.sql = self.sql
+            dataset.cache = self.sql.cache(namespace)
+        return dataset
 
     @classmethod
     def from_file(
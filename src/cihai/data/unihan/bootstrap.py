@@ -2,70 +2,878 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import contextlib
 import dataclasses
+import hashlib
+import itertools
+import logging
+import pathlib
 import typing as t
 
 import sqlalchemy
 import sqlalchemy.sql.schema
-from sqlalchemy import Column, String, Table
-from sqlalchemy.engine import Engine
+from sqlalchemy import BigInteger, Column, Integer, String, Table, Text, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection, Engine
 
+from cihai.conversion import (
+    normalize_reading,
+    parse_radical_strokes,
+    parse_readings,
+    parse_vars,
+    ucn_to_codepoint,
+)
 from unihan_etl import core as unihan
-from unihan_etl.constants import UNIHAN_MANIFEST
+from unihan_etl.constants import INDEX_FIELDS, UNIHAN_MANIFEST
 from unihan_etl.util import merge_dict
 
-from .constants import UNIHAN_ETL_DEFAULT_OPTIONS, UNIHAN_FIELDS
+from .checkpoint import BootstrapCheckpoint, file_sha256
+from .constants import (
+    BOOTSTRAP_CHUNK_SIZE,
+    BOOTSTRAP_SHARD_SIZE,
+    UNIHAN_ETL_DEFAULT_OPTIONS,
+    UNIHAN_FIELDS,
+    UNIHAN_INDEXES,
+    UNIHAN_READING_FIELDS,
+    UNIHAN_VARIANT_FIELDS,
+)
+from .instrument import BootstrapRecorder, LoggingBootstrapHooks
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from sqlalchemy.engine.interfaces import DBAPIConnection
+
     from unihan_etl.options import Options as UnihanOptions
 
+    from .instrument import BootstrapHooks, BootstrapReport, PhaseProgress
+
+
+log = logging.getLogger(__name__)
+
 
 def bootstrap_unihan(
     engine: Engine,
     metadata: sqlalchemy.sql.schema.MetaData,
     options: dict[str, object] | UnihanOptions | None = None,
-) -> None:
-    """UNIHAN bootstrap script (download from web, import to database)."""
-    if options is None:
-        options = {}
+    fts: bool = False,
+    indexes: Iterable[str] = UNIHAN_INDEXES,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+    update: bool = False,
+    workers: int = 1,
+    bulk_load: bool = False,
+    snapshot: str | pathlib.Path | None = None,
+    hooks: BootstrapHooks | None = None,
+    checkpoint_dir: str | pathlib.Path | None = None,
+) -> BootstrapReport:
+    """UNIHAN bootstrap script (download from web, import to database).
 
-    """Download, extract and import unihan to database."""
-    options = merge_dict(
-        UNIHAN_ETL_DEFAULT_OPTIONS.copy(),
-        options if isinstance(options, dict) else dataclasses.asdict(options),
-    )
+    If the UNIHAN table is already imported, or installed from ``snapshot``, the
+    columns and indexes it is missing are added. Its rows are only refreshed
+    with ``update``, in place, see :func:`load_unihan`.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+    options : dict | :class:`unihan_etl.options.Options` | None
+        unihan-etl options, merged over
+        :data:`~cihai.data.unihan.constants.UNIHAN_ETL_DEFAULT_OPTIONS`
+    fts : bool
+        Also build the full-text index used by
+        :meth:`~cihai.data.unihan.dataset.Unihan.reverse_char`, see
+        :func:`create_unihan_fts`.
+    indexes : Iterable[str]
+        columns to index, see :func:`create_unihan_indexes`
+    chunk_size : int
+        values inserted per round trip, see :func:`load_unihan`
+    update : bool
+        download UNIHAN again and apply what changed to an imported table
+    workers : int
+        processes parsing the UNIHAN files, see :func:`iter_unihan_values`
+    bulk_load : bool
+        build the new UNIHAN table under :func:`bulk_load_profile`, faster but
+        unsafe: a crash mid-build can corrupt the whole database file, other
+        datasets' tables included. Only for databases that can be rebuilt.
+        Updates, upgrades and publishing keep the database's journal.
+    snapshot : str | pathlib.Path | None
+        install this snapshot in place of downloading and parsing UNIHAN, if
+        not imported yet, see :mod:`cihai.data.unihan.snapshot`
+    hooks : :class:`~cihai.data.unihan.instrument.BootstrapHooks` | None
+        receive each phase of the bootstrap and its progress,
+        :class:`~cihai.data.unihan.instrument.LoggingBootstrapHooks` if None
+    checkpoint_dir : str | pathlib.Path | None
+        record the steps completed here, and resume an interrupted bootstrap
+        from them, see :mod:`cihai.data.unihan.checkpoint`
+
+    Returns
+    -------
+    :class:`~cihai.data.unihan.instrument.BootstrapReport` :
+        rows the import changed, and time taken by each phase
+    """
+    recorder = BootstrapRecorder(LoggingBootstrapHooks() if hooks is None else hooks)
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = BootstrapCheckpoint.for_database(
+            pathlib.Path(checkpoint_dir),
+            engine,
+        )
+    delta = None
+    if snapshot is not None and TABLE_NAME not in metadata.tables:
+        from .snapshot import install_unihan_snapshot
 
-    unihan_pkgr = unihan.Packager(options)
-    unihan_pkgr.download()
-    data = unihan_pkgr.export()
-    table = create_unihan_table(UNIHAN_FIELDS, metadata)
+        with recorder.phase("snapshot") as progress:
+            manifest = install_unihan_snapshot(engine, snapshot)
+            metadata.reflect(engine)
+            progress.advance(
+                rows=manifest.rows,
+                bytes_read=pathlib.Path(snapshot).stat().st_size,
+            )
+        delta = UnihanDelta(manifest.unihan_version, manifest.rows, 0, 0, 0)
+        log.info("Installed UNIHAN %s snapshot", manifest.unihan_version)
 
-    metadata.create_all(engine)
-    with engine.connect() as conn:
-        conn.execute(sqlalchemy.insert(table), data)
-        conn.commit()
+    upgraded = built = False
+    if TABLE_NAME in metadata.tables:
+        log.info("UNIHAN already imported, upgrading its schema")
+        with recorder.phase("upgrade"):
+            upgraded |= add_unihan_codepoints(
+                engine,
+                metadata,
+                chunk_size=chunk_size,
+            )
+            upgraded |= add_unihan_hashes(engine, metadata, chunk_size=chunk_size)
+            upgraded |= add_unihan_numerics(
+                engine,
+                metadata,
+                chunk_size=chunk_size,
+            )
+            upgraded |= add_unihan_variants(
+                engine,
+                metadata,
+                chunk_size=chunk_size,
+            )
+            upgraded |= add_unihan_readings(
+                engine,
+                metadata,
+                chunk_size=chunk_size,
+            )
+            upgraded |= add_unihan_radicals(
+                engine,
+                metadata,
+                chunk_size=chunk_size,
+            )
+
+    if TABLE_NAME not in metadata.tables or update:
+        if options is None:
+            options = {}
+
+        """Download, extract and import unihan to database."""
+        options = merge_dict(
+            UNIHAN_ETL_DEFAULT_OPTIONS.copy(),
+            options if isinstance(options, dict) else dataclasses.asdict(options),
+        )
+
+        unihan_pkgr = unihan.Packager(options)
+        files = download_unihan(
+            unihan_pkgr.options,
+            recorder,
+            checkpoint,
+            refresh=update,
+        )
+        fields = list(unihan_pkgr.options.fields)
+
+        if TABLE_NAME in metadata.tables:
+            with recorder.phase("create"):
+                meta = create_unihan_meta_table(metadata)
+                meta.create(engine, checkfirst=True)
+                variants = create_unihan_variant_table(metadata)
+                variants.create(engine, checkfirst=True)
+                readings = create_unihan_reading_table(metadata)
+                readings.create(engine, checkfirst=True)
+                radicals = create_unihan_radical_table(metadata)
+                radicals.create(engine, checkfirst=True)
+            with engine.begin() as conn:
+                delta = load_unihan(
+                    conn,
+                    metadata.tables[TABLE_NAME],
+                    files=files,
+                    fields=fields,
+                    chunk_size=chunk_size,
+                    workers=workers,
+                    recorder=recorder,
+                )
+                with recorder.phase("publish") as progress:
+                    progress.advance(rows=load_unihan_variants(conn, variants))
+                    progress.advance(rows=load_unihan_readings(conn, readings))
+                    progress.advance(rows=load_unihan_radicals(conn, radicals))
+                    analyze_unihan(conn)
+                    set_unihan_meta(conn, meta, "version", delta.version)
+                    bump_unihan_generation(conn, meta)
+        else:
+            profile = (
+                bulk_load_profile(engine)
+                if bulk_load
+                else contextlib.nullcontext(engine)
+            )
+            with profile as build_engine:
+                delta = build_unihan(
+                    build_engine,
+                    files=files,
+                    fields=fields,
+                    indexes=indexes,
+                    chunk_size=chunk_size,
+                    workers=workers,
+                    recorder=recorder,
+                    checkpoint=checkpoint,
+                )
+            with recorder.phase("publish") as progress:
+                publish_unihan(engine, metadata, delta.version, progress=progress)
+            built = True
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    # indexing once after the import is cheaper than on every insert
+    if not built:  # built tables are published indexed
+        with recorder.phase("index"):
+            upgraded |= bool(create_unihan_indexes(engine, metadata, indexes))
+
+    if fts:
+        with recorder.phase("fts"):
+            upgraded |= create_unihan_fts(engine, metadata)
+
+    if upgraded:
+        meta = create_unihan_meta_table(metadata)
+        meta.create(engine, checkfirst=True)
+        with engine.begin() as conn:
+            bump_unihan_generation(conn, meta)
+    return recorder.report(delta)
+
+
+def download_unihan(
+    options: UnihanOptions,
+    recorder: BootstrapRecorder | None = None,
+    checkpoint: BootstrapCheckpoint | None = None,
+    refresh: bool = False,
+) -> list[pathlib.Path]:
+    """Download and extract the UNIHAN zip, unless already done.
+
+    Steps of :meth:`unihan_etl.core.Packager.download`, timed as the
+    ``download`` and ``extract`` phases of ``recorder``.
+
+    With a ``checkpoint``, it is started for the archive's checksum, and
+    files are extracted again unless the sizes recorded after extracting them
+    last time match. Without, files are only extracted if missing.
+
+    Parameters
+    ----------
+    options : :class:`unihan_etl.options.Options`
+        unihan-etl options
+    recorder : :class:`~cihai.data.unihan.instrument.BootstrapRecorder` | None
+        records the phases
+    checkpoint : :class:`~cihai.data.unihan.checkpoint.BootstrapCheckpoint` | None
+        steps of the bootstrap done, and to record
+    refresh : bool
+        download and extract the zip again even if cached, to pick up a new
+        release
+
+    Returns
+    -------
+    list[pathlib.Path] :
+        extracted UNIHAN ``.txt`` files
+    """
+    if recorder is None:
+        recorder = BootstrapRecorder()
+    zip_path = pathlib.Path(options.zip_path)
+    downloaded = refresh or not unihan.has_valid_zip(zip_path) or not options.cache
+    if downloaded:
+        with recorder.phase("download") as progress:
+            unihan.download(
+                url=options.source,
+                dest=zip_path,
+                reporthook=progress.reporthook,
+                cache=options.cache and not refresh,
+            )
+            progress.bytes_read = zip_path.stat().st_size
+
+    work_dir = pathlib.Path(options.work_dir)
+    files = [work_dir / f for f in options.input_files]
+    if checkpoint is None:
+        extract = not unihan.files_exist(work_dir, options.input_files)
+    else:
+        checkpoint.start(
+            archive=file_sha256(zip_path),
+            fields=sorted(options.fields),
+            schema_version=SCHEMA_VERSION,
+        )
+        extract = checkpoint.get("extract") != {
+            f.name: f.stat().st_size for f in files if f.exists()
+        }
+    if extract or downloaded:
+        with recorder.phase("extract") as progress:
+            unihan.extract_zip(zip_path, work_dir)
+            progress.advance(bytes_read=zip_path.stat().st_size)
+        if checkpoint is not None:
+            checkpoint.mark("extract", {f.name: f.stat().st_size for f in files})
+    return files
 
 
 TABLE_NAME = "Unihan"
 
+#: Name of the SQLite FTS5 table indexing every column of :data:`TABLE_NAME` by
+#: trigram, for substring matches
+FTS_TABLE_NAME = "Unihan_fts"
+
+#: Name of the SQLite FTS5 table indexing every column of :data:`TABLE_NAME` by
+#: word, for token and prefix matches
+FTS_TOKENS_TABLE_NAME = "Unihan_fts_tokens"
+
+#: FTS5 tokenizer of each full-text table. Diacritics are kept so ``hao`` does
+#: not match ``hǎo``.
+FTS_TOKENIZERS = {
+    FTS_TABLE_NAME: "trigram",
+    FTS_TOKENS_TABLE_NAME: "unicode61 remove_diacritics 0",
+}
+
+#: Shortest string the FTS5 ``trigram`` tokenizer can match
+FTS_MIN_HINT_LENGTH = 3
+
+
+#: Version of the layout of the UNIHAN tables bootstrap creates, bumped when it
+#: changes. Snapshots record it, see :mod:`cihai.data.unihan.snapshot`.
+SCHEMA_VERSION = 1
+
+#: Name of the table :func:`build_unihan` imports into, renamed to
+#: :data:`TABLE_NAME` once complete by :func:`publish_unihan`
+BUILD_TABLE_NAME = "Unihan_build"
+
+#: Name of the table UNIHAN values are staged in before they are pivoted into
+#: rows, see :func:`create_unihan_staging_table`
+STAGING_TABLE_NAME = f"{TABLE_NAME}_staging"
+
+#: Name of the staging table of :func:`build_unihan`, kept across runs so
+#: interrupted builds resume, see :mod:`cihai.data.unihan.checkpoint`
+BUILD_STAGING_TABLE_NAME = f"{BUILD_TABLE_NAME}_staging"
+
+#: Name of the key-value table holding the ``version`` of UNIHAN imported, and
+#: its ``generation``
+META_TABLE_NAME = "Unihan_meta"
+
+#: Name of the table holding one row per variant of a character, see
+#: :func:`create_unihan_variant_table`
+VARIANT_TABLE_NAME = "Unihan_variant"
+
+#: Name of the table holding one row per reading of a character, see
+#: :func:`create_unihan_reading_table`
+READING_TABLE_NAME = "Unihan_reading"
+
+#: Name of the table holding one row per radical/stroke count of a character,
+#: see :func:`create_unihan_radical_table`
+RADICAL_TABLE_NAME = "Unihan_radical"
 
-DEFAULT_COLUMNS = ["ucn", "char"]
+#: Tables filled from UNIHAN fields in the transaction changing UNIHAN
+DERIVED_TABLE_NAMES = (VARIANT_TABLE_NAME, READING_TABLE_NAME, RADICAL_TABLE_NAME)
+
+#: :data:`META_TABLE_NAME` key of the counter bootstrap increments on each
+#: change it commits, see :func:`get_unihan_generation`
+GENERATION_KEY = "generation"
+
+#: Integer code point of each row's ``char``, for range scans and ordering
+CODEPOINT_COLUMN = "codepoint"
+
+#: :func:`content_hash` of each row's fields, compared by :func:`load_unihan` to
+#: find the rows a new UNIHAN release changes
+HASH_COLUMN = "content_hash"
+
+#: Integer columns holding the :func:`numeric_value` of a field, for range
+#: scans, by column
+NUMERIC_COLUMNS: dict[str, str] = {
+    "total_strokes": "kTotalStrokes",
+    "primary_numeric": "kPrimaryNumeric",
+    "accounting_numeric": "kAccountingNumeric",
+    "other_numeric": "kOtherNumeric",
+    "grade_level": "kGradeLevel",
+}
+
+DEFAULT_COLUMNS = ["ucn", "char", CODEPOINT_COLUMN, HASH_COLUMN, *NUMERIC_COLUMNS]
 DEFAULT_FIELDS = [f for c, f in UNIHAN_MANIFEST.items() if c == "Unihan"]
 
 
-def is_bootstrapped(metadata: sqlalchemy.sql.schema.MetaData) -> bool:
-    """Return True if cihai is correctly bootstrapped."""
+def build_unihan(
+    engine: Engine,
+    files: Sequence[pathlib.Path],
+    fields: Sequence[str],
+    indexes: Iterable[str] = UNIHAN_INDEXES,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+    workers: int = 1,
+    recorder: BootstrapRecorder | None = None,
+    checkpoint: BootstrapCheckpoint | None = None,
+    shard_size: int = BOOTSTRAP_SHARD_SIZE,
+) -> UnihanDelta:
+    """Import UNIHAN into :data:`BUILD_TABLE_NAME`, ready for :func:`publish_unihan`.
+
+    The table is built and indexed out of sight of lookups, which
+    only read :data:`TABLE_NAME`. Values are staged in
+    :data:`BUILD_STAGING_TABLE_NAME` one shard per transaction, see
+    :func:`unihan_shards`, then pivoted into the table in one.
+
+    With a ``checkpoint``, the tables of an interrupted build are kept, and
+    the shards, pivot and indexes it completed are skipped. Otherwise, they
+    are dropped first.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files
+    fields : Sequence[str]
+        fields to import
+    indexes : Iterable[str]
+        columns to index, see :func:`create_unihan_indexes`
+    chunk_size : int
+        values inserted per round trip, see :func:`stage_unihan`
+    workers : int
+        processes parsing the UNIHAN files, see :func:`iter_parsed_shards`
+    recorder : :class:`~cihai.data.unihan.instrument.BootstrapRecorder` | None
+        records the ``create``, ``parse``, ``insert`` and ``index`` phases
+    checkpoint : :class:`~cihai.data.unihan.checkpoint.BootstrapCheckpoint` | None
+        steps of the build done, and to record
+    shard_size : int
+        bytes of UNIHAN files staged per transaction
+
+    Returns
+    -------
+    :class:`UnihanDelta`
+    """
+    if recorder is None:
+        recorder = BootstrapRecorder()
+    metadata = sqlalchemy.MetaData()
+    table = create_unihan_table(UNIHAN_FIELDS, metadata, name=BUILD_TABLE_NAME)
+    staging = create_unihan_staging_table(
+        metadata,
+        name=BUILD_STAGING_TABLE_NAME,
+        temporary=False,
+    )
+
+    inspector = sqlalchemy.inspect(engine)
+    resumed = (
+        checkpoint is not None
+        and checkpoint.done("create")
+        and inspector.has_table(table.name)
+        and (checkpoint.done("insert") or inspector.has_table(staging.name))
+    )
+    if not resumed:
+        with recorder.phase("create"):
+            metadata.drop_all(engine, checkfirst=True)
+            metadata.create_all(engine)
+        if checkpoint is not None:
+            checkpoint.forget("create", "insert", "index")
+            checkpoint.mark("create")
+
+    delta = None if checkpoint is None else checkpoint.get("insert")
+    if delta is None:
+        shards = unihan_shards(files, shard_size)
+        if checkpoint is not None:
+            shards = checkpoint.pending(shards)
+        with recorder.phase("parse") as progress:
+            staged = [f for f in fields if f not in INDEX_FIELDS]
+            for shard, values in iter_parsed_shards(shards, staged, workers):
+                # a shard staged again, if interrupted before its checkpoint is
+                # saved, only duplicates values, which the pivot folds together
+                with engine.begin() as conn:
+                    stage_unihan(conn, staging, values, chunk_size, progress)
+                progress.advance(bytes_read=shard[2] - shard[1])
+                if checkpoint is not None:
+                    checkpoint.add_shard(shard)
+        log.info("Staged %d UNIHAN values into %s", progress.rows, staging.name)
+
+        with engine.begin() as conn:
+            begin_ddl(conn)
+            delta = apply_unihan(
+                conn,
+                table,
+                staging,
+                files=files,
+                fields=fields,
+                chunk_size=chunk_size,
+                recorder=recorder,
+            )
+        if checkpoint is not None:
+            checkpoint.mark("insert", delta._asdict())
+    else:
+        delta = UnihanDelta(**delta)
+        log.info("Resuming UNIHAN build, %s already filled", table.name)
+
+    if checkpoint is None or not checkpoint.done("index"):
+        with recorder.phase("index") as progress:
+            create_unihan_indexes(engine, metadata, indexes, table_name=table.name)
+            progress.advance(rows=delta.inserted)
+        if checkpoint is not None:
+            checkpoint.mark("index")
+    return delta
+
+
+def publish_unihan(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    version: str | None,
+    progress: PhaseProgress | None = None,
+) -> int:
+    """Rename :data:`BUILD_TABLE_NAME` to :data:`TABLE_NAME`, atomically.
+
+    The rename, the :data:`DERIVED_TABLE_NAMES` tables, planner statistics,
+    the ``version`` and the bumped generation are committed together, so
+    lookups in other connections see no UNIHAN table, then all of it. See
+    :func:`get_unihan_generation`. Run it on connections keeping the
+    journal, not under :func:`bulk_load_profile`, so a crash rolls it back.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, the published tables are reflected
+        into it
+    version : str | None
+        Unicode version of the UNIHAN built
+    progress : :class:`~cihai.data.unihan.instrument.PhaseProgress` | None
+        advanced by the rows loaded into the :data:`DERIVED_TABLE_NAMES` tables
+
+    Returns
+    -------
+    int :
+        generation published
+    """
+    meta = create_unihan_meta_table(metadata)
+    meta.create(engine, checkfirst=True)
+    variants = create_unihan_variant_table(metadata)
+    variants.create(engine, checkfirst=True)
+    readings = create_unihan_reading_table(metadata)
+    readings.create(engine, checkfirst=True)
+    radicals = create_unihan_radical_table(metadata)
+    radicals.create(engine, checkfirst=True)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        begin_ddl(conn)
+        conn.exec_driver_sql(
+            f"ALTER TABLE {quote(BUILD_TABLE_NAME)} RENAME TO {quote(TABLE_NAME)}",
+        )
+        rows = load_unihan_variants(conn, variants)
+        rows += load_unihan_readings(conn, readings)
+        rows += load_unihan_radicals(conn, radicals)
+        if progress is not None:
+            progress.advance(rows=rows)
+        analyze_unihan(conn)
+        set_unihan_meta(conn, meta, "version", version)
+        generation = bump_unihan_generation(conn, meta)
+    metadata.reflect(bind=engine, only=[TABLE_NAME], extend_existing=True)
+    log.info("Published UNIHAN %s, generation %d", version, generation)
+    return generation
+
+
+def begin_ddl(conn: Connection) -> None:
+    """Open the transaction of ``conn`` now, so it covers DDL statements too.
+
+    pysqlite only begins a transaction ahead of ``INSERT``, ``UPDATE`` and
+    ``DELETE``, so an ``ALTER`` or ``CREATE`` run before them commits by
+    itself. Other drivers need nothing done.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+        connection in a transaction that has run no statement yet
+    """
+    if conn.dialect.name == "sqlite" and conn.dialect.driver == "pysqlite":
+        conn.exec_driver_sql("BEGIN")
+
+
+def set_unihan_meta(
+    conn: Connection,
+    meta: Table,
+    key: str,
+    value: str | None,
+) -> None:
+    """Set ``key`` of the :data:`META_TABLE_NAME` table to ``value``."""
+    conn.execute(sqlalchemy.delete(meta).where(meta.c.key == key))
+    conn.execute(sqlalchemy.insert(meta).values(key=key, value=value))
+
+
+def bump_unihan_generation(conn: Connection, meta: Table) -> int:
+    """Increment the UNIHAN generation, return it.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+        connection in the transaction changing UNIHAN
+    meta : :class:`sqlalchemy.schema.Table`
+        :data:`META_TABLE_NAME` table
+
+    Returns
+    -------
+    int
+    """
+    current = conn.execute(
+        sqlalchemy.select(meta.c.value).where(meta.c.key == GENERATION_KEY),
+    ).scalar()
+    generation = int(current or 0) + 1
+    set_unihan_meta(conn, meta, GENERATION_KEY, str(generation))
+    return generation
+
+
+def get_unihan_generation(engine: Engine) -> int:
+    """Return the UNIHAN generation, bumped by each change bootstrap commits.
+
+    A single-row read, cheap enough to poll. Compare it with the generation
+    seen last to tell whether to reflect the database again.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+
+    Returns
+    -------
+    int :
+        0 if UNIHAN was never published
+    """
+    meta = sqlalchemy.table(
+        META_TABLE_NAME,
+        sqlalchemy.column("key"),
+        sqlalchemy.column("value"),
+    )
+    try:
+        with engine.connect() as conn:
+            value = conn.execute(
+                sqlalchemy.select(meta.c.value).where(meta.c.key == GENERATION_KEY),
+            ).scalar()
+    except (sqlalchemy.exc.OperationalError, sqlalchemy.exc.ProgrammingError):
+        return 0  # no meta table
+    return int(value or 0)
+
+
+#: PRAGMAs :func:`bulk_load_profile` sets on SQLite connections. Without a
+#: journal on disk, a crash mid-transaction can corrupt the whole database
+#: file, every table in it included, so they are opt-in, and only for
+#: building :data:`BUILD_TABLE_NAME` and its staging table.
+SQLITE_BULK_LOAD_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": "-65536",  # KiB
+}
+
+
+#: Key of the connection record ``info`` of connections under the bulk profile
+BULK_LOAD_INFO_KEY = "cihai_bulk_load_saved"
+
+
+@contextlib.contextmanager
+def bulk_load_profile(engine: Engine) -> Iterator[Engine]:
+    """Yield engine trading durability for speed, for building UNIHAN only.
+
+    A crash while writing through it can corrupt the whole database file,
+    not just the tables written, so use it only on databases that can be
+    rebuilt from scratch.
+
+    On SQLite, :data:`SQLITE_BULK_LOAD_PRAGMAS` are set on each connection of
+    the engine yielded, and the database's own settings put back as it
+    returns to the pool. Connections of ``engine`` itself, e.g. of other
+    threads, are unaffected. Other databases get ``engine`` as it is.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+
+    Yields
+    ------
+    :class:`sqlalchemy.engine.Engine` :
+        sharing the pool of ``engine``
+    """
+    if engine.dialect.name != "sqlite":
+        yield engine
+        return
+
+    bulk = engine.execution_options()
+
+    def set_pragmas(cursor: t.Any, values: dict[str, t.Any]) -> None:
+        for pragma, value in values.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+
+    def on_connect(conn: Connection) -> None:
+        info = conn.info
+        if BULK_LOAD_INFO_KEY in info:
+            return
+        dbapi_connection = conn.connection.dbapi_connection
+        assert dbapi_connection is not None
+        cursor = dbapi_connection.cursor()
+        info[BULK_LOAD_INFO_KEY] = {
+            pragma: cursor.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in SQLITE_BULK_LOAD_PRAGMAS
+        }
+        set_pragmas(cursor, SQLITE_BULK_LOAD_PRAGMAS)
+        cursor.close()
+
+    def on_checkin(
+        dbapi_connection: DBAPIConnection | None,
+        connection_record: t.Any,
+    ) -> None:
+        saved = connection_record.info.pop(BULK_LOAD_INFO_KEY, None)
+        if saved is None or dbapi_connection is None:
+            return
+        cursor = dbapi_connection.cursor()
+        set_pragmas(cursor, saved)
+        cursor.close()
+
+    event.listen(bulk, "engine_connect", on_connect)
+    event.listen(engine.pool, "checkin", on_checkin)
+    try:
+        yield bulk
+    finally:
+        event.remove(engine.pool, "checkin", on_checkin)
+
+
+def analyze_unihan(
+    conn: Connection,
+    tables: Iterable[str] = (TABLE_NAME, *DERIVED_TABLE_NAMES),
+) -> None:
+    """Gather the statistics the query planner uses on the UNIHAN tables.
+
+    Run after an import, once its indexes exist.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    tables : Iterable[str]
+        tables analyzed
+    """
+    if conn.dialect.name not in {"sqlite", "postgresql"}:
+        return
+    quote = conn.dialect.identifier_preparer.quote
+    for table in tables:
+        conn.exec_driver_sql(f"ANALYZE {quote(table)}")
+
+
+class UnihanDelta(t.NamedTuple):
+    """Rows of the UNIHAN table changed by an import, see :func:`load_unihan`."""
+
+    #: Unicode version of the UNIHAN files imported, None if they do not say
+    version: str | None
+    #: Characters new to the table
+    inserted: int
+    #: Characters whose values changed
+    updated: int
+    #: Characters no longer in UNIHAN
+    deleted: int
+    #: Characters left as they were
+    unchanged: int
+
+
+def is_bootstrapped(
+    metadata: sqlalchemy.sql.schema.MetaData,
+    indexes: Iterable[str] = UNIHAN_INDEXES,
+) -> bool:
+    """Return True if cihai is correctly bootstrapped.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        reflected metadata of the database
+    indexes : Iterable[str]
+        columns whose :func:`create_unihan_indexes` index must exist
+    """
     fields = UNIHAN_FIELDS + DEFAULT_COLUMNS
     if TABLE_NAME in metadata.tables:
         table = metadata.tables[TABLE_NAME]
+        if set(fields) != {c.name for c in table.columns}:
+            return False
 
-        return set(fields) == {c.name for c in table.columns}
+        names = {index.name for index in table.indexes}
+        return all(index_name(column) in names for column in indexes)
     return False
 
 
+def index_name(column: str) -> str:
+    """Return name of the index :func:`create_unihan_indexes` gives ``column``.
+
+    >>> index_name("kMandarin")
+    'ix_Unihan_kMandarin'
+    """
+    return f"ix_{TABLE_NAME}_{column}"
+
+
+def unihan_index(table: Table, column: str) -> sqlalchemy.Index:
+    """Return index of a UNIHAN table column.
+
+    :data:`DEFAULT_COLUMNS` get a plain index. Fields and
+    :data:`NUMERIC_COLUMNS` are mostly empty, so they get a partial index over
+    the rows holding a value, which also answers ``IS NOT NULL`` filters and
+    range comparisons.
+
+    Parameters
+    ----------
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table
+    column : str
+        column to index
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Index`
+    """
+    col = table.c[column]
+    if column in DEFAULT_COLUMNS and column not in NUMERIC_COLUMNS:
+        return sqlalchemy.Index(index_name(column), col)
+    return sqlalchemy.Index(
+        index_name(column),
+        col,
+        sqlite_where=col.isnot(None),
+        postgresql_where=col.isnot(None),
+    )
+
+
+def create_unihan_indexes(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    indexes: Iterable[str] = UNIHAN_INDEXES,
+    table_name: str = TABLE_NAME,
+) -> list[str]:
+    """Create the indexes of UNIHAN table columns missing from the database.
+
+    Adds indexes to a database bootstrapped without them, no re-import needed.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, holding the UNIHAN table
+    indexes : Iterable[str]
+        columns to index, see :func:`unihan_index`
+    table_name : str
+        UNIHAN table to index, e.g. :data:`BUILD_TABLE_NAME`
+
+    Returns
+    -------
+    list[str] :
+        names of the indexes created
+    """
+    table = metadata.tables[table_name]
+    created: list[str] = []
+    with engine.begin() as conn:
+        existing = {
+            index["name"] for index in sqlalchemy.inspect(conn).get_indexes(table_name)
+        }
+        for column in indexes:
+            if index_name(column) in existing:
+                continue
+            unihan_index(table, column).create(conn)
+            created.append(index_name(column))
+    if created:
+        log.info("Created UNIHAN indexes: %s", ", ".join(created))
+    return created
+
+
 def create_unihan_table(
     columns: list[str],
     metadata: sqlalchemy.sql.schema.MetaData,
+    name: str = TABLE_NAME,
 ) -> sqlalchemy.sql.schema.Table:
     """Create table and return :class:`sqlalchemy.sql.schema.Table`.
 
@@ -75,21 +883,1466 @@ def create_unihan_table(
         columns for table, e.g. ``['kDefinition', 'kCantonese']``
     metadata : :class:`sqlalchemy.schema.MetaData`
         Instance of sqlalchemy metadata
+    name : str
+        table name, e.g. :data:`BUILD_TABLE_NAME`
 
     Returns
     -------
     :class:`sqlalchemy.schema.Table` :
         Newly created table with columns and index.
     """
-    if TABLE_NAME not in metadata.tables:
-        table = Table(TABLE_NAME, metadata)
+    if name not in metadata.tables:
+        table = Table(name, metadata)
 
         table.append_column(Column("char", String(12), primary_key=True))
         table.append_column(Column("ucn", String(12), primary_key=True))
+        table.append_column(Column(CODEPOINT_COLUMN, Integer, nullable=True))
+        table.append_column(Column(HASH_COLUMN, BigInteger, nullable=True))
+        for numeric in NUMERIC_COLUMNS:
+            table.append_column(Column(numeric, BigInteger, nullable=True))
 
         for column_name in columns:
             col = Column(column_name, String(256), nullable=True)
             table.append_column(col)
 
         return table
-    return Table(TABLE_NAME, metadata)
+    return Table(name, metadata)
+
+
+def create_unihan_meta_table(
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> sqlalchemy.sql.schema.Table:
+    """Return :data:`META_TABLE_NAME` table, adding it to ``metadata``.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Table`
+    """
+    if META_TABLE_NAME in metadata.tables:
+        return metadata.tables[META_TABLE_NAME]
+    return Table(
+        META_TABLE_NAME,
+        metadata,
+        Column("key", String(64), primary_key=True),
+        Column("value", String(256), nullable=True),
+    )
+
+
+def create_unihan_variant_table(
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> sqlalchemy.sql.schema.Table:
+    """Return :data:`VARIANT_TABLE_NAME` table, adding it to ``metadata``.
+
+    The variant fields of UNIHAN, e.g. ``kTraditionalVariant``, hold
+    space-separated ``U+XXXX<tag`` lists. Each element is a row here, an edge
+    from ``src`` to ``dst`` of ``kind``, the field. The primary key serves
+    lookups by ``src``, index ``ix_Unihan_variant_dst`` those by ``dst``.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Table`
+    """
+    if VARIANT_TABLE_NAME in metadata.tables:
+        return metadata.tables[VARIANT_TABLE_NAME]
+    return Table(
+        VARIANT_TABLE_NAME,
+        metadata,
+        Column("src", String(12), primary_key=True),
+        Column("kind", String(64), primary_key=True),
+        Column("dst", String(12), primary_key=True),
+        Column("tag", String(256), nullable=True),
+        sqlalchemy.Index(f"ix_{VARIANT_TABLE_NAME}_dst", "dst", "kind"),
+    )
+
+
+def fill_from_unihan(
+    conn: Connection,
+    target: Table,
+    fields: Iterable[str],
+    derive: t.Callable[[Iterable[t.Any], list[str]], Iterator[dict[str, t.Any]]],
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Replace rows of ``target`` with those ``derive``-d from UNIHAN ``fields``.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    target : :class:`sqlalchemy.schema.Table`
+        table filled
+    fields : Iterable[str]
+        UNIHAN fields read, those not imported are skipped
+    derive : Callable
+        passed the :data:`TABLE_NAME` rows holding any of the fields, with
+        ``char`` and the fields imported as attributes, and those fields. Yields
+        the rows of ``target``.
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    int :
+        rows inserted
+    """
+    columns = {c["name"] for c in sqlalchemy.inspect(conn).get_columns(TABLE_NAME)}
+    fields = [field for field in fields if field in columns]
+    conn.execute(sqlalchemy.delete(target))
+    if not fields:
+        return 0
+    table = sqlalchemy.table(
+        TABLE_NAME,
+        sqlalchemy.column("char"),
+        *(sqlalchemy.column(field) for field in fields),
+    )
+    rows = conn.execute(
+        sqlalchemy.select(table).where(
+            sqlalchemy.or_(*(table.c[field].isnot(None) for field in fields)),
+        ),
+    )
+    values = derive(rows, fields)
+    count = 0
+    while chunk := list(itertools.islice(values, chunk_size)):
+        conn.execute(sqlalchemy.insert(target), chunk)
+        count += len(chunk)
+    log.info("Loaded %d rows into %s", count, target.name)
+    return count
+
+
+def iter_unihan_variants(
+    rows: Iterable[t.Any],
+    kinds: Iterable[str] = UNIHAN_VARIANT_FIELDS,
+) -> Iterator[dict[str, str | None]]:
+    """Yield an edge for each variant in the variant fields of ``rows``.
+
+    Parameters
+    ----------
+    rows : Iterable
+        rows with ``char`` and ``kinds`` as attributes
+    kinds : Iterable[str]
+        variant fields, :data:`~cihai.data.unihan.constants.UNIHAN_VARIANT_FIELDS`
+        by default
+
+    Yields
+    ------
+    dict :
+        ``src``, ``kind``, ``dst`` and ``tag``, the first of each
+        ``(src, kind, dst)``
+    """
+    kinds = list(kinds)
+    for row in rows:
+        for kind in kinds:
+            value = getattr(row, kind)
+            if not value:
+                continue
+            seen = set()
+            for dst, tag in parse_vars(value):
+                if dst in seen:
+                    continue
+                seen.add(dst)
+                yield {"src": row.char, "kind": kind, "dst": dst, "tag": tag}
+
+
+def load_unihan_variants(
+    conn: Connection,
+    variants: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Fill ``variants`` from the variant fields of :data:`TABLE_NAME`.
+
+    Its rows are replaced, so run it in the transaction that changes UNIHAN,
+    to change both at once. Variant fields not imported are skipped.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    variants : :class:`sqlalchemy.schema.Table`
+        see :func:`create_unihan_variant_table`
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    int :
+        variants inserted
+    """
+    return fill_from_unihan(
+        conn,
+        variants,
+        UNIHAN_VARIANT_FIELDS,
+        iter_unihan_variants,
+        chunk_size=chunk_size,
+    )
+
+
+def add_unihan_variants(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add :data:`VARIANT_TABLE_NAME` to a UNIHAN table imported without it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    bool :
+        True if the table was added, False if it already existed.
+    """
+    if VARIANT_TABLE_NAME in metadata.tables:
+        return False
+    variants = create_unihan_variant_table(metadata)
+    variants.create(engine)
+    with engine.begin() as conn:
+        load_unihan_variants(conn, variants, chunk_size=chunk_size)
+    return True
+
+
+def create_unihan_reading_table(
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> sqlalchemy.sql.schema.Table:
+    """Return :data:`READING_TABLE_NAME` table, adding it to ``metadata``.
+
+    The reading fields of UNIHAN, e.g. ``kMandarin``, hold readings among
+    dictionary locations and frequencies. Each reading is a row here, of
+    ``char`` in ``system``, the field, with ``reading_normalized`` from
+    :func:`~cihai.conversion.normalize_reading`. Both readings are indexed.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Table`
+    """
+    if READING_TABLE_NAME in metadata.tables:
+        return metadata.tables[READING_TABLE_NAME]
+    return Table(
+        READING_TABLE_NAME,
+        metadata,
+        Column("char", String(12), primary_key=True),
+        Column("system", String(64), primary_key=True),
+        Column("reading", String(64), primary_key=True),
+        Column("reading_normalized", String(64), nullable=False),
+        sqlalchemy.Index(f"ix_{READING_TABLE_NAME}_reading", "reading", "system"),
+        sqlalchemy.Index(
+            f"ix_{READING_TABLE_NAME}_reading_normalized",
+            "reading_normalized",
+            "system",
+        ),
+    )
+
+
+def iter_unihan_readings(
+    rows: Iterable[t.Any],
+    systems: Iterable[str] = UNIHAN_READING_FIELDS,
+) -> Iterator[dict[str, str]]:
+    """Yield each reading in the reading fields of ``rows``.
+
+    Parameters
+    ----------
+    rows : Iterable
+        rows with ``char`` and ``systems`` as attributes
+    systems : Iterable[str]
+        reading fields, :data:`~cihai.data.unihan.constants.UNIHAN_READING_FIELDS`
+        by default
+
+    Yields
+    ------
+    dict :
+        ``char``, ``system``, ``reading`` and ``reading_normalized``, the first
+        of each ``(char, system, reading)``
+    """
+    systems = list(systems)
+    for row in rows:
+        for system in systems:
+            value = getattr(row, system)
+            if not value:
+                continue
+            seen = set()
+            for reading in parse_readings(system, value):
+                if reading in seen:
+                    continue
+                seen.add(reading)
+                yield {
+                    "char": row.char,
+                    "system": system,
+                    "reading": reading,
+                    "reading_normalized": normalize_reading(reading),
+                }
+
+
+def load_unihan_readings(
+    conn: Connection,
+    readings: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Fill ``readings`` from the reading fields of :data:`TABLE_NAME`.
+
+    Like :func:`load_unihan_variants`, run it in the transaction that changes
+    UNIHAN.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    readings : :class:`sqlalchemy.schema.Table`
+        see :func:`create_unihan_reading_table`
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    int :
+        readings inserted
+    """
+    return fill_from_unihan(
+        conn,
+        readings,
+        UNIHAN_READING_FIELDS,
+        iter_unihan_readings,
+        chunk_size=chunk_size,
+    )
+
+
+def add_unihan_readings(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add :data:`READING_TABLE_NAME` to a UNIHAN table imported without it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    bool :
+        True if the table was added, False if it already existed.
+    """
+    if READING_TABLE_NAME in metadata.tables:
+        return False
+    readings = create_unihan_reading_table(metadata)
+    readings.create(engine)
+    with engine.begin() as conn:
+        load_unihan_readings(conn, readings, chunk_size=chunk_size)
+    return True
+
+
+def create_unihan_radical_table(
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> sqlalchemy.sql.schema.Table:
+    """Return :data:`RADICAL_TABLE_NAME` table, adding it to ``metadata``.
+
+    Each radical/stroke count of ``kRSUnicode``, e.g. ``85.5`` or ``120'.3``,
+    is a row: the Kangxi ``radical``, ``simplified`` the number of
+    apostrophes after it, and the ``residual_strokes``. Index
+    ``ix_Unihan_radical_radical`` orders them as printed dictionaries do, by
+    radical, then residual strokes, then code point.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Table`
+    """
+    if RADICAL_TABLE_NAME in metadata.tables:
+        return metadata.tables[RADICAL_TABLE_NAME]
+    return Table(
+        RADICAL_TABLE_NAME,
+        metadata,
+        Column("char", String(12), primary_key=True),
+        Column("radical", Integer, primary_key=True),
+        Column("simplified", Integer, primary_key=True),
+        Column("residual_strokes", Integer, nullable=False),
+        Column(CODEPOINT_COLUMN, Integer, nullable=False),
+        sqlalchemy.Index(
+            f"ix_{RADICAL_TABLE_NAME}_radical",
+            "radical",
+            "residual_strokes",
+            CODEPOINT_COLUMN,
+        ),
+    )
+
+
+def iter_unihan_radicals(
+    rows: Iterable[t.Any],
+    fields: Iterable[str] = ("kRSUnicode",),
+) -> Iterator[dict[str, t.Any]]:
+    """Yield each radical/stroke count in ``kRSUnicode`` of ``rows``.
+
+    Parameters
+    ----------
+    rows : Iterable
+        rows with ``char`` and ``kRSUnicode`` as attributes
+    fields : Iterable[str]
+        ``kRSUnicode``, for :func:`fill_from_unihan`
+
+    Yields
+    ------
+    dict :
+        ``char``, ``radical``, ``simplified``, ``residual_strokes`` and
+        ``codepoint``, the first of each ``(char, radical, simplified)``
+    """
+    for row in rows:
+        seen = set()
+        for radical, simplified, strokes in parse_radical_strokes(row.kRSUnicode):
+            if (radical, simplified) in seen:
+                continue
+            seen.add((radical, simplified))
+            yield {
+                "char": row.char,
+                "radical": radical,
+                "simplified": simplified,
+                "residual_strokes": strokes,
+                CODEPOINT_COLUMN: ord(row.char),
+            }
+
+
+def load_unihan_radicals(
+    conn: Connection,
+    radicals: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Fill ``radicals`` from ``kRSUnicode`` of :data:`TABLE_NAME`.
+
+    Like :func:`load_unihan_variants`, run it in the transaction that changes
+    UNIHAN.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    radicals : :class:`sqlalchemy.schema.Table`
+        see :func:`create_unihan_radical_table`
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    int :
+        radical/stroke counts inserted
+    """
+    return fill_from_unihan(
+        conn,
+        radicals,
+        ["kRSUnicode"],
+        iter_unihan_radicals,
+        chunk_size=chunk_size,
+    )
+
+
+def add_unihan_radicals(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add :data:`RADICAL_TABLE_NAME` to a UNIHAN table imported without it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata
+    chunk_size : int
+        rows inserted per round trip
+
+    Returns
+    -------
+    bool :
+        True if the table was added, False if it already existed.
+    """
+    if RADICAL_TABLE_NAME in metadata.tables:
+        return False
+    radicals = create_unihan_radical_table(metadata)
+    radicals.create(engine)
+    with engine.begin() as conn:
+        load_unihan_radicals(conn, radicals, chunk_size=chunk_size)
+    return True
+
+
+def get_unihan_version(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> str | None:
+    """Return Unicode version of the UNIHAN imported, None if not recorded.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        reflected metadata of the database
+    """
+    if META_TABLE_NAME not in metadata.tables:
+        return None
+    meta = metadata.tables[META_TABLE_NAME]
+    with engine.connect() as conn:
+        return conn.scalar(
+            sqlalchemy.select(meta.c.value).where(meta.c.key == "version"),
+        )
+
+
+def read_unihan_version(files: Sequence[pathlib.Path]) -> str | None:
+    """Return Unicode version in the header of UNIHAN data files.
+
+    Parameters
+    ----------
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files
+
+    Returns
+    -------
+    str | None :
+        e.g. ``'15.1.0'``, None if no file header has a ``Unicode version``
+    """
+    for path in files:
+        with path.open(encoding="utf-8") as lines:
+            for line in lines:
+                if not line.startswith("#"):
+                    break
+                name, _, value = line.lstrip("# ").partition(":")
+                if name == "Unicode version":
+                    return value.strip()
+    return None
+
+
+def content_hash(values: Iterable[str | None]) -> int:
+    """Return 64-bit hash of a UNIHAN row's field values.
+
+    Parameters
+    ----------
+    values : Iterable[str | None]
+        values of the row's fields, in :func:`hashed_columns` order
+
+    Returns
+    -------
+    int :
+        signed, to fit an SQL ``BIGINT``
+
+    Examples
+    --------
+    >>> content_hash(["a", None]) == content_hash(["a", None])
+    True
+    >>> content_hash(["a", None]) == content_hash([None, "a"])
+    False
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for value in values:
+        digest.update(b"\x00" if value is None else b"\x01" + value.encode())
+        digest.update(b"\x1f")
+    return int.from_bytes(digest.digest(), "big", signed=True)
+
+
+def hashed_columns(table: Table) -> list[Column[t.Any]]:
+    """Return the field columns :data:`HASH_COLUMN` covers, sorted by name.
+
+    Parameters
+    ----------
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table
+
+    Returns
+    -------
+    list[:class:`sqlalchemy.schema.Column`]
+    """
+    return sorted(
+        (c for c in table.columns if c.name not in DEFAULT_COLUMNS),
+        key=lambda c: c.name,
+    )
+
+
+def fill_content_hashes(
+    conn: Connection,
+    table: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Set :data:`HASH_COLUMN` of the rows of ``table`` missing it.
+
+    Rows are read and updated ``chunk_size`` at a time, in ``char`` order.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table, or a table with its columns
+    chunk_size : int
+        rows hashed per round trip
+
+    Returns
+    -------
+    int :
+        rows hashed
+    """
+    columns = hashed_columns(table)
+    update = (
+        sqlalchemy.update(table)
+        .where(table.c.char == sqlalchemy.bindparam("_char"))
+        .values({HASH_COLUMN: sqlalchemy.bindparam("_hash")})
+    )
+    count = 0
+    last = ""
+    while rows := conn.execute(
+        sqlalchemy.select(table.c.char, *columns)
+        .where(table.c[HASH_COLUMN].is_(None), table.c.char > last)
+        .order_by(table.c.char)
+        .limit(chunk_size),
+    ).all():
+        conn.execute(
+            update,
+            [{"_char": row[0], "_hash": content_hash(row[1:])} for row in rows],
+        )
+        count += len(rows)
+        last = rows[-1][0]
+    return count
+
+
+def numeric_value(value: str | None) -> int | None:
+    """Return first integer of a numeric UNIHAN field value, None if it has none.
+
+    >>> numeric_value("5")
+    5
+    >>> numeric_value("11 12")
+    11
+    >>> numeric_value(None) is None
+    True
+    """
+    if not value:
+        return None
+    try:
+        return int(value.split(" ", 1)[0])
+    except ValueError:
+        return None
+
+
+def fill_numeric_columns(
+    conn: Connection,
+    table: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Set :data:`NUMERIC_COLUMNS` of the rows of ``table`` from their fields.
+
+    Rows are read and updated ``chunk_size`` at a time, in ``char`` order, like
+    :func:`fill_content_hashes`. Columns whose field is not imported are left
+    empty.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table, or a table with its columns
+    chunk_size : int
+        rows updated per round trip
+
+    Returns
+    -------
+    int :
+        rows holding a numeric field
+    """
+    numerics = {
+        column: field
+        for column, field in NUMERIC_COLUMNS.items()
+        if column in table.c and field in table.c
+    }
+    if not numerics:
+        return 0
+    fields = [table.c[field] for field in numerics.values()]
+    update = (
+        sqlalchemy.update(table)
+        .where(table.c.char == sqlalchemy.bindparam("_char"))
+        .values({column: sqlalchemy.bindparam(f"_{column}") for column in numerics})
+    )
+    count = 0
+    last = ""
+    while rows := conn.execute(
+        sqlalchemy.select(table.c.char, *fields)
+        .where(sqlalchemy.or_(*(f.isnot(None) for f in fields)), table.c.char > last)
+        .order_by(table.c.char)
+        .limit(chunk_size),
+    ).all():
+        conn.execute(
+            update,
+            [
+                {
+                    "_char": row[0],
+                    **{
+                        f"_{column}": numeric_value(value)
+                        for column, value in zip(numerics, row[1:], strict=True)
+                    },
+                }
+                for row in rows
+            ],
+        )
+        count += len(rows)
+        last = rows[-1][0]
+    return count
+
+
+def fill_codepoints(
+    conn: Connection,
+    table: Table,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> int:
+    """Set :data:`CODEPOINT_COLUMN` of the rows of ``table`` missing it.
+
+    Rows are read and updated ``chunk_size`` at a time, in ``char`` order, like
+    :func:`fill_content_hashes`. Codepoints are computed in Python, so any
+    database can be filled.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table, or a table with its columns
+    chunk_size : int
+        rows updated per round trip
+
+    Returns
+    -------
+    int :
+        rows updated
+    """
+    update = (
+        sqlalchemy.update(table)
+        .where(table.c.char == sqlalchemy.bindparam("_char"))
+        .values({CODEPOINT_COLUMN: sqlalchemy.bindparam("_codepoint")})
+    )
+    count = 0
+    last = ""
+    while rows := conn.execute(
+        sqlalchemy.select(table.c.char)
+        .where(table.c[CODEPOINT_COLUMN].is_(None), table.c.char > last)
+        .order_by(table.c.char)
+        .limit(chunk_size),
+    ).all():
+        conn.execute(
+            update,
+            [{"_char": row[0], "_codepoint": ord(row[0])} for row in rows],
+        )
+        count += len(rows)
+        last = rows[-1][0]
+    return count
+
+
+#: Byte range of a UNIHAN data file, ``(path, start, end)``
+Shard: t.TypeAlias = tuple[pathlib.Path, int, int]
+
+
+def unihan_shards(
+    files: Sequence[pathlib.Path],
+    shard_size: int = BOOTSTRAP_SHARD_SIZE,
+) -> list[Shard]:
+    """Split UNIHAN data files into byte ranges of at most ``shard_size``.
+
+    Parameters
+    ----------
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files
+    shard_size : int
+        bytes per shard
+
+    Returns
+    -------
+    list[Shard] :
+        in file order, then byte order
+    """
+    shards: list[Shard] = []
+    for path in files:
+        size = path.stat().st_size
+        shards.extend(
+            (path, start, min(start + shard_size, size))
+            for start in range(0, size, shard_size)
+        )
+    return shards
+
+
+def iter_unihan_shard(
+    path: pathlib.Path,
+    start: int,
+    end: int,
+    fields: Sequence[str],
+) -> Iterator[dict[str, t.Any]]:
+    """Yield each value of ``fields`` on the lines starting in a byte range.
+
+    A line straddling ``start`` belongs to the previous shard, one straddling
+    ``end`` to this one, so the shards of a file yield each line once.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        extracted UNIHAN ``.txt`` file
+    start : int
+        offset of the shard
+    end : int
+        offset past the shard
+    fields : Sequence[str]
+        fields to keep, e.g. ``['kDefinition']``
+
+    Yields
+    ------
+    dict :
+        ``codepoint``, ``char``, ``ucn``, ``field`` and ``value`` of a line
+    """
+    wanted = set(fields)
+    with path.open("rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # rest of the line begun before start
+        while f.tell() < end and (raw := f.readline()):
+            line = raw.decode("utf-8")
+            if not unihan.not_junk(line):
+                continue
+            parts = line.strip().split("\t")
+            if len(parts) < 3 or parts[1] not in wanted:
+                continue
+            codepoint = ucn_to_codepoint(parts[0])
+            yield {
+                CODEPOINT_COLUMN: codepoint,
+                "char": chr(codepoint),
+                "ucn": parts[0],
+                "field": parts[1],
+                "value": parts[2],
+            }
+
+
+def parse_unihan_shard(
+    shard: Shard,
+    fields: Sequence[str],
+) -> list[dict[str, t.Any]]:
+    """Return the values of :func:`iter_unihan_shard`, for worker processes."""
+    return list(iter_unihan_shard(*shard, fields))
+
+
+def iter_unihan_values(
+    files: Sequence[pathlib.Path],
+    fields: Sequence[str],
+    workers: int = 1,
+    shard_size: int = BOOTSTRAP_SHARD_SIZE,
+) -> Iterator[dict[str, t.Any]]:
+    """Yield each value of ``fields`` in UNIHAN data files, one line at a time.
+
+    Lines are parsed the way :func:`unihan_etl.core.normalize` does, without
+    collecting them.
+
+    With several ``workers``, the files are split by :func:`unihan_shards` and
+    parsed in a process pool. Values are still yielded in file and line order,
+    the same as in one process. At most two shards per worker are parsed ahead
+    of the caller, which bounds memory use.
+
+    Parameters
+    ----------
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files
+    fields : Sequence[str]
+        fields to keep, e.g. ``['kDefinition']``
+    workers : int
+        processes parsing shards, 1 parses in this process
+    shard_size : int
+        bytes per shard, see :func:`unihan_shards`
+
+    Yields
+    ------
+    dict :
+        ``codepoint``, ``char``, ``ucn``, ``field`` and ``value`` of a line
+    """
+    for _shard, values in iter_parsed_shards(
+        unihan_shards(files, shard_size),
+        fields,
+        workers=workers,
+    ):
+        yield from values
+
+
+def iter_parsed_shards(
+    shards: Sequence[Shard],
+    fields: Sequence[str],
+    workers: int = 1,
+) -> Iterator[tuple[Shard, Iterable[dict[str, t.Any]]]]:
+    """Yield each of ``shards`` with its values, see :func:`iter_unihan_values`.
+
+    Parameters
+    ----------
+    shards : Sequence[Shard]
+        byte ranges of UNIHAN data files, see :func:`unihan_shards`
+    fields : Sequence[str]
+        fields to keep, e.g. ``['kDefinition']``
+    workers : int
+        processes parsing shards, 1 parses in this process
+
+    Yields
+    ------
+    tuple[Shard, Iterable[dict]] :
+        shard, and the values of :func:`iter_unihan_shard` on it
+    """
+    if workers <= 1:
+        for shard in shards:
+            yield shard, iter_unihan_shard(*shard, fields)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        pending: collections.deque[
+            tuple[Shard, concurrent.futures.Future[list[dict[str, t.Any]]]]
+        ] = collections.deque()
+        for shard in shards:
+            pending.append((shard, pool.submit(parse_unihan_shard, shard, fields)))
+            if len(pending) >= 2 * workers:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
+
+
+#: ``INSERT ... ON CONFLICT DO UPDATE`` of each dialect :func:`load_unihan`
+#: upserts with
+UPSERTS: dict[str, t.Callable[[Table], t.Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def load_unihan(
+    conn: Connection,
+    table: Table,
+    files: Sequence[pathlib.Path],
+    fields: Sequence[str],
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+    workers: int = 1,
+    recorder: BootstrapRecorder | None = None,
+) -> UnihanDelta:
+    """Import UNIHAN data files into ``table``, in bounded memory.
+
+    The files hold one ``field`` value per line, the lines of a character
+    spread over several files. Lines are streamed into a temporary table,
+    ``chunk_size`` per ``executemany``, then pivoted into one row per
+    character by the database. Memory use does not grow with UNIHAN's size.
+
+    Rows are compared with those of ``table`` by :data:`HASH_COLUMN`. Only new
+    and changed rows are written, as upserts, and rows no longer in the files
+    are deleted, so refreshing to a new UNIHAN release leaves most of the
+    table untouched. Run it in one transaction to apply the changes at once.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+        connection in a transaction, the temporary tables live on it
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table, empty or imported before
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files
+    fields : Sequence[str]
+        fields to import, each a column of ``table``
+    chunk_size : int
+        lines inserted per round trip
+    workers : int
+        processes parsing the files, see :func:`iter_unihan_values`
+    recorder : :class:`~cihai.data.unihan.instrument.BootstrapRecorder` | None
+        records the ``parse`` phase, with progress every ``chunk_size`` lines,
+        and the ``insert`` phase
+
+    Returns
+    -------
+    :class:`UnihanDelta`
+    """
+    if recorder is None:
+        recorder = BootstrapRecorder()
+    fields = [f for f in fields if f not in INDEX_FIELDS]
+    staging = create_unihan_staging_table(sqlalchemy.MetaData())
+    # a failed import leaves it behind on the pooled connection
+    staging.drop(conn, checkfirst=True)
+    staging.create(conn)
+
+    with recorder.phase("parse") as progress:
+        values = iter_unihan_values(files, fields, workers=workers)
+        stage_unihan(conn, staging, values, chunk_size=chunk_size, progress=progress)
+        progress.bytes_read = sum(f.stat().st_size for f in files)
+    log.info("Staged %d UNIHAN values, pivoting into %s", progress.rows, TABLE_NAME)
+
+    return apply_unihan(
+        conn,
+        table,
+        staging,
+        files=files,
+        fields=fields,
+        chunk_size=chunk_size,
+        recorder=recorder,
+    )
+
+
+def create_unihan_staging_table(
+    metadata: sqlalchemy.sql.schema.MetaData,
+    name: str = STAGING_TABLE_NAME,
+    temporary: bool = True,
+) -> Table:
+    """Return table holding UNIHAN values, one per row, until pivoted.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+    name : str
+        table name
+    temporary : bool
+        create it as a temporary table, private to its connection
+
+    Returns
+    -------
+    :class:`sqlalchemy.schema.Table`
+    """
+    return Table(
+        name,
+        metadata,
+        Column(CODEPOINT_COLUMN, Integer),
+        Column("char", String(12)),
+        Column("ucn", String(12)),
+        Column("field", String(64)),
+        Column("value", Text),
+        prefixes=["TEMPORARY"] if temporary else [],
+    )
+
+
+def stage_unihan(
+    conn: Connection,
+    staging: Table,
+    values: Iterable[dict[str, t.Any]],
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+    progress: PhaseProgress | None = None,
+) -> None:
+    """Insert UNIHAN ``values`` into ``staging``, ``chunk_size`` at a time.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+    staging : :class:`sqlalchemy.schema.Table`
+        see :func:`create_unihan_staging_table`
+    values : Iterable[dict]
+        see :func:`iter_unihan_values`
+    chunk_size : int
+        values inserted per round trip
+    progress : :class:`~cihai.data.unihan.instrument.PhaseProgress` | None
+        advanced by each chunk
+    """
+    values = iter(values)
+    while chunk := list(itertools.islice(values, chunk_size)):
+        conn.execute(sqlalchemy.insert(staging), chunk)
+        if progress is not None:
+            progress.advance(rows=len(chunk))
+
+
+def apply_unihan(
+    conn: Connection,
+    table: Table,
+    staging: Table,
+    files: Sequence[pathlib.Path],
+    fields: Sequence[str],
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+    recorder: BootstrapRecorder | None = None,
+) -> UnihanDelta:
+    """Pivot the values of ``staging`` into ``table``, then drop ``staging``.
+
+    The second half of :func:`load_unihan`, timed as the ``insert`` phase.
+
+    Parameters
+    ----------
+    conn : :class:`sqlalchemy.engine.Connection`
+        connection in a transaction
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table, empty or imported before
+    staging : :class:`sqlalchemy.schema.Table`
+        values staged by :func:`stage_unihan`
+    files : Sequence[pathlib.Path]
+        extracted UNIHAN ``.txt`` files the values were read from
+    fields : Sequence[str]
+        fields to import, each a column of ``table``
+    chunk_size : int
+        rows hashed per round trip, see :func:`fill_content_hashes`
+    recorder : :class:`~cihai.data.unihan.instrument.BootstrapRecorder` | None
+        records the ``insert`` phase
+
+    Returns
+    -------
+    :class:`UnihanDelta`
+    """
+    if recorder is None:
+        recorder = BootstrapRecorder()
+    fields = [f for f in fields if f not in INDEX_FIELDS]
+    new = Table(
+        f"{TABLE_NAME}_new",
+        sqlalchemy.MetaData(),
+        *(Column(c.name, c.type, primary_key=c.primary_key) for c in table.columns),
+        prefixes=["TEMPORARY"],
+    )
+    new.drop(conn, checkfirst=True)
+    new.create(conn)
+
+    with recorder.phase("insert") as progress:
+        keys = [staging.c[CODEPOINT_COLUMN], staging.c.char, staging.c.ucn]
+        pivot = sqlalchemy.select(
+            *keys,
+            *(
+                sqlalchemy.func.max(
+                    sqlalchemy.case((staging.c.field == field, staging.c.value)),
+                ).label(field)
+                for field in fields
+            ),
+        ).group_by(*keys)
+        conn.execute(
+            sqlalchemy.insert(new).from_select(
+                [CODEPOINT_COLUMN, "char", "ucn", *fields],
+                pivot,
+            ),
+        )
+        staging.drop(conn)
+        fill_numeric_columns(conn, new, chunk_size=chunk_size)
+        fill_content_hashes(conn, new, chunk_size=chunk_size)
+
+        same_char = sqlalchemy.and_(
+            table.c.char == new.c.char, table.c.ucn == new.c.ucn
+        )
+        existing = sqlalchemy.exists().where(same_char)
+        unchanged = sqlalchemy.exists().where(
+            same_char,
+            table.c[HASH_COLUMN] == new.c[HASH_COLUMN],
+        )
+
+        def count_new(*criteria: sqlalchemy.ColumnElement[bool]) -> int:
+            query = sqlalchemy.select(sqlalchemy.func.count()).select_from(new)
+            return conn.execute(query.where(*criteria)).scalar_one()
+
+        inserted = count_new(~existing)
+        changed = count_new(~unchanged)
+        total = count_new()
+
+        deleted = conn.execute(
+            sqlalchemy.delete(table).where(
+                ~sqlalchemy.exists().where(same_char).correlate(table),
+            ),
+        ).rowcount
+
+        columns = [c.name for c in new.columns]
+        rows = sqlalchemy.select(*new.c).where(~unchanged)
+        upsert = UPSERTS.get(conn.dialect.name)
+        if upsert is None:
+            conn.execute(sqlalchemy.delete(table).where(existing.correlate(table)))
+            conn.execute(sqlalchemy.insert(table).from_select(columns, rows))
+        else:
+            insert = upsert(table).from_select(columns, rows)
+            conn.execute(
+                insert.on_conflict_do_update(
+                    index_elements=[table.c.char, table.c.ucn],
+                    set_={
+                        name: insert.excluded[name]
+                        for name in columns
+                        if name not in {"char", "ucn"}
+                    },
+                ),
+            )
+        new.drop(conn)
+        progress.advance(rows=changed)
+
+    delta = UnihanDelta(
+        version=read_unihan_version(files),
+        inserted=inserted,
+        updated=changed - inserted,
+        deleted=deleted,
+        unchanged=total - changed,
+    )
+    log.info(
+        "Imported UNIHAN %s: %d inserted, %d updated, %d deleted, %d unchanged",
+        *delta,
+    )
+    return delta
+
+
+def text_columns(table: Table) -> list[Column[t.Any]]:
+    """Return the string columns of the UNIHAN table, those text searches cover.
+
+    Parameters
+    ----------
+    table : :class:`sqlalchemy.schema.Table`
+        UNIHAN table
+
+    Returns
+    -------
+    list[:class:`sqlalchemy.schema.Column`]
+    """
+    return [column for column in table.columns if isinstance(column.type, String)]
+
+
+def add_unihan_codepoints(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add and fill :data:`CODEPOINT_COLUMN` in a UNIHAN table imported without it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, holding the UNIHAN table
+    chunk_size : int
+        rows updated per round trip, see :func:`fill_codepoints`
+
+    Returns
+    -------
+    bool :
+        True if the column was added, False if it already existed.
+    """
+    table = metadata.tables[TABLE_NAME]
+    if CODEPOINT_COLUMN in table.columns:
+        return False
+
+    column = Column(CODEPOINT_COLUMN, Integer, nullable=True)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"ALTER TABLE {quote(TABLE_NAME)} ADD COLUMN {quote(column.name)} INTEGER",
+        )
+        table.append_column(column)
+        fill_codepoints(conn, table, chunk_size=chunk_size)
+    log.info("Added %s column to UNIHAN table", CODEPOINT_COLUMN)
+    return True
+
+
+def add_unihan_hashes(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add and fill :data:`HASH_COLUMN` in a UNIHAN table imported without it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, holding the UNIHAN table
+    chunk_size : int
+        rows hashed per round trip, see :func:`fill_content_hashes`
+
+    Returns
+    -------
+    bool :
+        True if the column was added, False if it already existed.
+    """
+    table = metadata.tables[TABLE_NAME]
+    if HASH_COLUMN in table.columns:
+        return False
+
+    column = Column(HASH_COLUMN, BigInteger, nullable=True)
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"ALTER TABLE {quote(TABLE_NAME)} ADD COLUMN {quote(column.name)} BIGINT",
+        )
+        table.append_column(column)
+        fill_content_hashes(conn, table, chunk_size=chunk_size)
+    log.info("Added %s column to UNIHAN table", HASH_COLUMN)
+    return True
+
+
+def add_unihan_numerics(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> bool:
+    """Add and fill :data:`NUMERIC_COLUMNS` a UNIHAN table was imported without.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, holding the UNIHAN table
+    chunk_size : int
+        rows updated per round trip, see :func:`fill_numeric_columns`
+
+    Returns
+    -------
+    bool :
+        True if a column was added, False if all existed.
+    """
+    table = metadata.tables[TABLE_NAME]
+    missing = [name for name in NUMERIC_COLUMNS if name not in table.columns]
+    if not missing:
+        return False
+
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as conn:
+        for name in missing:
+            column = Column(name, BigInteger, nullable=True)
+            conn.exec_driver_sql(
+                f"ALTER TABLE {quote(TABLE_NAME)} ADD COLUMN {quote(name)} BIGINT",
+            )
+            table.append_column(column)
+        fill_numeric_columns(conn, table, chunk_size=chunk_size)
+    log.info("Added %s columns to UNIHAN table", ", ".join(missing))
+    return True
+
+
+def supports_fts(engine: Engine) -> bool:
+    """Return True if the database can hold the UNIHAN full-text index.
+
+    The index is an SQLite FTS5 table using the ``trigram`` tokenizer, which
+    needs SQLite 3.34 or newer built with FTS5.
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+    with engine.connect() as conn:
+        try:
+            conn.exec_driver_sql(
+                "CREATE VIRTUAL TABLE temp.cihai_fts_probe "
+                "USING fts5(probe, tokenize='trigram')",
+            )
+        except sqlalchemy.exc.OperationalError:
+            return False
+        conn.exec_driver_sql("DROP TABLE temp.cihai_fts_probe")
+    return True
+
+
+def create_unihan_fts(
+    engine: Engine,
+    metadata: sqlalchemy.sql.schema.MetaData,
+) -> bool:
+    """Build the full-text indexes of the UNIHAN table, replacing existing ones.
+
+    Each index is an external-content FTS5 table over the :func:`text_columns`
+    of :data:`TABLE_NAME`, see :data:`FTS_TOKENIZERS`. :data:`FTS_TABLE_NAME` is
+    tokenized into trigrams so a ``MATCH`` finds the same substrings a
+    ``LIKE '%hint%'`` does, :data:`FTS_TOKENS_TABLE_NAME` into words. Triggers on
+    :data:`TABLE_NAME` keep both in sync with later inserts, updates and deletes.
+
+    Indexed rows are keyed by :data:`CODEPOINT_COLUMN`, which ``VACUUM`` keeps,
+    unlike the implicit ``rowid``. Rows inserted later must set it.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+    metadata : :class:`sqlalchemy.schema.MetaData`
+        Instance of sqlalchemy metadata, holding the UNIHAN table
+
+    Returns
+    -------
+    bool :
+        True if the indexes were built, False if the database does not support
+        them.
+    """
+    if not supports_fts(engine):
+        log.info("Database has no FTS5 trigram support, skipping full-text index")
+        return False
+
+    quote = engine.dialect.identifier_preparer.quote
+    table = quote(TABLE_NAME)
+    names = [quote(c.name) for c in text_columns(metadata.tables[TABLE_NAME])]
+    columns = ", ".join(names)
+    key = quote(CODEPOINT_COLUMN)
+
+    with engine.begin() as conn:
+        for fts_name, tokenize in FTS_TOKENIZERS.items():
+            fts = quote(fts_name)
+            insert = "INSERT INTO {fts}(rowid, {columns}) VALUES (new.{key}, {values});"
+            delete = (
+                "INSERT INTO {fts}({fts}, rowid, {columns}) "
+                "VALUES ('delete', old.{key}, {values});"
+            )
+            insert = insert.format(
+                fts=fts,
+                key=key,
+                columns=columns,
+                values=", ".join(f"new.{name}" for name in names),
+            )
+            delete = delete.format(
+                fts=fts,
+                key=key,
+                columns=columns,
+                values=", ".join(f"old.{name}" for name in names),
+            )
+            triggers = {
+                "ai": f"AFTER INSERT ON {table} BEGIN {insert} END",
+                "ad": f"AFTER DELETE ON {table} BEGIN {delete} END",
+                "au": f"AFTER UPDATE ON {table} BEGIN {delete} {insert} END",
+            }
+
+            for suffix in triggers:
+                trigger = quote(f"{fts_name}_{suffix}")
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {fts}")
+            conn.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, "
+                f"content={table}, content_rowid='{CODEPOINT_COLUMN}', "
+                f"tokenize='{tokenize}')",
+            )
+            conn.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            for suffix, body in triggers.items():
+                trigger = quote(f"{fts_name}_{suffix}")
+                conn.exec_driver_sql(f"CREATE TRIGGER {trigger} {body}")
+    return True
+
+
+def fts_match(
+    hints: list[str],
+    fields: list[str] | None = None,
+    fts_table: str = FTS_TABLE_NAME,
+    prefix: bool = False,
+) -> sqlalchemy.Subquery:
+    """Return ``(rowid, rank)`` of UNIHAN rows matching any of ``hints``.
+
+    ``rowid`` is the :data:`CODEPOINT_COLUMN` of the row, see
+    :func:`create_unihan_fts`.
+
+    Each hint is matched as an FTS5 phrase, so against :data:`FTS_TABLE_NAME` it
+    is a case-insensitive substring match, and against
+    :data:`FTS_TOKENS_TABLE_NAME` a case-insensitive match of whole words.
+    ``rank`` is the row's BM25 score, lower is more relevant.
+
+    Parameters
+    ----------
+    hints : list[str]
+        strings to match. Against :data:`FTS_TABLE_NAME`, each must be at least
+        :data:`FTS_MIN_HINT_LENGTH` characters.
+    fields : list[str] | None
+        columns to match in, all columns if None
+    fts_table : str
+        full-text table to match against, a key of :data:`FTS_TOKENIZERS`
+    prefix : bool
+        match words starting with the last word of each hint
+
+    Returns
+    -------
+    :class:`sqlalchemy.sql.expression.Subquery`
+    """
+    fts = sqlalchemy.table(
+        fts_table,
+        sqlalchemy.column("rowid"),
+        sqlalchemy.column("rank"),
+    )
+    phrases = " OR ".join(
+        '"{}"{}'.format(hint.replace('"', '""'), " *" if prefix else "")
+        for hint in hints
+    )
+    if fields is not None:
+        phrases = "{{{}}} : ({})".format(" ".join(fields), phrases)
+    return (
+        sqlalchemy.select(fts.c.rowid, fts.c.rank)
+        .where(sqlalchemy.literal_column(fts_table).op("MATCH")(phrases))
+        .subquery()
+    )
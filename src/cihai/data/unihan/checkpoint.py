@@ -0,0 +1,171 @@
+"""Checkpoints of UNIHAN bootstraps, to resume one that died part way.
+
+:func:`~cihai.data.unihan.bootstrap.bootstrap_unihan` records the steps it
+completed in a JSON file of its ``checkpoint_dir``, one per database. For
+:class:`~cihai.data.unihan.dataset.Unihan`, that is ``unihan/`` in the
+``cache`` directory of the ``dirs`` config.
+
+- ``download``: SHA-256 of the UNIHAN archive. A different archive
+  invalidates the checkpoints after it.
+- ``extract``: size of each extracted file. A partly extracted file is
+  extracted again.
+- ``create``: the build table and its staging table exist.
+- shards: byte ranges of the UNIHAN files parsed and committed to the staging
+  table, see :func:`~cihai.data.unihan.bootstrap.unihan_shards`.
+- ``insert`` and ``index``: the build table is filled and indexed.
+
+A rerun skips what the checkpoint and the database agree is done. The file is
+removed once UNIHAN is published.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pathlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.engine import Engine
+
+    from cihai.types import ConfigDict
+
+    from .bootstrap import Shard
+
+
+log = logging.getLogger(__name__)
+
+#: Bytes hashed at a time by :func:`file_sha256`
+HASH_BUFSIZE = 1024 * 1024
+
+
+def unihan_checkpoint_dir(config: ConfigDict) -> pathlib.Path:
+    """Return directory of UNIHAN bootstrap checkpoints, ``unihan/`` of the cache.
+
+    Parameters
+    ----------
+    config : dict
+        :attr:`cihai.core.Cihai.config`
+    """
+    return pathlib.Path(config["dirs"]["cache"]) / "unihan"
+
+
+def file_sha256(path: pathlib.Path) -> str:
+    """Return SHA-256 of file at ``path``, hex."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_BUFSIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def shard_key(shard: Shard) -> list[t.Any]:
+    """Return JSON-serializable key of ``shard``, its file name and byte range."""
+    path, start, end = shard
+    return [path.name, start, end]
+
+
+class BootstrapCheckpoint:
+    """Steps of a bootstrap completed, saved to a JSON file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        checkpoint file, read if it exists
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.state: dict[str, t.Any] = {}
+        if path.exists():
+            try:
+                self.state = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                log.warning("Ignoring unreadable bootstrap checkpoint %s", path)
+
+    @classmethod
+    def for_database(
+        cls,
+        directory: pathlib.Path,
+        engine: Engine,
+    ) -> BootstrapCheckpoint:
+        """Return checkpoint of bootstraps into the database of ``engine``.
+
+        Parameters
+        ----------
+        directory : pathlib.Path
+            directory holding checkpoints
+        engine : :class:`sqlalchemy.engine.Engine`
+        """
+        url = engine.url.render_as_string(hide_password=True)
+        name = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return cls(directory / f"{name}.json")
+
+    def start(self, **key: t.Any) -> bool:
+        """Resume the checkpoint if it was saved for ``key``, else start over.
+
+        Parameters
+        ----------
+        **key
+            what the steps recorded depend on, e.g. the archive checksum
+
+        Returns
+        -------
+        bool :
+            True if resumed
+        """
+        if self.state.get("key") == key:
+            return True
+        if self.state:
+            log.info("UNIHAN changed since the last bootstrap, starting over")
+        self.state = {"key": key, "steps": {}, "shards": []}
+        self.save()
+        return False
+
+    def get(self, step: str) -> t.Any | None:
+        """Return value recorded with ``step``, None if not done."""
+        return self.state.get("steps", {}).get(step)
+
+    def done(self, step: str) -> bool:
+        """Return True if ``step`` was recorded."""
+        return self.get(step) is not None
+
+    def mark(self, step: str, value: t.Any = True) -> None:
+        """Record ``step`` as done, with ``value``."""
+        self.state.setdefault("steps", {})[step] = value
+        self.save()
+
+    def forget(self, *steps: str) -> None:
+        """Forget ``steps`` and the shards staged, to redo them."""
+        for step in steps:
+            self.state.get("steps", {}).pop(step, None)
+        self.state["shards"] = []
+        self.save()
+
+    def has_shard(self, shard: Shard) -> bool:
+        """Return True if ``shard`` was staged."""
+        return shard_key(shard) in self.state.get("shards", [])
+
+    def add_shard(self, shard: Shard) -> None:
+        """Record ``shard`` as staged."""
+        self.state.setdefault("shards", []).append(shard_key(shard))
+        self.save()
+
+    def pending(self, shards: Sequence[Shard]) -> list[Shard]:
+        """Return ``shards`` not staged yet."""
+        return [shard for shard in shards if not self.has_shard(shard)]
+
+    def save(self) -> None:
+        """Write the checkpoint, replacing the file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def clear(self) -> None:
+        """Remove the checkpoint, once the bootstrap is done."""
+        self.state = {}
+        self.path.unlink(missing_ok=True)
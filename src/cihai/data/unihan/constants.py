@@ -50,6 +50,74 @@ UNIHAN_FIELDS: list[str] = [
     "kZVariant",
 ]
 
+#: Fields holding variant characters
+UNIHAN_VARIANT_FIELDS: list[str] = [
+    "kCompatibilityVariant",
+    "kSemanticVariant",
+    "kSimplifiedVariant",
+    "kSpecializedSemanticVariant",
+    "kTraditionalVariant",
+    "kZVariant",
+]
+
+#: Fields holding readings (pronunciations)
+UNIHAN_READING_FIELDS: list[str] = [
+    "kCantonese",
+    "kHangul",
+    "kHanyuPinlu",
+    "kHanyuPinyin",
+    "kJapaneseKun",
+    "kJapaneseOn",
+    "kKorean",
+    "kMandarin",
+    "kTang",
+    "kVietnamese",
+    "kXHC1983",
+]
+
+#: Columns bootstrap indexes. ``ucn`` and ``codepoint`` get a plain index, the
+#: fields and integer columns partial indexes over the rows holding a value,
+#: which serve ``IS NOT NULL`` filters, equality lookups and ranges while
+#: skipping the (many) empty rows.
+UNIHAN_INDEXES: tuple[str, ...] = (
+    "ucn",
+    "codepoint",
+    "total_strokes",
+    "primary_numeric",
+    "accounting_numeric",
+    "other_numeric",
+    "grade_level",
+    *UNIHAN_VARIANT_FIELDS,
+    *UNIHAN_READING_FIELDS,
+)
+
+#: First and last code point of the Unicode blocks holding UNIHAN characters
+UNIHAN_BLOCKS: dict[str, tuple[int, int]] = {
+    "CJK Unified Ideographs Extension A": (0x3400, 0x4DBF),
+    "CJK Unified Ideographs": (0x4E00, 0x9FFF),
+    "CJK Compatibility Ideographs": (0xF900, 0xFAFF),
+    "CJK Unified Ideographs Extension B": (0x20000, 0x2A6DF),
+    "CJK Unified Ideographs Extension C": (0x2A700, 0x2B73F),
+    "CJK Unified Ideographs Extension D": (0x2B740, 0x2B81F),
+    "CJK Unified Ideographs Extension E": (0x2B820, 0x2CEAF),
+    "CJK Unified Ideographs Extension F": (0x2CEB0, 0x2EBEF),
+    "CJK Unified Ideographs Extension I": (0x2EBF0, 0x2EE5F),
+    "CJK Compatibility Ideographs Supplement": (0x2F800, 0x2FA1F),
+    "CJK Unified Ideographs Extension G": (0x30000, 0x3134F),
+    "CJK Unified Ideographs Extension H": (0x31350, 0x323AF),
+    "CJK Unified Ideographs Extension J": (0x323B0, 0x3347F),
+}
+
+#: Most characters bound into a single ``IN (...)`` clause by batched lookups.
+#: SQLite releases before 3.32 cap a statement at 999 host parameters.
+LOOKUP_CHUNK_SIZE = 999
+
+#: UNIHAN lines bootstrap inserts per ``executemany``, bounding its memory use
+BOOTSTRAP_CHUNK_SIZE = 10_000
+
+#: Bytes of a UNIHAN file each bootstrap worker process parses at a time
+BOOTSTRAP_SHARD_SIZE = 4 * 1024 * 1024
+
 #: Default settings passed to unihan-etl
 UNIHAN_ETL_DEFAULT_OPTIONS = {
     "input_files": UNIHAN_FILES,
@@ -2,21 +2,131 @@
 
 from __future__ import annotations
 
+import re
 import typing as t
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.sql.schema import Column
 
-from cihai.conversion import parse_untagged, parse_vars
+from cihai.cache import FromCache
+from cihai.conversion import (
+    normalize_reading,
+    parse_untagged,
+    parse_vars,
+    ucn_to_codepoint,
+)
 from cihai.extend import Dataset, DatasetPlugin, SQLAlchemyMixin
+from cihai.utils import chunked
 
 from . import bootstrap
+from .checkpoint import unihan_checkpoint_dir
+from .constants import (
+    LOOKUP_CHUNK_SIZE,
+    UNIHAN_BLOCKS,
+    UNIHAN_INDEXES,
+    UNIHAN_READING_FIELDS,
+)
 
 if t.TYPE_CHECKING:
+    import pathlib
+
+    from sqlalchemy.engine import Result
+    from sqlalchemy.orm.interfaces import LoaderOption
     from sqlalchemy.orm.query import Query
+    from sqlalchemy.sql import Select
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlalchemy.sql.schema import Table
 
+    from .instrument import BootstrapHooks, BootstrapReport
+
+#: How :meth:`Unihan.reverse_char` matches hints against field values
+ReverseMatch: t.TypeAlias = t.Literal["substring", "token", "prefix"]
+REVERSE_MATCHES: tuple[ReverseMatch, ...] = t.get_args(ReverseMatch)
+
+#: Value, or inclusive ``(low, high)`` bounds, of :meth:`Unihan.lookup_numeric`
+NumericRange: t.TypeAlias = int | tuple[int | None, int | None]
+
+#: How :meth:`Unihan.lookup_reading` matches a reading
+ReadingMatch: t.TypeAlias = t.Literal["exact", "toneless", "prefix"]
+READING_MATCHES: tuple[ReadingMatch, ...] = t.get_args(ReadingMatch)
+
+
+def hint_pattern(hint: str, match: ReverseMatch) -> str:
+    """Return a case-insensitive regular expression for a reverse lookup hint.
+
+    Parameters
+    ----------
+    hint : str
+        string to lookup
+    match : "substring" | "token" | "prefix"
+        see :meth:`Unihan.reverse_char`
+
+    Returns
+    -------
+    str :
+        pattern for :func:`re.search`
+
+    Examples
+    --------
+    >>> bool(re.search(hint_pattern("wood", "token"), "Wood, timber"))
+    True
+    >>> bool(re.search(hint_pattern("wood", "token"), "plywood"))
+    False
+    >>> bool(re.search(hint_pattern("wood", "prefix"), "woodland"))
+    True
+    """
+    pattern = re.escape(hint)
+    if match != "substring":
+        pattern = rf"(?<!\w){pattern}"
+    if match == "token":
+        pattern = rf"{pattern}(?!\w)"
+    return f"(?i){pattern}"
+
+
+def to_codepoint(value: int | str) -> int:
+    """Return code point of an int, a character or a UCN.
+
+    Examples
+    --------
+    >>> to_codepoint("U+3400"), to_codepoint("㐀"), to_codepoint(0x3400)
+    (13312, 13312, 13312)
+    """
+    if isinstance(value, int):
+        return value
+    if len(value) == 1:
+        return ord(value)
+    return ucn_to_codepoint(value)
+
+
+def block_name(char: int | str) -> str | None:
+    """Return name of the UNIHAN Unicode block holding ``char``.
+
+    Parameters
+    ----------
+    char : int | str
+        code point, character or UCN
+
+    Returns
+    -------
+    str | None :
+        key of :data:`~cihai.data.unihan.constants.UNIHAN_BLOCKS`, None if
+        ``char`` is outside them
+
+    Examples
+    --------
+    >>> block_name("㐀")
+    'CJK Unified Ideographs Extension A'
+    >>> block_name("a") is None
+    True
+    """
+    codepoint = to_codepoint(char)
+    for name, (start, end) in UNIHAN_BLOCKS.items():
+        if start <= codepoint <= end:
+            return name
+    return None
+
 
 class Unihan(Dataset, SQLAlchemyMixin):
     """UNIHAN Dataset for cihai."""
@@ -28,41 +138,430 @@ class Unihan(Dataset, SQLAlchemyMixin):
     tagged_vars: Callable[[str], Iterator[tuple[str, str | None]]]
     untagged_vars: Callable[[str], Iterator[t.Any]]
 
-    def bootstrap(self, options: dict[str, object] | None = None) -> None:
-        """Fetch, extract, import UNIHAN to DB, and initialize DB mapping."""
+    #: Columns indexed at bootstrap, see
+    #: :func:`~cihai.data.unihan.bootstrap.create_unihan_indexes`
+    indexes: tuple[str, ...] = UNIHAN_INDEXES
+
+    #: :attr:`generation` the database was last reflected at, see :meth:`refresh`
+    _generation: int = 0
+
+    def bootstrap(
+        self,
+        options: dict[str, object] | None = None,
+        fts: bool = False,
+        update: bool = False,
+        workers: int = 1,
+        snapshot: str | pathlib.Path | None = None,
+        hooks: BootstrapHooks | None = None,
+        resume: bool = True,
+    ) -> BootstrapReport:
+        """Fetch, extract, import UNIHAN to DB, and initialize DB mapping.
+
+        Parameters
+        ----------
+        options : dict | None
+            unihan-etl options
+        fts : bool
+            Build the full-text index :meth:`reverse_char` searches, see
+            :func:`cihai.data.unihan.bootstrap.create_unihan_fts`.
+        update : bool
+            Download UNIHAN again, even if cached, and refresh an imported
+            UNIHAN in place, writing only the rows that changed, e.g. to move
+            to a new Unicode release.
+        workers : int
+            Processes parsing the UNIHAN files, e.g. :func:`os.cpu_count`.
+        snapshot : str | pathlib.Path | None
+            Install UNIHAN from this snapshot, in place of downloading and
+            parsing it, if not imported yet. See
+            :mod:`cihai.data.unihan.snapshot`.
+        hooks : :class:`~cihai.data.unihan.instrument.BootstrapHooks` | None
+            Receive the timing and progress of each phase, logged if None.
+        resume : bool
+            Checkpoint the steps completed under ``unihan/`` in the ``cache``
+            directory of the ``dirs`` config, and resume an interrupted
+            bootstrap from them. See :mod:`cihai.data.unihan.checkpoint`.
+
+        Returns
+        -------
+        :class:`~cihai.data.unihan.instrument.BootstrapReport` :
+            rows the import changed, and time taken by each phase
+        """
         if options is None:
             options = {}
 
-        bootstrap.bootstrap_unihan(
+        report = bootstrap.bootstrap_unihan(
             engine=self.sql.engine,
             metadata=self.sql.metadata,
             options=options,
+            fts=fts,
+            indexes=self.indexes,
+            update=update,
+            workers=workers,
+            snapshot=snapshot,
+            hooks=hooks,
+            checkpoint_dir=unihan_checkpoint_dir(self.sql.config) if resume else None,
         )
         self.sql.reflect_db()  # automap new table created during bootstrap
+        self._generation = self.generation
+        return report
+
+    def create_indexes(self) -> list[str]:
+        """Add missing :attr:`indexes` to an already imported UNIHAN table.
+
+        Returns
+        -------
+        list[str] :
+            names of the indexes created
+        """
+        created = bootstrap.create_unihan_indexes(
+            self.sql.engine,
+            self.sql.metadata,
+            self.indexes,
+        )
+        self.sql.reflect_db()
+        return created
+
+    def _columns(self, names: Iterable[str]) -> list[Column[t.Any]]:
+        """Return UNIHAN table columns by name.
+
+        Raises
+        ------
+        ValueError
+            if a name is not a UNIHAN column
+        """
+        columns = self.sql.metadata.tables[bootstrap.TABLE_NAME].columns
+        names = list(names)
+        unknown = [name for name in names if name not in columns]
+        if unknown:
+            msg = f"Unknown UNIHAN fields: {', '.join(unknown)}"
+            raise ValueError(msg)
+        return [columns[name] for name in names]
+
+    def _load_only(self, columns: list[str]) -> LoaderOption:
+        """Return ORM option loading only ``columns`` (and the primary key)."""
+        Unihan = self.sql.base.classes.Unihan
+        self._columns(columns)
+        return load_only(*(getattr(Unihan, column) for column in columns))
 
-    def lookup_char(self, char: str) -> Query[Unihan]:
+    def _query(self, columns: list[str] | None = None) -> Query[Unihan]:
+        """Return query of UNIHAN rows, answered from :attr:`cache` if set.
+
+        With ``columns``, only those columns (and the primary key) are loaded.
+        """
+        query = self.sql.session.query(self.sql.base.classes.Unihan)
+        if columns is not None:
+            query = query.options(self._load_only(columns))
+        if self.cache is not None:
+            query = query.options(FromCache(self.cache))
+        return query
+
+    def _select(
+        self,
+        columns: list[str] | None,
+        *criteria: ColumnElement[bool],
+        order_by: Column[t.Any] | None = None,
+    ) -> Result[t.Any]:
+        """Return ``columns`` of UNIHAN rows matching ``criteria`` as plain rows.
+
+        Runs through SQLAlchemy Core, without building ORM objects.
+        """
+        table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+        selected = table.columns if columns is None else self._columns(columns)
+        statement = select(*selected).where(*criteria).order_by(order_by)
+        if self.cache is not None:
+            statement = statement.options(FromCache(self.cache))
+        return self.sql.session.execute(statement)
+
+    @t.overload
+    def lookup_char(
+        self,
+        char: str,
+        columns: list[str] | None = ...,
+        raw: t.Literal[False] = ...,
+    ) -> Query[Unihan]: ...
+
+    @t.overload
+    def lookup_char(
+        self,
+        char: str,
+        columns: list[str] | None = ...,
+        *,
+        raw: t.Literal[True],
+    ) -> Result[t.Any]: ...
+
+    def lookup_char(
+        self,
+        char: str,
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Query[Unihan] | Result[t.Any]:
         """Return character information from datasets.
 
         Parameters
         ----------
         char : str
             character / string to lookup
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            return :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects
 
         Returns
         -------
-        :class:`sqlalchemy.orm.query.Query` :
-            list of matches
+        :class:`sqlalchemy.orm.query.Query` | :class:`sqlalchemy.engine.Result` :
+            list of matches, a :class:`~sqlalchemy.engine.Result` if ``raw``
         """
+        if raw:
+            return self._select(columns, Column("char") == char)
+        return self._query(columns).filter_by(char=char)
+
+    def lookup_chars(
+        self,
+        chars: str | Iterable[str],
+        columns: list[str] | None = None,
+    ) -> dict[str, Unihan | None]:
+        """Return character information for many characters at once.
+
+        Characters are deduplicated and fetched with ``IN (...)`` queries of at
+        most :data:`~cihai.data.unihan.constants.LOOKUP_CHUNK_SIZE` characters,
+        rather than one query per character. Each query is answered from
+        :attr:`cache` if set, like the other lookups.
+
+        Parameters
+        ----------
+        chars : str | Iterable[str]
+            text, or an iterable of characters, to lookup
+        columns : list[str] | None
+            columns to load, all columns if None
+
+        Returns
+        -------
+        dict[str, Unihan | None] :
+            mapping of each distinct character, in order of first appearance,
+            to its row. Characters not in the database map to ``None``.
+        """
+        results: dict[str, Unihan | None] = dict.fromkeys(chars)
         Unihan = self.sql.base.classes.Unihan
-        return self.sql.session.query(Unihan).filter_by(char=char)
+        for chunk in chunked(list(results), LOOKUP_CHUNK_SIZE):
+            for row in self._query(columns).filter(Unihan.char.in_(chunk)):
+                results[row.char] = row
+        return results
 
-    def reverse_char(self, hints: str | list[str]) -> Query[Unihan]:
+    @t.overload
+    def lookup_range(
+        self,
+        start: int | str,
+        end: int | str,
+        columns: list[str] | None = ...,
+        raw: t.Literal[False] = ...,
+    ) -> Query[Unihan]: ...
+
+    @t.overload
+    def lookup_range(
+        self,
+        start: int | str,
+        end: int | str,
+        columns: list[str] | None = ...,
+        *,
+        raw: t.Literal[True],
+    ) -> Result[t.Any]: ...
+
+    def lookup_range(
+        self,
+        start: int | str,
+        end: int | str,
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Query[Unihan] | Result[t.Any]:
+        """Return characters from ``start`` to ``end`` inclusive, by code point.
+
+        Runs as a range scan of the ``codepoint`` index.
+
+        Parameters
+        ----------
+        start : int | str
+            first code point, as an int, a character or a UCN like ``U+3400``
+        end : int | str
+            last code point, in the same forms
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            return :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects
+
+        Returns
+        -------
+        :class:`sqlalchemy.orm.query.Query` | :class:`sqlalchemy.engine.Result` :
+            matches in code point order, a :class:`~sqlalchemy.engine.Result` if
+            ``raw``
+        """
+        codepoint = self.sql.metadata.tables[bootstrap.TABLE_NAME].c[
+            bootstrap.CODEPOINT_COLUMN
+        ]
+        criteria = codepoint.between(to_codepoint(start), to_codepoint(end))
+        if raw:
+            return self._select(columns, criteria, order_by=codepoint)
+        return self._query(columns).filter(criteria).order_by(codepoint)
+
+    @t.overload
+    def lookup_numeric(
+        self,
+        ranges: dict[str, NumericRange],
+        columns: list[str] | None = ...,
+        raw: t.Literal[False] = ...,
+    ) -> Query[Unihan]: ...
+
+    @t.overload
+    def lookup_numeric(
+        self,
+        ranges: dict[str, NumericRange],
+        columns: list[str] | None = ...,
+        *,
+        raw: t.Literal[True],
+    ) -> Result[t.Any]: ...
+
+    def lookup_numeric(
+        self,
+        ranges: dict[str, NumericRange],
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Query[Unihan] | Result[t.Any]:
+        """Return characters whose integer columns are in ``ranges``.
+
+        The columns are :data:`~cihai.data.unihan.bootstrap.NUMERIC_COLUMNS`,
+        e.g. ``total_strokes`` from ``kTotalStrokes``. Each range runs as a range
+        scan of the column's index:
+
+        .. code-block:: python
+
+            c.unihan.lookup_numeric({"total_strokes": (5, 8)})
+            c.unihan.lookup_numeric({"primary_numeric": (101, None)})
+
+        Parameters
+        ----------
+        ranges : dict[str, int | tuple[int | None, int | None]]
+            value, or inclusive ``(low, high)`` bounds, None leaving that end
+            open, by column
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            return :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects
+
+        Returns
+        -------
+        :class:`sqlalchemy.orm.query.Query` | :class:`sqlalchemy.engine.Result` :
+            matches in code point order, a :class:`~sqlalchemy.engine.Result` if
+            ``raw``
+
+        Raises
+        ------
+        ValueError
+            if a column is not one of the integer columns
+        """
+        unknown = [name for name in ranges if name not in bootstrap.NUMERIC_COLUMNS]
+        if unknown:
+            msg = f"Not UNIHAN integer columns: {', '.join(unknown)}"
+            raise ValueError(msg)
+
+        table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+        criteria: list[ColumnElement[bool]] = []
+        for name, bounds in ranges.items():
+            column = table.c[name]
+            low, high = (bounds, bounds) if isinstance(bounds, int) else bounds
+            if low is not None:
+                criteria.append(column >= low)
+            if high is not None:
+                criteria.append(column <= high)
+            if low is None and high is None:
+                criteria.append(column.isnot(None))
+        codepoint = table.c[bootstrap.CODEPOINT_COLUMN]
+        if raw:
+            return self._select(columns, *criteria, order_by=codepoint)
+        return self._query(columns).filter(*criteria).order_by(codepoint)
+
+    @t.overload
+    def lookup_block(
+        self,
+        block: str,
+        columns: list[str] | None = ...,
+        raw: t.Literal[False] = ...,
+    ) -> Query[Unihan]: ...
+
+    @t.overload
+    def lookup_block(
+        self,
+        block: str,
+        columns: list[str] | None = ...,
+        *,
+        raw: t.Literal[True],
+    ) -> Result[t.Any]: ...
+
+    def lookup_block(
+        self,
+        block: str,
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Query[Unihan] | Result[t.Any]:
+        """Return the characters of a Unicode block, by code point.
+
+        Parameters
+        ----------
+        block : str
+            block name, a key of
+            :data:`~cihai.data.unihan.constants.UNIHAN_BLOCKS`, e.g.
+            ``CJK Unified Ideographs Extension A``
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            return :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects
+
+        Returns
+        -------
+        :class:`sqlalchemy.orm.query.Query` | :class:`sqlalchemy.engine.Result` :
+            see :meth:`lookup_range`
+
+        Raises
+        ------
+        ValueError
+            if ``block`` is not a UNIHAN block
+        """
+        if block not in UNIHAN_BLOCKS:
+            msg = f"Unknown UNIHAN block: {block!r}"
+            raise ValueError(msg)
+        start, end = UNIHAN_BLOCKS[block]
+        if raw:
+            return self.lookup_range(start, end, columns, raw=True)
+        return self.lookup_range(start, end, columns)
+
+    def reverse_char(
+        self,
+        hints: str | list[str],
+        fields: list[str] | None = None,
+        match: ReverseMatch = "substring",
+    ) -> Query[Unihan]:
         """Return QuerySet of objects from SQLAlchemy of results.
 
+        Rows match if any of ``fields`` matches any of the hints, ignoring case,
+        of non-ASCII letters too. When the full-text indexes are installed
+        (:attr:`has_fts`), matches come from the index, most relevant first.
+        Otherwise the columns are scanned, by regular expression for hints
+        with non-ASCII characters.
+
         Parameters
         ----------
         hints : str | list[str]
             strings to lookup
+        fields : list[str] | None
+            columns to search, e.g. ``["kDefinition"]``. All text columns if
+            None.
+        match : "substring" | "token" | "prefix"
+            ``substring`` matches hints anywhere, so ``wood`` matches
+            ``plywood``. ``token`` matches whole words only, ``prefix`` words
+            starting with the hint. Substring searches of hints shorter than
+            :data:`~cihai.data.unihan.bootstrap.FTS_MIN_HINT_LENGTH` always scan.
 
         Returns
         -------
@@ -71,32 +570,321 @@ class Unihan(Dataset, SQLAlchemyMixin):
         """
         if isinstance(hints, str):
             hints = [hints]
+        if match not in REVERSE_MATCHES:
+            msg = f"match must be one of {', '.join(REVERSE_MATCHES)}, not {match!r}"
+            raise ValueError(msg)
+
+        columns = bootstrap.text_columns(self.sql.metadata.tables[bootstrap.TABLE_NAME])
+        if fields is not None:
+            text = {column.name for column in columns}
+            columns = self._columns(fields)
+            not_text = [column.name for column in columns if column.name not in text]
+            if not_text:
+                msg = f"UNIHAN fields are not text: {', '.join(not_text)}"
+                raise ValueError(msg)
+
+        if match == "substring":
+            fts_table = bootstrap.FTS_TABLE_NAME
+            use_fts = all(len(h) >= bootstrap.FTS_MIN_HINT_LENGTH for h in hints)
+        else:
+            fts_table = bootstrap.FTS_TOKENS_TABLE_NAME
+            use_fts = True
+
+        if hints and use_fts and fts_table in self.sql.metadata.tables:
+            matches = bootstrap.fts_match(
+                hints,
+                fields=fields,
+                fts_table=fts_table,
+                prefix=match == "prefix",
+            )
+            table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+            return (
+                self._query()
+                .join(
+                    matches,
+                    table.c[bootstrap.CODEPOINT_COLUMN] == matches.c.rowid,
+                )
+                .order_by(matches.c.rank)
+            )
+
+        # LIKE ignores the case of ASCII letters only, the regexp of any letter
+        clauses = [
+            column.contains(hint)
+            if match == "substring" and hint.isascii()
+            else column.regexp_match(hint_pattern(hint, match))
+            for column in columns
+            for hint in hints
+        ]
+        return self._query().filter(or_(*clauses))
 
+    def by_radical(
+        self,
+        radical: int,
+        strokes: int | None = None,
+        simplified: bool | None = None,
+    ) -> Query[Unihan]:
+        """Return characters under a Kangxi radical, as dictionaries list them.
+
+        Runs as a seek of the radical/stroke index of ``kRSUnicode``, see
+        :func:`~cihai.data.unihan.bootstrap.create_unihan_radical_table`.
+
+        Parameters
+        ----------
+        radical : int
+            Kangxi radical number, 1 to 214
+        strokes : int | None
+            residual strokes, beyond the radical, all if None
+        simplified : bool | None
+            only characters listed under the simplified form of the radical if
+            True, e.g. 纟 for 120 糸, its traditional form if False, either if
+            None
+
+        Returns
+        -------
+        :class:`sqlalchemy.orm.query.Query` :
+            characters by residual strokes, then code point, each once
+        """
+        radicals = self.sql.metadata.tables[bootstrap.RADICAL_TABLE_NAME]
+
+        def criteria(table: t.Any) -> list[t.Any]:
+            clauses = [table.c.radical == radical]
+            if strokes is not None:
+                clauses.append(table.c.residual_strokes == strokes)
+            if simplified is not None:
+                clauses.append(
+                    table.c.simplified > 0 if simplified else table.c.simplified == 0,
+                )
+            return clauses
+
+        # A character may be listed under both forms of the radical, e.g.
+        # ``120'.3 120.5``: join only its entry with the fewest strokes
+        other = radicals.alias()
+        listed_before = (
+            select(other.c.char)
+            .where(
+                other.c.char == radicals.c.char,
+                *criteria(other),
+                or_(
+                    other.c.residual_strokes < radicals.c.residual_strokes,
+                    and_(
+                        other.c.residual_strokes == radicals.c.residual_strokes,
+                        other.c.simplified < radicals.c.simplified,
+                    ),
+                ),
+            )
+            .exists()
+        )
         Unihan = self.sql.base.classes.Unihan
-        columns = Unihan.__table__.columns
-        return self.sql.session.query(Unihan).filter(
-            or_(*[column.contains(hint) for column in columns for hint in hints]),
+        return (
+            self._query()
+            .join(radicals, radicals.c.char == Unihan.char)
+            .filter(*criteria(radicals), ~listed_before)
+            .order_by(
+                radicals.c.residual_strokes, radicals.c[bootstrap.CODEPOINT_COLUMN]
+            )
+        )
+
+    def lookup_reading(
+        self,
+        reading: str,
+        system: str | list[str] | None = None,
+        match: ReadingMatch = "exact",
+    ) -> Query[Unihan]:
+        """Return characters read ``reading``, from the indexed readings table.
+
+        Parameters
+        ----------
+        reading : str
+            reading to lookup, e.g. ``hǎo`` or ``hou2``
+        system : str | list[str] | None
+            reading fields to search, e.g. ``"kMandarin"`` or
+            ``["kCantonese"]``, all of
+            :data:`~cihai.data.unihan.constants.UNIHAN_READING_FIELDS` if None
+        match : "exact" | "toneless" | "prefix"
+            ``exact`` matches readings as written in UNIHAN, ``toneless``
+            ignores case and tones, marked or numbered, so ``hao`` matches
+            ``hǎo`` and ``hou`` matches ``hou2``. ``prefix`` matches toneless
+            readings starting with ``reading``.
+
+        Returns
+        -------
+        :class:`sqlalchemy.orm.query.Query` :
+            characters, by code point
+
+        Raises
+        ------
+        ValueError
+            if ``system`` is not a reading field or ``match`` is unknown
+        """
+        if isinstance(system, str):
+            system = [system]
+        if match not in READING_MATCHES:
+            msg = f"match must be one of {', '.join(READING_MATCHES)}, not {match!r}"
+            raise ValueError(msg)
+        if system is not None:
+            unknown = [s for s in system if s not in UNIHAN_READING_FIELDS]
+            if unknown:
+                msg = f"Not UNIHAN reading fields: {', '.join(unknown)}"
+                raise ValueError(msg)
+
+        readings = self.sql.metadata.tables[bootstrap.READING_TABLE_NAME]
+        if match == "exact":
+            criteria = [readings.c.reading == reading]
+        else:
+            normalized = normalize_reading(reading)
+            column = readings.c.reading_normalized
+            if match == "toneless":
+                criteria = [column == normalized]
+            else:  # a range, unlike LIKE, is served by the index everywhere
+                criteria = [column >= normalized]
+                if normalized:
+                    upper = normalized[:-1] + chr(ord(normalized[-1]) + 1)
+                    criteria.append(column < upper)
+        if system is not None:
+            criteria.append(readings.c.system.in_(system))
+
+        table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+        chars = select(readings.c.char).where(*criteria)
+        return (
+            self._query()
+            .filter(table.c.char.in_(chars))
+            .order_by(table.c[bootstrap.CODEPOINT_COLUMN])
         )
 
-    def with_fields(self, fields: list[str]) -> Query[Unihan]:
+    @t.overload
+    def with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = ...,
+        raw: t.Literal[False] = ...,
+    ) -> Query[Unihan]: ...
+
+    @t.overload
+    def with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = ...,
+        *,
+        raw: t.Literal[True],
+    ) -> Result[t.Any]: ...
+
+    def with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Query[Unihan] | Result[t.Any]:
         """Return list of characters with information for certain fields.
 
         Parameters
         ----------
         fields : list[str]
             fields for which information should be available
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            return :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects, e.g. ``columns=["char", field]`` to walk
+            one field of every character cheaply
 
         Returns
         -------
-        :class:`sqlalchemy.orm.query.Query` :
-            list of matches
+        :class:`sqlalchemy.orm.query.Query` | :class:`sqlalchemy.engine.Result` :
+            list of matches, a :class:`~sqlalchemy.engine.Result` if ``raw``
         """
-        Unihan = self.sql.base.classes.Unihan
-        query = self.sql.session.query(Unihan)
-        for field in fields:
-            query = query.filter(Column(field).isnot(None))
+        criteria = [Column(field).isnot(None) for field in fields]
+        if raw:
+            return self._select(columns, *criteria)
+        return self._query(columns).filter(*criteria)
+
+    def with_fields_statement(
+        self,
+        fields: list[str],
+        columns: list[str] | None = None,
+        raw: bool = False,
+    ) -> Select[t.Any]:
+        """Return statement selecting characters with information for ``fields``.
+
+        What :meth:`iter_with_fields` streams, for running elsewhere, e.g. on
+        an asyncio engine. Not cached.
+
+        Parameters
+        ----------
+        fields : list[str]
+            fields for which information should be available
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            select ``columns`` of the table instead of ORM objects
+
+        Returns
+        -------
+        :class:`sqlalchemy.sql.expression.Select`
+        """
+        criteria = [Column(field).isnot(None) for field in fields]
+        if raw:
+            table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+            selected = table.columns if columns is None else self._columns(columns)
+            return select(*selected).where(*criteria)
+
+        query = select(self.sql.base.classes.Unihan).where(*criteria)
+        if columns is not None:
+            query = query.options(self._load_only(columns))
         return query
 
+    def iter_with_fields(
+        self,
+        fields: list[str],
+        columns: list[str] | None = None,
+        raw: bool = False,
+        batch_size: int = 1000,
+    ) -> Iterator[t.Any]:
+        """Stream characters with information for certain fields.
+
+        Like :meth:`with_fields`, but rows are fetched ``batch_size`` at a
+        time and not kept in :attr:`cihai.db.Database.session`, so memory stays
+        flat however many rows match. Results are not cached.
+
+        ORM objects come from a private session and are detached once their
+        batch is done: read the ``columns`` you loaded, other attributes can no
+        longer be loaded on access.
+
+        Parameters
+        ----------
+        fields : list[str]
+            fields for which information should be available
+        columns : list[str] | None
+            columns to load, all columns if None
+        raw : bool
+            yield :class:`sqlalchemy.engine.Row` named tuples of ``columns``
+            instead of ORM objects
+        batch_size : int
+            rows fetched per round trip
+
+        Yields
+        ------
+        :class:`Unihan` | :class:`sqlalchemy.engine.Row`
+        """
+        statement = self.with_fields_statement(fields, columns, raw)
+        if raw:
+            with self.sql.engine.connect() as conn:
+                result = conn.execution_options(yield_per=batch_size).execute(
+                    statement,
+                )
+                for partition in result.partitions():
+                    yield from partition
+            return
+
+        with Session(self.sql.engine) as session:
+            rows = session.execute(
+                statement,
+                execution_options={"yield_per": batch_size},
+            )
+            for partition in rows.scalars().partitions():
+                yield from partition
+                for row in partition:
+                    session.expunge(row)
+
     @property
     def is_bootstrapped(self) -> bool:
         """Return True if UNIHAN and database is set up.
@@ -104,9 +892,81 @@ class Unihan(Dataset, SQLAlchemyMixin):
         Returns
         -------
         bool :
-            True if Unihan application fixture data installed.
+            True if Unihan application fixture data installed, with its
+            :attr:`indexes`.
         """
-        return bootstrap.is_bootstrapped(self.sql.metadata)
+        return bootstrap.is_bootstrapped(self.sql.metadata, indexes=self.indexes)
+
+    @property
+    def generation(self) -> int:
+        """Return generation of UNIHAN in the database.
+
+        Every bootstrap that changes UNIHAN increments it, see
+        :func:`cihai.data.unihan.bootstrap.get_unihan_generation`.
+        """
+        return bootstrap.get_unihan_generation(self.sql.engine)
+
+    def refresh(self) -> bool:
+        """Reflect the database again if UNIHAN changed since it was last seen.
+
+        Workers sharing a database with a bootstrapping process call this,
+        e.g. before each batch of lookups, to pick up the table it published.
+        Unchanged, it costs one single-row read.
+
+        Returns
+        -------
+        bool :
+            True if the database was reflected again, which also empties the
+            result cache
+        """
+        generation = self.generation
+        if generation == self._generation:
+            return False
+        self.sql.reflect_db()
+        self.sql.session.expire_all()
+        for plugin in vars(self).values():  # remap plugin methods
+            if isinstance(plugin, DatasetPlugin) and hasattr(plugin, "bootstrap"):
+                plugin.bootstrap()
+        self._generation = generation
+        return True
+
+    @property
+    def version(self) -> str | None:
+        """Return Unicode version of the UNIHAN imported.
+
+        Returns
+        -------
+        str | None :
+            e.g. ``'15.1.0'``, None if not bootstrapped, or bootstrapped before
+            versions were recorded
+        """
+        return bootstrap.get_unihan_version(self.sql.engine, self.sql.metadata)
+
+    @property
+    def has_fts(self) -> bool:
+        """Return True if the full-text indexes for :meth:`reverse_char` exist.
+
+        Returns
+        -------
+        bool :
+            True if :func:`~cihai.data.unihan.bootstrap.create_unihan_fts` ran.
+        """
+        return all(
+            name in self.sql.metadata.tables for name in bootstrap.FTS_TOKENIZERS
+        )
+
+
+class UnihanVariant(t.NamedTuple):
+    """Variant of a character, a row of :data:`~.bootstrap.VARIANT_TABLE_NAME`."""
+
+    #: Character the variant field is of
+    src: str
+    #: Variant character
+    dst: str
+    #: Variant field, e.g. ``kTraditionalVariant``
+    kind: str
+    #: Sources of the variant, e.g. ``kMatthews``, None if untagged
+    tag: str | None
 
 
 class UnihanVariants(DatasetPlugin, SQLAlchemyMixin):
@@ -126,3 +986,66 @@ class UnihanVariants(DatasetPlugin, SQLAlchemyMixin):
         if hasattr(self.sql.base.classes, "Unihan"):
             self.sql.base.classes.Unihan.tagged_vars = tagged_vars
             self.sql.base.classes.Unihan.untagged_vars = untagged_vars
+
+    def _variants(
+        self,
+        column: str,
+        char: str,
+        kinds: Iterable[str] | None,
+    ) -> list[UnihanVariant]:
+        """Return variants whose ``column`` is ``char``, of ``kinds`` if set."""
+        table = self.sql.metadata.tables[bootstrap.VARIANT_TABLE_NAME]
+        statement = select(
+            table.c.src,
+            table.c.dst,
+            table.c.kind,
+            table.c.tag,
+        ).where(table.c[column] == char)
+        if kinds is not None:
+            statement = statement.where(table.c.kind.in_(list(kinds)))
+        statement = statement.order_by(table.c.kind, table.c.src, table.c.dst)
+        return [UnihanVariant(*row) for row in self.sql.session.execute(statement)]
+
+    def lookup_variants(
+        self,
+        char: str,
+        kinds: Iterable[str] | None = None,
+    ) -> list[UnihanVariant]:
+        """Return variants of ``char``.
+
+        Parameters
+        ----------
+        char : str
+            character to lookup
+        kinds : Iterable[str] | None
+            variant fields to follow, e.g. ``["kTraditionalVariant"]``, all if
+            None
+
+        Returns
+        -------
+        list[:class:`UnihanVariant`] :
+            variants, by kind
+        """
+        return self._variants("src", char, kinds)
+
+    def reverse_variants(
+        self,
+        char: str,
+        kinds: Iterable[str] | None = None,
+    ) -> list[UnihanVariant]:
+        """Return variants pointing to ``char``, e.g. its simplified forms.
+
+        Parameters
+        ----------
+        char : str
+            variant character to lookup
+        kinds : Iterable[str] | None
+            variant fields to follow, e.g. ``["kSimplifiedVariant"]``, all if
+            None
+
+        Returns
+        -------
+        list[:class:`UnihanVariant`] :
+            characters having ``char`` as variant, by kind
+        """
+        return self._variants("dst", char, kinds)
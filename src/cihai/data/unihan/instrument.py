@@ -0,0 +1,210 @@
+"""Timing and progress of UNIHAN bootstraps.
+
+:func:`~cihai.data.unihan.bootstrap.bootstrap_unihan` runs in phases,
+``snapshot``, ``upgrade``, ``download``, ``extract``, ``create``, ``parse``,
+``insert``, ``index``, ``publish`` and ``fts``, skipping those a bootstrap
+does not need. Each is reported to :class:`BootstrapHooks` as it starts,
+progresses and finishes, and summed up in the :class:`BootstrapReport` the
+bootstrap returns:
+
+.. code-block:: python
+
+    class Progress(BootstrapHooks):
+        def progress(self, name: str, rows: int, bytes_read: int) -> None:
+            print(f"{name}: {rows} rows")
+
+    report = c.unihan.bootstrap(options, hooks=Progress())
+    print(report.to_dict())
+
+Without hooks, :class:`LoggingBootstrapHooks` logs them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import sys
+import time
+import typing as t
+
+try:
+    import resource
+except ImportError:  # pragma: no cover, Windows
+    resource = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .bootstrap import UnihanDelta
+
+
+log = logging.getLogger(__name__)
+
+
+def peak_memory() -> int | None:
+    """Return peak resident memory of this process, in bytes.
+
+    Worker processes parsing UNIHAN are not counted.
+
+    Returns
+    -------
+    int | None :
+        high-water mark so far, None where the platform does not report it
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class BootstrapPhase(t.NamedTuple):
+    """Finished phase of a bootstrap."""
+
+    #: Phase, e.g. ``"parse"``
+    name: str
+    #: Wall time, in seconds
+    seconds: float
+    #: Rows, or UNIHAN values while parsing, processed
+    rows: int
+    #: Bytes read from files and downloads
+    bytes_read: int
+    #: :func:`peak_memory` when the phase finished
+    peak_memory: int | None
+
+
+class BootstrapReport(t.NamedTuple):
+    """Summary of a bootstrap, returned by ``Unihan.bootstrap()``.
+
+    See :meth:`cihai.data.unihan.dataset.Unihan.bootstrap`.
+    """
+
+    #: Rows the import changed, None if UNIHAN was imported and not updated
+    delta: UnihanDelta | None
+    #: Phases run, in order
+    phases: list[BootstrapPhase]
+
+    @property
+    def seconds(self) -> float:
+        """Return wall time of all phases, in seconds."""
+        return sum(phase.seconds for phase in self.phases)
+
+    def phase(self, name: str) -> BootstrapPhase | None:
+        """Return phase ``name``, None if it did not run."""
+        return next((p for p in self.phases if p.name == name), None)
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """Return report as JSON-serializable dict."""
+        return {
+            "delta": None if self.delta is None else self.delta._asdict(),
+            "seconds": self.seconds,
+            "phases": [phase._asdict() for phase in self.phases],
+        }
+
+
+class BootstrapHooks:
+    """Receives the phases of a bootstrap, override the methods needed."""
+
+    def phase_started(self, name: str) -> None:
+        """Phase ``name`` started."""
+
+    def progress(self, name: str, rows: int, bytes_read: int) -> None:
+        """Phase ``name`` processed ``rows`` and read ``bytes_read`` so far."""
+
+    def phase_finished(self, phase: BootstrapPhase) -> None:
+        """Phase finished."""
+
+
+class LoggingBootstrapHooks(BootstrapHooks):
+    """Log phases at INFO level, and their progress at DEBUG level.
+
+    Parameters
+    ----------
+    logger : :class:`logging.Logger`
+        logger to log to, this module's by default
+    """
+
+    def __init__(self, logger: logging.Logger = log) -> None:
+        self.logger = logger
+
+    def phase_started(self, name: str) -> None:
+        """Log start of phase ``name``."""
+        self.logger.debug("UNIHAN bootstrap %s started", name)
+
+    def progress(self, name: str, rows: int, bytes_read: int) -> None:
+        """Log progress of phase ``name``."""
+        self.logger.debug("UNIHAN bootstrap %s: %d rows", name, rows)
+
+    def phase_finished(self, phase: BootstrapPhase) -> None:
+        """Log timing and totals of ``phase``."""
+        self.logger.info(
+            "UNIHAN bootstrap %s took %.3fs: %d rows, %d bytes read, "
+            "peak memory %s bytes",
+            *phase,
+        )
+
+
+class PhaseProgress:
+    """Counters of a running phase, see :meth:`BootstrapRecorder.phase`."""
+
+    def __init__(self, name: str, hooks: BootstrapHooks) -> None:
+        self.name = name
+        self.hooks = hooks
+        self.rows = 0
+        self.bytes_read = 0
+
+    def advance(self, rows: int = 0, bytes_read: int = 0) -> None:
+        """Count ``rows`` and ``bytes_read`` more, and report progress."""
+        self.rows += rows
+        self.bytes_read += bytes_read
+        self.hooks.progress(self.name, self.rows, self.bytes_read)
+
+    def reporthook(
+        self,
+        count: int,
+        block_size: int,
+        total_size: int,
+        out: t.IO[str] = sys.stdout,
+    ) -> None:
+        """Count a downloaded block, for :func:`unihan_etl.core.download`."""
+        self.advance(bytes_read=block_size)
+
+
+class BootstrapRecorder:
+    """Time the phases of a bootstrap and pass them to ``hooks``.
+
+    Parameters
+    ----------
+    hooks : :class:`BootstrapHooks` | None
+        receive the phases, nothing does if None
+    """
+
+    def __init__(self, hooks: BootstrapHooks | None = None) -> None:
+        self.hooks = BootstrapHooks() if hooks is None else hooks
+        self.phases: list[BootstrapPhase] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[PhaseProgress]:
+        """Time phase ``name`` run in the block, recorded if it succeeds.
+
+        Yields
+        ------
+        :class:`PhaseProgress` :
+            counters of the phase
+        """
+        self.hooks.phase_started(name)
+        progress = PhaseProgress(name, self.hooks)
+        start = time.perf_counter()
+        yield progress
+        phase = BootstrapPhase(
+            name=name,
+            seconds=time.perf_counter() - start,
+            rows=progress.rows,
+            bytes_read=progress.bytes_read,
+            peak_memory=peak_memory(),
+        )
+        self.phases.append(phase)
+        self.hooks.phase_finished(phase)
+
+    def report(self, delta: UnihanDelta | None) -> BootstrapReport:
+        """Return report of the phases recorded, for a bootstrap changing ``delta``."""
+        return BootstrapReport(delta=delta, phases=list(self.phases))
@@ -0,0 +1,452 @@
+"""In-memory, read-only UNIHAN dataset for cihai.
+
+:class:`InMemoryUnihan` answers the lookups of
+:class:`~cihai.data.unihan.dataset.Unihan` without the ORM. On first use it
+loads the bootstrapped UNIHAN table once into :class:`UnihanColumns`, after
+which every lookup is a dict or array access in the current process.
+
+Select it in place of the SQL-backed dataset by pointing the ``unihan`` entry
+of the ``datasets`` config at ``cihai.data.unihan.memory.InMemoryUnihan``, or
+add it yourself:
+
+>>> from cihai.core import Cihai
+>>> c = Cihai(config={"database": {"url": "sqlite:///:memory:"}}, unihan=False)
+>>> c.add_dataset("cihai.data.unihan.memory.InMemoryUnihan", namespace="unihan")
+>>> c.unihan.is_bootstrapped
+False
+
+Memory budget
+-------------
+Each column is stored as an :class:`array.array` holding, per row, the id of the
+row's value in that column. Ids take 1, 2 or 4 bytes depending on how many
+distinct values the column has. Each distinct value is kept once, as an
+interned :class:`str`.
+
+For the ~98k rows and 35 columns of a full UNIHAN bootstrap the id arrays are
+at most ``98k * 35 * 4 B``, about 14 MB, and nearer 6 MB in practice, since
+only ``char``, ``ucn`` and a few free-text columns need more than 1 or 2 bytes
+per id. Distinct values, ``char`` and ``ucn`` included, measure ~0.2 KB per row
+on the test fixtures, and the codepoint index ~0.1 KB per row. Budget 50-60 MB
+per process for full UNIHAN. :attr:`UnihanColumns.nbytes` reports the figure
+for a loaded table.
+"""
+
+from __future__ import annotations
+
+import array
+import re
+import sys
+import typing as t
+
+import sqlalchemy
+
+from cihai import exc
+from cihai.conversion import parse_untagged, parse_vars
+from cihai.extend import Dataset, SQLAlchemyMixin
+
+from . import bootstrap
+from .checkpoint import unihan_checkpoint_dir
+from .dataset import REVERSE_MATCHES, hint_pattern
+
+if t.TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.sql.schema import Table
+
+    from .dataset import ReverseMatch
+    from .instrument import BootstrapHooks, BootstrapReport
+
+
+class UnihanNotBootstrappedError(exc.CihaiException):
+    """UNIHAN must be bootstrapped before it is loaded into memory."""
+
+    def __init__(self) -> None:
+        super().__init__("UNIHAN is not bootstrapped, run Unihan.bootstrap() first")
+
+
+def _typecode(count: int) -> str:
+    """Return the smallest :mod:`array` typecode holding ids below ``count``."""
+    if count <= 0xFF:
+        return "B"
+    if count <= 0xFFFF:
+        return "H"
+    return "I"
+
+
+class UnihanColumns:
+    """Read-only UNIHAN table stored column by column.
+
+    Parameters
+    ----------
+    columns : list[str]
+        column names, must include ``char``
+    records : Iterable[Sequence[str | int | None]]
+        rows, with values in the order of ``columns``
+    """
+
+    #: Column names
+    columns: list[str]
+
+    #: Distinct values of each column, indexed by value id. Id 0 is ``None``.
+    values: dict[str, list[str | int | None]]
+
+    #: Value id of each row, per column
+    ids: dict[str, array.array[int]]
+
+    #: Row number of each character, by codepoint
+    index: dict[int, int]
+
+    def __init__(
+        self,
+        columns: list[str],
+        records: Iterable[Sequence[str | int | None]],
+    ) -> None:
+        lookups: dict[str, dict[str | int | None, int]] = {
+            c: {None: 0} for c in columns
+        }
+        ids: dict[str, list[int]] = {c: [] for c in columns}
+        for record in records:
+            for column, value in zip(columns, record, strict=True):
+                lookup = lookups[column]
+                value_id = lookup.get(value)
+                if value_id is None:
+                    assert value is not None
+                    if isinstance(value, str):
+                        value = sys.intern(value)
+                    value_id = lookup[value] = len(lookup)
+                ids[column].append(value_id)
+
+        self.columns = columns
+        self.values = {c: list(lookup) for c, lookup in lookups.items()}
+        self.ids = {c: array.array(_typecode(len(lookups[c])), ids[c]) for c in columns}
+        self.index = {
+            ord(t.cast("str", self.value("char", row))): row for row in range(len(self))
+        }
+
+    @classmethod
+    def from_table(cls, engine: Engine, table: Table) -> UnihanColumns:
+        """Load UNIHAN from the database, in codepoint order.
+
+        :data:`~cihai.data.unihan.bootstrap.HASH_COLUMN` is left out, it only
+        serves re-bootstraps.
+
+        Parameters
+        ----------
+        engine : :class:`sqlalchemy.engine.Engine`
+        table : :class:`sqlalchemy.schema.Table`
+            bootstrapped UNIHAN table
+
+        Returns
+        -------
+        :class:`UnihanColumns`
+        """
+        columns = [c for c in table.columns if c.name != bootstrap.HASH_COLUMN]
+        query = sqlalchemy.select(*columns).order_by(
+            sqlalchemy.func.length(table.c.ucn),
+            table.c.ucn,
+        )
+        with engine.connect() as conn:
+            result = conn.execution_options(yield_per=1000).execute(query)
+            return cls([c.name for c in columns], result)
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self.ids["char"])
+
+    def value(self, column: str, row: int) -> str | int | None:
+        """Return the value of ``column`` in ``row``."""
+        return self.values[column][self.ids[column][row]]
+
+    def find(self, char: str) -> int | None:
+        """Return the row number of ``char``, None if it is not in the table."""
+        if len(char) != 1:
+            return None
+        return self.index.get(ord(char))
+
+    def select(self, column: str, predicate: Callable[[str], bool]) -> set[int]:
+        """Return the rows whose value in ``column`` satisfies ``predicate``.
+
+        ``predicate`` runs once per distinct value rather than once per row,
+        and only on string values.
+        """
+        matched = {
+            value_id
+            for value_id, value in enumerate(self.values[column])
+            if isinstance(value, str) and predicate(value)
+        }
+        if not matched:
+            return set()
+        return {
+            row for row, value_id in enumerate(self.ids[column]) if value_id in matched
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Return approximate memory held by the table, in bytes."""
+        size = sys.getsizeof(self.index)
+        for column in self.columns:
+            ids = self.ids[column]
+            size += sys.getsizeof(ids) + sys.getsizeof(self.values[column])
+            size += sum(sys.getsizeof(v) for v in self.values[column] if v is not None)
+        return size
+
+
+class UnihanRow:
+    """Row of :class:`UnihanColumns`, with each column as an attribute."""
+
+    __slots__ = ("_columns", "_row")
+
+    _columns: UnihanColumns
+    _row: int
+
+    def __init__(self, columns: UnihanColumns, row: int) -> None:
+        self._columns = columns
+        self._row = row
+
+    def __getattr__(self, name: str) -> str | int | None:
+        """Return the value of column ``name``."""
+        try:
+            return self._columns.value(name, self._row)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both refer to the same row of the same table."""
+        if not isinstance(other, UnihanRow):
+            return NotImplemented
+        return self._columns is other._columns and self._row == other._row
+
+    def __hash__(self) -> int:
+        """Return hash of the row's table and position."""
+        return hash((id(self._columns), self._row))
+
+    def __repr__(self) -> str:
+        """Representation of a UNIHAN row."""
+        return f"<UnihanRow {self.char} {self.ucn}>"
+
+    def tagged_vars(self, col: str) -> Iterator[tuple[str, str | None]]:
+        """Return a variant column as an iterator of (char, tag) tuples."""
+        return parse_vars(getattr(self, col))
+
+    def untagged_vars(self, col: str) -> Iterator[t.Any]:
+        """Return a variant column as an iterator of chars."""
+        return parse_untagged(getattr(self, col))
+
+
+class UnihanRows(list[UnihanRow]):
+    """List of :class:`UnihanRow`, with the result methods of a query."""
+
+    def first(self) -> UnihanRow | None:
+        """Return the first row, None if there are none."""
+        return self[0] if self else None
+
+    def all(self) -> list[UnihanRow]:
+        """Return the rows as a list."""
+        return list(self)
+
+
+class InMemoryUnihan(Dataset, SQLAlchemyMixin):
+    """UNIHAN Dataset for cihai, answered from memory.
+
+    Offers the lookups of :class:`~cihai.data.unihan.dataset.Unihan`, returning
+    :class:`UnihanRows` of :class:`UnihanRow` in place of queries. Results are
+    in codepoint order. Bootstrapping still goes through the database, which
+    the table is loaded from on first lookup.
+    """
+
+    _columns: UnihanColumns | None = None
+
+    def bootstrap(
+        self,
+        options: dict[str, object] | None = None,
+        fts: bool = False,
+        update: bool = False,
+        workers: int = 1,
+        snapshot: str | pathlib.Path | None = None,
+        hooks: BootstrapHooks | None = None,
+        resume: bool = True,
+    ) -> BootstrapReport:
+        """Fetch, extract, import UNIHAN to DB, and reload it on next lookup.
+
+        Parameters
+        ----------
+        options : dict | None
+            unihan-etl options
+        fts : bool
+            also build the full-text index used by the SQL-backed dataset
+        update : bool
+            refresh an imported UNIHAN in place, see
+            :meth:`cihai.data.unihan.dataset.Unihan.bootstrap`
+        workers : int
+            processes parsing the UNIHAN files
+        snapshot : str | pathlib.Path | None
+            install UNIHAN from this snapshot if not imported yet, see
+            :mod:`cihai.data.unihan.snapshot`
+        hooks : :class:`~cihai.data.unihan.instrument.BootstrapHooks` | None
+            receive the timing and progress of each phase, logged if None
+        resume : bool
+            resume an interrupted bootstrap, see
+            :meth:`cihai.data.unihan.dataset.Unihan.bootstrap`
+
+        Returns
+        -------
+        :class:`~cihai.data.unihan.instrument.BootstrapReport` :
+            rows the import changed, and time taken by each phase
+        """
+        if options is None:
+            options = {}
+
+        report = bootstrap.bootstrap_unihan(
+            engine=self.sql.engine,
+            metadata=self.sql.metadata,
+            options=options,
+            fts=fts,
+            update=update,
+            workers=workers,
+            snapshot=snapshot,
+            hooks=hooks,
+            checkpoint_dir=unihan_checkpoint_dir(self.sql.config) if resume else None,
+        )
+        self.sql.reflect_db()
+        self._columns = None
+        return report
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        """Return True if UNIHAN and database is set up."""
+        return bootstrap.is_bootstrapped(self.sql.metadata)
+
+    @property
+    def columns(self) -> UnihanColumns:
+        """Return the in-memory UNIHAN table, loading it on first access.
+
+        Raises
+        ------
+        UnihanNotBootstrappedError
+            if UNIHAN is not in the database yet
+        """
+        if self._columns is None:
+            if not self.is_bootstrapped:
+                raise UnihanNotBootstrappedError
+            self._columns = UnihanColumns.from_table(
+                self.sql.engine,
+                self.sql.metadata.tables[bootstrap.TABLE_NAME],
+            )
+        return self._columns
+
+    def _rows(self, rows: Iterable[int]) -> UnihanRows:
+        return UnihanRows(UnihanRow(self.columns, row) for row in rows)
+
+    def lookup_char(self, char: str) -> UnihanRows:
+        """Return character information from datasets.
+
+        Parameters
+        ----------
+        char : str
+            character / string to lookup
+
+        Returns
+        -------
+        :class:`UnihanRows` :
+            list of matches
+        """
+        row = self.columns.find(char)
+        return self._rows([] if row is None else [row])
+
+    def lookup_chars(self, chars: str | Iterable[str]) -> dict[str, UnihanRow | None]:
+        """Return character information for many characters at once.
+
+        Parameters
+        ----------
+        chars : str | Iterable[str]
+            text, or an iterable of characters, to lookup
+
+        Returns
+        -------
+        dict[str, UnihanRow | None] :
+            mapping of each distinct character, in order of first appearance,
+            to its row. Characters not in the database map to ``None``.
+        """
+        columns = self.columns
+        results: dict[str, UnihanRow | None] = {}
+        for char in chars:
+            if char not in results:
+                row = columns.find(char)
+                results[char] = None if row is None else UnihanRow(columns, row)
+        return results
+
+    def reverse_char(
+        self,
+        hints: str | list[str],
+        fields: list[str] | None = None,
+        match: ReverseMatch = "substring",
+    ) -> UnihanRows:
+        """Return rows with any of ``fields`` matching any of ``hints``.
+
+        Matches the same rows as
+        :meth:`~cihai.data.unihan.dataset.Unihan.reverse_char`.
+
+        Parameters
+        ----------
+        hints : str | list[str]
+            strings to lookup
+        fields : list[str] | None
+            columns to search, all columns if None
+        match : "substring" | "token" | "prefix"
+            see :meth:`~cihai.data.unihan.dataset.Unihan.reverse_char`
+
+        Returns
+        -------
+        :class:`UnihanRows` :
+            reverse matches
+        """
+        if isinstance(hints, str):
+            hints = [hints]
+        if match not in REVERSE_MATCHES:
+            msg = f"match must be one of {', '.join(REVERSE_MATCHES)}, not {match!r}"
+            raise ValueError(msg)
+
+        columns = self.columns
+        table = self.sql.metadata.tables[bootstrap.TABLE_NAME]
+        text = [column.name for column in bootstrap.text_columns(table)]
+        if fields is None:
+            fields = text
+        unknown = [field for field in fields if field not in columns.ids]
+        if unknown:
+            msg = f"Unknown UNIHAN fields: {', '.join(unknown)}"
+            raise ValueError(msg)
+        not_text = [field for field in fields if field not in text]
+        if not_text:
+            msg = f"UNIHAN fields are not text: {', '.join(not_text)}"
+            raise ValueError(msg)
+
+        patterns = [re.compile(hint_pattern(hint, match)) for hint in hints]
+
+        def predicate(value: str) -> bool:
+            return any(pattern.search(value) for pattern in patterns)
+
+        rows: set[int] = set()
+        for field in fields:
+            rows |= columns.select(field, predicate)
+        return self._rows(sorted(rows))
+
+    def with_fields(self, fields: list[str]) -> UnihanRows:
+        """Return list of characters with information for certain fields.
+
+        Parameters
+        ----------
+        fields : list[str]
+            fields for which information should be available
+
+        Returns
+        -------
+        :class:`UnihanRows` :
+            list of matches
+        """
+        columns = self.columns
+        ids = [columns.ids[field] for field in fields]
+        return self._rows(
+            row for row in range(len(columns)) if all(col[row] for col in ids)
+        )
@@ -0,0 +1,244 @@
+"""Prebuilt UNIHAN database snapshots, for bootstrapping without unihan-etl.
+
+A snapshot is a zip archive of the SQLite database of a previous bootstrap,
+``unihan.sqlite3``, and a ``manifest.json`` describing it. Build one once, e.g.
+in CI, with :func:`write_unihan_snapshot`, and ship it:
+
+.. code-block:: python
+
+    c.unihan.bootstrap(options)
+    write_unihan_snapshot(c.sql.engine, "unihan-snapshot.zip")
+
+Bootstrapping from it streams the database out of the archive and copies it in
+with SQLite's backup API, skipping download, extraction and parsing:
+
+.. code-block:: python
+
+    c.unihan.bootstrap(snapshot="unihan-snapshot.zip")
+
+The manifest is checked before anything is installed, see
+:func:`read_unihan_snapshot_manifest`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import sqlite3
+import tempfile
+import typing as t
+import zipfile
+
+import sqlalchemy
+
+from cihai import exc
+
+from . import bootstrap
+from .constants import UNIHAN_FIELDS
+
+if t.TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+
+#: Archive member holding the manifest
+MANIFEST_NAME = "manifest.json"
+
+#: Archive member holding the SQLite database
+DATABASE_NAME = "unihan.sqlite3"
+
+#: Bytes read and written at a time while streaming the database
+COPY_BUFSIZE = 1024 * 1024
+
+
+class UnihanSnapshotError(exc.CihaiException):
+    """UNIHAN snapshot cannot be written, or is not fit to install."""
+
+
+class SnapshotManifest(t.NamedTuple):
+    """Description of a UNIHAN snapshot, stored in its ``manifest.json``."""
+
+    #: :data:`~cihai.data.unihan.bootstrap.SCHEMA_VERSION` of the UNIHAN table
+    schema_version: int
+    #: Unicode version of the UNIHAN imported, None if not recorded
+    unihan_version: str | None
+    #: Field columns of the UNIHAN table, sorted
+    fields: list[str]
+    #: Rows of the UNIHAN table
+    rows: int
+    #: SHA-256 of the database, hex
+    sha256: str
+
+
+def _require_sqlite(engine: Engine) -> None:
+    if engine.dialect.name != "sqlite":
+        msg = f"UNIHAN snapshots are SQLite databases, not {engine.dialect.name}"
+        raise UnihanSnapshotError(msg)
+
+
+def write_unihan_snapshot(
+    engine: Engine,
+    path: str | pathlib.Path,
+) -> SnapshotManifest:
+    """Write the bootstrapped UNIHAN database to a snapshot archive.
+
+    The whole database is copied, with SQLite's backup API, so it holds the
+    UNIHAN table with its indexes and full-text index, if built.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+        SQLite database UNIHAN was bootstrapped into
+    path : str | pathlib.Path
+        archive to write
+
+    Returns
+    -------
+    :class:`SnapshotManifest`
+
+    Raises
+    ------
+    UnihanSnapshotError
+        if the database is not SQLite, or UNIHAN is not bootstrapped in it
+    """
+    _require_sqlite(engine)
+    metadata = sqlalchemy.MetaData()
+    metadata.reflect(engine)
+    if not bootstrap.is_bootstrapped(metadata):
+        msg = "UNIHAN must be bootstrapped before it is snapshotted"
+        raise UnihanSnapshotError(msg)
+    table = metadata.tables[bootstrap.TABLE_NAME]
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(table),
+        ).scalar_one()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = pathlib.Path(tmp_dir) / DATABASE_NAME
+        target = sqlite3.connect(database)
+        raw = engine.raw_connection()
+        try:
+            raw.driver_connection.backup(target)  # type: ignore[union-attr]
+        finally:
+            raw.close()
+            target.close()
+
+        digest = hashlib.sha256()
+        with (
+            zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+            database.open("rb") as source,
+            archive.open(DATABASE_NAME, "w", force_zip64=True) as member,
+        ):
+            while chunk := source.read(COPY_BUFSIZE):
+                digest.update(chunk)
+                member.write(chunk)
+
+        manifest = SnapshotManifest(
+            schema_version=bootstrap.SCHEMA_VERSION,
+            unihan_version=bootstrap.get_unihan_version(engine, metadata),
+            fields=[c.name for c in bootstrap.hashed_columns(table)],
+            rows=rows,
+            sha256=digest.hexdigest(),
+        )
+        with zipfile.ZipFile(path, "a", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest._asdict(), indent=2))
+    return manifest
+
+
+def read_unihan_snapshot_manifest(path: str | pathlib.Path) -> SnapshotManifest:
+    """Return manifest of a snapshot, checked against this version of cihai.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        snapshot archive
+
+    Returns
+    -------
+    :class:`SnapshotManifest`
+
+    Raises
+    ------
+    UnihanSnapshotError
+        if the archive has no readable manifest, or was built for another
+        :data:`~cihai.data.unihan.bootstrap.SCHEMA_VERSION` or other UNIHAN
+        fields
+    """
+    try:
+        with zipfile.ZipFile(path) as archive:
+            manifest = SnapshotManifest(**json.loads(archive.read(MANIFEST_NAME)))
+    except (OSError, KeyError, TypeError, ValueError, zipfile.BadZipFile) as e:
+        msg = f"{path} is not a UNIHAN snapshot: {e}"
+        raise UnihanSnapshotError(msg) from e
+
+    if manifest.schema_version != bootstrap.SCHEMA_VERSION:
+        msg = (
+            f"Snapshot schema version {manifest.schema_version} does not match "
+            f"{bootstrap.SCHEMA_VERSION}"
+        )
+        raise UnihanSnapshotError(msg)
+    if manifest.fields != sorted(UNIHAN_FIELDS):
+        missing = sorted(set(UNIHAN_FIELDS) - set(manifest.fields))
+        extra = sorted(set(manifest.fields) - set(UNIHAN_FIELDS))
+        msg = f"Snapshot fields differ, missing: {missing}, extra: {extra}"
+        raise UnihanSnapshotError(msg)
+    return manifest
+
+
+def install_unihan_snapshot(
+    engine: Engine,
+    path: str | pathlib.Path,
+) -> SnapshotManifest:
+    """Install a snapshot into an empty SQLite database.
+
+    The database is decompressed to a temporary file, in chunks, and its
+    checksum compared with the manifest before it is copied in with SQLite's
+    backup API.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+        SQLite database to install into, holding no tables
+    path : str | pathlib.Path
+        snapshot archive
+
+    Returns
+    -------
+    :class:`SnapshotManifest`
+
+    Raises
+    ------
+    UnihanSnapshotError
+        if the snapshot fails :func:`read_unihan_snapshot_manifest` or its
+        checksum, or the database is not an empty SQLite database
+    """
+    manifest = read_unihan_snapshot_manifest(path)
+    _require_sqlite(engine)
+    with engine.connect() as conn:
+        if sqlalchemy.inspect(conn).get_table_names():
+            msg = "UNIHAN snapshots install into an empty database only"
+            raise UnihanSnapshotError(msg)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = pathlib.Path(tmp_dir) / DATABASE_NAME
+        digest = hashlib.sha256()
+        with (
+            zipfile.ZipFile(path) as archive,
+            archive.open(DATABASE_NAME) as member,
+            database.open("wb") as target,
+        ):
+            while chunk := member.read(COPY_BUFSIZE):
+                digest.update(chunk)
+                target.write(chunk)
+        if digest.hexdigest() != manifest.sha256:
+            msg = f"Snapshot database checksum does not match manifest: {path}"
+            raise UnihanSnapshotError(msg)
+
+        source = sqlite3.connect(database)
+        raw = engine.raw_connection()
+        try:
+            source.backup(raw.driver_connection)  # type: ignore[arg-type]
+        finally:
+            raw.close()
+            source.close()
+    return manifest
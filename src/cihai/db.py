@@ -2,21 +2,343 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import logging
+import pathlib
 import typing as t
 
-from sqlalchemy import MetaData, create_engine
+import sqlalchemy
+from sqlalchemy import MetaData, create_engine, make_url
 from sqlalchemy.ext.automap import automap_base
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from cihai.cache import LRUCache
 
 if t.TYPE_CHECKING:
-    from sqlalchemy.engine import Engine
+    from collections.abc import Callable, Iterator
+
+    from sqlalchemy.engine import Dialect, Engine
     from sqlalchemy.ext.automap import AutomapBase
 
     from cihai.types import ConfigDict
 
 
+log = logging.getLogger(__name__)
+
+#: Bumped when the layout of reflection caches changes, invalidating them
+REFLECTION_CACHE_VERSION = 2
+
+#: ``database`` config keys passed on to :func:`sqlalchemy.create_engine`
+ENGINE_OPTIONS = (
+    "pool_size",
+    "max_overflow",
+    "pool_recycle",
+    "pool_timeout",
+    "pool_pre_ping",
+)
+
+
+def engine_options(config: ConfigDict) -> dict[str, t.Any]:
+    """Return keyword arguments of :func:`sqlalchemy.create_engine`, per config.
+
+    Parameters
+    ----------
+    config : dict
+        :attr:`cihai.core.Cihai.config`, its ``database`` section holds the
+        :data:`ENGINE_OPTIONS` and, for SQLite, ``check_same_thread``
+
+    Returns
+    -------
+    dict :
+        options set in the config, SQLAlchemy defaults the others
+
+    Examples
+    --------
+    >>> engine_options({"database": {"url": "sqlite://", "pool_recycle": 60}})
+    {'pool_recycle': 60}
+    >>> engine_options({"database": {"url": "sqlite://", "check_same_thread": False}})
+    {'connect_args': {'check_same_thread': False}}
+    """
+    database = config["database"]
+    options: dict[str, t.Any] = {
+        key: database[key]  # type: ignore[literal-required]
+        for key in ENGINE_OPTIONS
+        if key in database
+    }
+    if "check_same_thread" in database:
+        if make_url(database["url"]).get_backend_name() != "sqlite":
+            msg = "check_same_thread is only supported by SQLite databases"
+            raise ValueError(msg)
+        options["connect_args"] = {"check_same_thread": database["check_same_thread"]}
+    return options
+
+
+def schema_fingerprint(engine: Engine) -> str | None:
+    """Return checksum of the schema of the database of ``engine``.
+
+    SQLite keeps the ``CREATE`` statement of each table, index and view in
+    ``sqlite_master``, so any schema change changes the checksum. Other
+    databases, and in-memory SQLite ones, have no fingerprint.
+
+    Parameters
+    ----------
+    engine : :class:`sqlalchemy.engine.Engine`
+
+    Returns
+    -------
+    str | None :
+        hex SHA-256, None if the schema cannot be fingerprinted cheaply
+    """
+    if engine.dialect.name != "sqlite" or engine.url.database in {None, "", ":memory:"}:
+        return None
+    digest = hashlib.sha256()
+    with engine.connect() as conn:
+        for row in conn.exec_driver_sql(
+            "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY name",
+        ):
+            digest.update(repr(tuple(row)).encode())
+    return digest.hexdigest()
+
+
+def reflection_cache_path(config: ConfigDict, engine: Engine) -> pathlib.Path | None:
+    """Return file caching the tables reflected from the database of ``engine``.
+
+    Parameters
+    ----------
+    config : dict
+        :attr:`cihai.core.Cihai.config`, the file is under ``reflection/`` of
+        its ``cache`` directory
+    engine : :class:`sqlalchemy.engine.Engine`
+
+    Returns
+    -------
+    pathlib.Path | None :
+        None if no ``cache`` directory is configured
+    """
+    cache_dir = config.get("dirs", {}).get("cache")
+    if cache_dir is None:
+        return None
+    url = engine.url.render_as_string(hide_password=True)
+    name = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return pathlib.Path(cache_dir) / "reflection" / f"{name}.json"
+
+
+def describe_tables(
+    metadata: MetaData,
+    dialect: Dialect,
+) -> list[dict[str, t.Any]] | None:
+    """Return JSON-serializable description of the tables of ``metadata``.
+
+    Tables are described by their columns, primary key, foreign keys, unique
+    constraints and indexes, see :func:`tables_from_description`.
+
+    Parameters
+    ----------
+    metadata : :class:`sqlalchemy.schema.MetaData`
+    dialect : :class:`sqlalchemy.engine.Dialect`
+        dialect compiling the column types
+
+    Returns
+    -------
+    list[dict] | None :
+        None if a table holds something not described, e.g. an index on an
+        expression
+    """
+    tables = []
+    for table in sorted(metadata.tables.values(), key=lambda table: table.name):
+        columns = [
+            {
+                "name": column.name,
+                "type": ""
+                if isinstance(column.type, sqlalchemy.types.NullType)
+                else column.type.compile(dialect=dialect),
+                "nullable": column.nullable,
+                "default": None
+                if column.server_default is None
+                else str(getattr(column.server_default, "arg", "")),
+            }
+            for column in table.columns
+        ]
+        indexes: dict[str, dict[str, t.Any]] = {}
+        for index in table.indexes:
+            if index.name is None or len(index.columns) != len(index.expressions):
+                return None
+            where = index.dialect_options["sqlite"]["where"]
+            indexes[index.name] = {
+                "name": index.name,
+                "columns": [column.name for column in index.columns],
+                "unique": bool(index.unique),
+                "where": None if where is None else str(where),
+            }
+        tables.append(
+            {
+                "name": table.name,
+                "columns": columns,
+                "primary_key": [column.name for column in table.primary_key],
+                "foreign_keys": [
+                    {
+                        "name": fk.name,
+                        "columns": list(fk.column_keys),
+                        "references": [
+                            element.target_fullname for element in fk.elements
+                        ],
+                    }
+                    for fk in table.foreign_key_constraints
+                ],
+                "unique": [
+                    {"name": c.name, "columns": [column.name for column in c.columns]}
+                    for c in table.constraints
+                    if isinstance(c, sqlalchemy.UniqueConstraint)
+                ],
+                "indexes": [indexes[name] for name in sorted(indexes)],
+            },
+        )
+    return tables
+
+
+def tables_from_description(
+    tables: list[dict[str, t.Any]],
+    dialect: Dialect,
+) -> MetaData:
+    """Return metadata holding the tables :func:`describe_tables` described.
+
+    Column types are resolved from their names as SQLite reflection does.
+
+    Parameters
+    ----------
+    tables : list[dict]
+        see :func:`describe_tables`
+    dialect : :class:`sqlalchemy.engine.Dialect`
+        SQLite dialect the types were compiled by
+    """
+    metadata = MetaData()
+    for table in tables:
+        primary_key = set(table["primary_key"])
+        sqlalchemy.Table(
+            table["name"],
+            metadata,
+            *(
+                sqlalchemy.Column(
+                    column["name"],
+                    dialect._resolve_type_affinity(column["type"]),  # type: ignore[attr-defined]
+                    nullable=column["nullable"],
+                    primary_key=column["name"] in primary_key,
+                    autoincrement=False,
+                    server_default=None
+                    if column["default"] is None
+                    else sqlalchemy.text(column["default"]),
+                )
+                for column in table["columns"]
+            ),
+            *(
+                sqlalchemy.ForeignKeyConstraint(
+                    fk["columns"],
+                    fk["references"],
+                    name=fk["name"],
+                )
+                for fk in table["foreign_keys"]
+            ),
+            *(
+                sqlalchemy.UniqueConstraint(*unique["columns"], name=unique["name"])
+                for unique in table["unique"]
+            ),
+            *(
+                sqlalchemy.Index(
+                    index["name"],
+                    *index["columns"],
+                    unique=index["unique"],
+                    sqlite_where=None
+                    if index["where"] is None
+                    else sqlalchemy.text(index["where"]),
+                )
+                for index in table["indexes"]
+            ),
+        )
+    return metadata
+
+
+def load_reflection(
+    path: pathlib.Path,
+    fingerprint: str,
+    dialect: Dialect,
+) -> MetaData | None:
+    """Return metadata cached at ``path``, None if missing or stale.
+
+    The cache holds a plain-data description of the tables, never code, see
+    :func:`describe_tables`.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        see :func:`reflection_cache_path`
+    fingerprint : str
+        :func:`schema_fingerprint` of the database now
+    dialect : :class:`sqlalchemy.engine.Dialect`
+        dialect of the database
+    """
+    try:
+        with path.open(encoding="utf-8") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        log.warning("Ignoring unreadable reflection cache %s", path)
+        return None
+    key = [REFLECTION_CACHE_VERSION, sqlalchemy.__version__, fingerprint]
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    try:
+        return tables_from_description(cached["tables"], dialect)
+    except (KeyError, TypeError, ValueError, sqlalchemy.exc.ArgumentError):
+        log.warning("Ignoring unreadable reflection cache %s", path)
+        return None
+
+
+def save_reflection(
+    path: pathlib.Path,
+    fingerprint: str,
+    metadata: MetaData,
+    dialect: Dialect,
+) -> None:
+    """Cache ``metadata`` reflected from a schema of ``fingerprint`` at ``path``.
+
+    The file is replaced atomically. Failing to write it, or a schema
+    :func:`describe_tables` cannot describe, only costs a reflection on the
+    next start.
+    """
+    tables = describe_tables(metadata, dialect)
+    if tables is None:
+        return
+    key = [REFLECTION_CACHE_VERSION, sqlalchemy.__version__, fingerprint]
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"key": key, "tables": tables}, f)
+        tmp.replace(path)
+    except OSError as e:
+        log.warning("Could not write reflection cache %s: %s", path, e)
+
+
 class Database:
-    """Cihai SQLAlchemy instance."""
+    """Cihai SQLAlchemy instance.
+
+    Each thread queries through a session of its own, :attr:`session`, so
+    datasets can be shared by the threads of e.g. a WSGI server. Threads
+    end theirs with :meth:`remove_session`, or use :meth:`session_scope`.
+
+    Parameters
+    ----------
+    config : dict
+        :attr:`cihai.core.Cihai.config`
+    engine : :class:`sqlalchemy.engine.Engine` | None
+        engine to use, one is created from the ``database`` config if None
+    scopefunc : Callable | None
+        key of the current scope, e.g. :func:`asyncio.current_task`, each
+        scope having a session of its own. Per thread if None.
+    """
 
     #: :class:`sqlalchemy.engine.Engine` instance.
     engine: Engine
@@ -24,27 +346,117 @@ class Database:
     #: :class:`sqlalchemy.schema.MetaData` instance.
     metadata: MetaData
 
-    #: :class:`sqlalchemy.orm.session.Session` instance.
-    session: Session
+    #: :class:`sqlalchemy.orm.scoped_session` of a session per thread or scope.
+    sessions: scoped_session[Session]
 
     #: :class:`sqlalchemy.ext.automap.AutomapBase` instance.
     base: AutomapBase
 
-    def __init__(self, config: ConfigDict) -> None:
-        self.engine = create_engine(config["database"]["url"])
+    #: :class:`cihai.cache.LRUCache` of each dataset namespace with a cache.
+    caches: dict[str, LRUCache]
+
+    def __init__(
+        self,
+        config: ConfigDict,
+        engine: Engine | None = None,
+        scopefunc: Callable[[], t.Any] | None = None,
+    ) -> None:
+        self.config = config
+        self.caches = {}
+        if engine is None:
+            engine = create_engine(config["database"]["url"], **engine_options(config))
+        self.engine = engine
 
         self.metadata = MetaData()
-        self.reflect_db()
+        self.reflect_db(cached=True)
+
+        self.sessions = scoped_session(sessionmaker(self.engine), scopefunc=scopefunc)
 
-        self.session = Session(self.engine)
+    @property
+    def session(self) -> Session:
+        """:class:`sqlalchemy.orm.session.Session` of the current thread or scope.
 
-    def reflect_db(self) -> None:
+        Created on first use in each thread, and kept until
+        :meth:`remove_session`.
+        """
+        return self.sessions()
+
+    def remove_session(self) -> None:
+        """Close the session of the current thread or scope, e.g. as a request ends."""
+        self.sessions.remove()
+
+    @contextlib.contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Yield a new session, closed when the block exits.
+
+        For work not tied to a thread, e.g. in asyncio tasks or executors.
+
+        Yields
+        ------
+        :class:`sqlalchemy.orm.session.Session` :
+            session of the block, not :attr:`session`
+        """
+        with Session(self.engine) as session:
+            yield session
+
+    def reflect_db(self, cached: bool = False) -> None:
         """
         No-op to reflect db info.
 
         This is available as a method so the database can be reflected
         outside initialization (such bootstrapping unihan during CLI usage).
+
+        Parameters
+        ----------
+        cached : bool
+            reuse the tables reflected last time if the schema has not changed
+            since, see :func:`schema_fingerprint`. Initialization does, explicit
+            calls reflect the database again, and cache what they find.
         """
-        self.metadata.reflect(bind=self.engine, views=True, extend_existing=True)
+        path = reflection_cache_path(self.config, self.engine)
+        fingerprint = None if path is None else schema_fingerprint(self.engine)
+        metadata = None
+        if cached and path is not None and fingerprint is not None:
+            metadata = load_reflection(path, fingerprint, self.engine.dialect)
+        if metadata is not None:
+            log.debug("Reusing tables reflected into %s", path)
+            self.metadata = metadata
+        else:
+            self.metadata.reflect(bind=self.engine, views=True, extend_existing=True)
+            if path is not None and fingerprint is not None:
+                # tables dropped since an earlier reflection linger in metadata
+                inspector = sqlalchemy.inspect(self.engine)
+                names = {*inspector.get_table_names(), *inspector.get_view_names()}
+                if names.issuperset(self.metadata.tables):
+                    save_reflection(
+                        path,
+                        fingerprint,
+                        self.metadata,
+                        self.engine.dialect,
+                    )
         self.base = automap_base(metadata=self.metadata)
         self.base.prepare()
+
+        # cached rows belong to the mapping replaced above
+        for cache in self.caches.values():
+            cache.clear()
+
+    def cache(self, namespace: str) -> LRUCache | None:
+        """Return result cache of a dataset, per the ``cache`` config.
+
+        Parameters
+        ----------
+        namespace : str
+            dataset namespace, e.g. ``unihan``
+
+        Returns
+        -------
+        :class:`cihai.cache.LRUCache` | None :
+            None if ``namespace`` has no ``cache`` config
+        """
+        if namespace not in self.caches:
+            options = self.config.get("cache", {}).get(namespace)
+            if options is None:
+                return None
+            self.caches[namespace] = LRUCache(**options)
+        return self.caches[namespace]
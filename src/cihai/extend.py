@@ -25,6 +25,7 @@ if t.TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
     from sqlalchemy.sql.schema import MetaData
 
+    from cihai.cache import LRUCache
     from cihai.db import Database
 
 
@@ -83,6 +84,9 @@ class SQLAlchemyMixin:
     #: :class:`sqlalchemy.ext.automap.AutomapBase` instance.
     base: AutomapBase
 
+    #: :class:`cihai.cache.LRUCache` for query results, None if not configured.
+    cache: LRUCache | None = None
+
 
 class Dataset:
     """
@@ -93,8 +97,12 @@ class Dataset:
     cihai.data.unihan.dataset.Unihan : reference implementation
     """
 
-    def bootstrap(self) -> None:
-        """Bootstrapping (e.g. fetching, extraction, transform, loading) Cihai data."""
+    def bootstrap(self) -> object | None:
+        """Bootstrapping (e.g. fetching, extraction, transform, loading) Cihai data.
+
+        Datasets may return a report of the import, e.g.
+        :class:`~cihai.data.unihan.instrument.BootstrapReport`.
+        """
 
     def add_plugin(
         self,
@@ -90,9 +90,44 @@ class RawDatabaseConfigDict(TypedDict):
         :func:`sqlalchemy.create_engine` by :class:`cihai.db.Database`. Before
         :func:`cihai.config.expand_config` runs it may carry XDG placeholders,
         as the default ``sqlite:///{user_data_dir}/cihai.db`` does.
+    pool_size : NotRequired[int]
+        Connections kept open by the pool.
+    max_overflow : NotRequired[int]
+        Connections opened beyond ``pool_size`` under load.
+    pool_recycle : NotRequired[int]
+        Seconds after which connections are replaced, -1 to keep them.
+    pool_timeout : NotRequired[float]
+        Seconds to wait for a connection of a full pool.
+    pool_pre_ping : NotRequired[bool]
+        Test connections as they are checked out of the pool.
+    check_same_thread : NotRequired[bool]
+        SQLite only, refuse connections used by a thread other than the one
+        that opened them.
     """
 
     url: str
+    pool_size: NotRequired[int]
+    max_overflow: NotRequired[int]
+    pool_recycle: NotRequired[int]
+    pool_timeout: NotRequired[float]
+    pool_pre_ping: NotRequired[bool]
+    check_same_thread: NotRequired[bool]
+
+
+class RawCacheConfigDict(TypedDict):
+    """Result cache config dictionary, see :class:`cihai.cache.LRUCache`.
+
+    Attributes
+    ----------
+    maxsize : NotRequired[int | None]
+        Maximum number of cached queries, 1024 if omitted, unbounded if None.
+    maxbytes : NotRequired[int | None]
+        Maximum approximate size of the cached rows in bytes, unbounded if
+        omitted or None.
+    """
+
+    maxsize: NotRequired[int | None]
+    maxbytes: NotRequired[int | None]
 
 
 class RawConfigDict(TypedDict):
@@ -117,6 +152,9 @@ class RawConfigDict(TypedDict):
         Cache, log, and data directories.
     debug : bool
         Debug flag, ``False`` in the default config.
+    cache : NotRequired[dict[str, RawCacheConfigDict]]
+        Result caches, keyed by the namespace of the dataset they serve.
+        Datasets without an entry are not cached.
     """
 
     plugins: NotRequired[dict[str, RawPluginConfigDict]]
@@ -124,6 +162,7 @@ class RawConfigDict(TypedDict):
     database: RawDatabaseConfigDict
     dirs: RawDirsConfigDict
     debug: bool
+    cache: NotRequired[dict[str, RawCacheConfigDict]]
 
 
 class ConfigDict(TypedDict):
@@ -149,6 +188,9 @@ class ConfigDict(TypedDict):
         Cache, log, and data directories.
     debug : bool
         Debug flag, ``False`` in the default config.
+    cache : NotRequired[dict[str, RawCacheConfigDict]]
+        Result caches, keyed by the namespace of the dataset they serve.
+        Datasets without an entry are not cached.
     """
 
     plugins: dict[str, RawPluginConfigDict]
@@ -156,3 +198,4 @@ class ConfigDict(TypedDict):
     database: RawDatabaseConfigDict
     dirs: RawDirsConfigDict
     debug: bool
+    cache: NotRequired[dict[str, RawCacheConfigDict]]
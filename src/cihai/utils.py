@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
 import sys
 import typing as t
 
 from . import exc
 
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+T = t.TypeVar("T")
+
 
 def supports_wide() -> bool:
     """Return affirmative if python interpreter supports wide characters.
@@ -19,6 +25,36 @@ def supports_wide() -> bool:
     return sys.maxunicode > 0xFFFF
 
 
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most ``size`` items from ``iterable``.
+
+    Stands in for :func:`itertools.batched`, which needs Python 3.12.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        items to split up
+    size : int
+        maximum length of each chunk
+
+    Returns
+    -------
+    Iterator[list] :
+        chunks, in the order items came in
+
+    Examples
+    --------
+    >>> list(chunked("abcde", 2))
+    [['a', 'b'], ['c', 'd'], ['e']]
+    """
+    if size < 1:
+        msg = "size must be at least 1"
+        raise ValueError(msg)
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
 def import_string(import_name: str, silent: bool = False) -> t.Any:
     """Import an object based on a string.
 
@@ -9,6 +9,7 @@ import zipfile
 import pytest
 import sqlalchemy
 
+from cihai.core import Cihai
 from cihai.data.unihan.constants import UNIHAN_FILES
 
 if t.TYPE_CHECKING:
@@ -82,3 +83,14 @@ def engine() -> sqlalchemy.Engine:
 def metadata() -> sqlalchemy.MetaData:
     """Return SQLAlchemy Metadata for cihai tests."""
     return sqlalchemy.MetaData()
+
+
+@pytest.fixture
+def unihan_cihai(
+    tmp_path: pathlib.Path,
+    unihan_options: UnihanOptions,
+) -> Cihai:
+    """Return Cihai with UNIHAN bootstrapped from the test fixtures."""
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'unihan.db'}"}})
+    c.unihan.bootstrap(dict(unihan_options))
+    return c
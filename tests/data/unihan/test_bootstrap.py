@@ -3,9 +3,25 @@
 from __future__ import annotations
 
 import typing as t
+import zipfile
 
+import pytest
+import sqlalchemy
+
+from cihai.conversion import parse_vars
 from cihai.core import Cihai
 from cihai.data.unihan import bootstrap
+from cihai.data.unihan.constants import (
+    BOOTSTRAP_SHARD_SIZE,
+    UNIHAN_ETL_DEFAULT_OPTIONS,
+    UNIHAN_FIELDS,
+    UNIHAN_FILES,
+    UNIHAN_INDEXES,
+    UNIHAN_VARIANT_FIELDS,
+)
+from cihai.data.unihan.dataset import UnihanVariant, UnihanVariants
+from unihan_etl import core as unihan
+from unihan_etl.util import merge_dict
 
 if t.TYPE_CHECKING:
     import pathlib
@@ -22,3 +38,558 @@ def test_reflect_db(
     assert not hasattr(c.sql.base.classes, "Unihan")
     c.unihan.sql.reflect_db()
     assert hasattr(c.sql.base.classes, "Unihan")
+
+
+def test_indexes(unihan_cihai: Cihai) -> None:
+    """Bootstrap indexes ucn, and variant and reading fields where set."""
+    unihan = unihan_cihai.unihan
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    indexes = {str(index.name): index for index in table.indexes}
+
+    assert set(indexes) == {bootstrap.index_name(c) for c in UNIHAN_INDEXES}
+    assert unihan.is_bootstrapped
+    assert not indexes["ix_Unihan_ucn"].dialect_options["sqlite"]["where"]
+    assert indexes["ix_Unihan_kMandarin"].dialect_options["sqlite"]["where"] is not None
+
+    with unihan.sql.engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            'EXPLAIN QUERY PLAN SELECT char FROM "Unihan" '
+            'WHERE "kTraditionalVariant" IS NOT NULL',
+        ).all()
+    assert "ix_Unihan_kTraditionalVariant" in str(plan)
+
+
+def test_create_indexes(unihan_cihai: Cihai) -> None:
+    """Missing indexes are added to an existing database without re-import."""
+    unihan = unihan_cihai.unihan
+    with unihan.sql.engine.begin() as conn:
+        conn.exec_driver_sql('DROP INDEX "ix_Unihan_kMandarin"')
+        conn.exec_driver_sql('DROP INDEX "ix_Unihan_ucn"')
+    unihan.sql.metadata.clear()
+    unihan.sql.reflect_db()
+    assert not unihan.is_bootstrapped
+
+    assert unihan.create_indexes() == ["ix_Unihan_ucn", "ix_Unihan_kMandarin"]
+    assert unihan.is_bootstrapped
+    assert unihan.create_indexes() == []
+
+
+def test_bootstrap_adds_missing_indexes(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Bootstrapping an imported table only creates the missing indexes."""
+    unihan = unihan_cihai.unihan
+    count = unihan.with_fields([]).count()
+    unihan.indexes += ("kDefinition",)
+    assert "kDefinition" not in UNIHAN_INDEXES
+    assert "kDefinition" not in type(unihan).indexes
+    assert not unihan.is_bootstrapped
+
+    unihan.bootstrap(unihan_options)
+    assert unihan.is_bootstrapped
+    assert unihan.with_fields([]).count() == count
+
+
+def test_load_unihan_matches_export(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Streamed bootstrap imports the rows unihan-etl's export() builds."""
+    options = merge_dict(UNIHAN_ETL_DEFAULT_OPTIONS.copy(), dict(unihan_options))
+    expected = {
+        row["char"]: {
+            **row,
+            "codepoint": ord(row["char"]),
+            **{
+                column: bootstrap.numeric_value(row.get(field))
+                for column, field in bootstrap.NUMERIC_COLUMNS.items()
+            },
+        }
+        for row in unihan.Packager(options).export() or []
+    }
+
+    table = unihan_cihai.sql.metadata.tables[bootstrap.TABLE_NAME]
+    with unihan_cihai.sql.engine.connect() as conn:
+        rows = {row.char: dict(row._mapping) for row in conn.execute(table.select())}
+    columns = bootstrap.hashed_columns(table)
+    for row in rows.values():
+        assert row.pop(bootstrap.HASH_COLUMN) == bootstrap.content_hash(
+            row[c.name] for c in columns
+        )
+
+    assert rows == expected
+
+
+def test_load_unihan_chunks(
+    tmp_path: pathlib.Path,
+    unihan_options: dict[str, object],
+) -> None:
+    """Values are inserted chunk_size at a time."""
+    options = merge_dict(UNIHAN_ETL_DEFAULT_OPTIONS.copy(), dict(unihan_options))
+    packager = unihan.Packager(options)
+    packager.download()
+    files = [tmp_path / f for f in UNIHAN_FILES]
+    fields = ["kDefinition", "kMandarin"]
+    count = len(list(bootstrap.iter_unihan_values(files, fields)))
+
+    table = bootstrap.create_unihan_table(UNIHAN_FIELDS, sqlalchemy.MetaData())
+    executemany: list[int] = []
+
+    def before_execute(*args: t.Any) -> None:
+        if isinstance(args[1], sqlalchemy.Insert) and args[2]:
+            executemany.append(len(args[2]))
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'chunks.db'}")
+    with engine.begin() as conn:
+        table.create(conn)
+        sqlalchemy.event.listen(conn, "before_execute", before_execute)
+        bootstrap.load_unihan(conn, table, files, fields, chunk_size=100)
+        chars = conn.execute(sqlalchemy.select(table.c.char)).scalars().all()
+
+    assert executemany == [100] * (count // 100) + [count % 100]
+    assert len(chars) == len(set(chars)) > 0
+
+
+def unihan_release(
+    fixture_path: pathlib.Path,
+    release_path: pathlib.Path,
+    edit: t.Callable[[str, list[str]], list[str]],
+) -> dict[str, object]:
+    """Zip the UNIHAN fixtures as edited by ``edit``, return unihan-etl options."""
+    release_path.mkdir()
+    zip_path = release_path / "Unihan.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name in UNIHAN_FILES:
+            lines = (fixture_path / name).read_text(encoding="utf-8").splitlines()
+            zf.writestr(name, "\n".join(edit(name, lines)) + "\n")
+    return {
+        "source": zip_path,
+        "work_dir": release_path,
+        "zip_path": release_path / "downloads" / "Unihan.zip",
+    }
+
+
+def test_rebootstrap_same_release(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Re-bootstrapping the release imported changes no rows."""
+    unihan = unihan_cihai.unihan
+    assert unihan.version == "9.0.0"
+
+    delta = unihan.bootstrap(dict(unihan_options), update=True).delta
+    assert delta == bootstrap.UnihanDelta("9.0.0", 0, 0, 0, 934)
+    assert unihan.bootstrap(dict(unihan_options)).delta is None
+
+
+def test_rebootstrap_new_release(
+    tmp_path: pathlib.Path,
+    fixture_path: pathlib.Path,
+    unihan_options: dict[str, object],
+) -> None:
+    """Re-bootstrapping a new release applies only what changed."""
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'delta.db'}"}})
+    unihan = c.unihan
+    unihan.bootstrap(dict(unihan_options), fts=True)
+
+    def edit(name: str, lines: list[str]) -> list[str]:
+        lines = [
+            line.replace("9.0.0", "10.0.0").replace("hillock or mound", "mound")
+            for line in lines
+            if not line.startswith("U+3401\t")
+        ]
+        if name == "Unihan_Readings.txt":
+            lines.append("U+2B740\tkDefinition\tnewly encoded")
+        return lines
+
+    # the cached zip and extracted files of the first bootstrap are replaced
+    release = unihan_release(fixture_path, tmp_path / "release", edit)
+    delta = unihan.bootstrap(
+        dict(unihan_options, source=release["source"]),
+        update=True,
+    ).delta
+
+    assert delta == bootstrap.UnihanDelta(
+        version="10.0.0",
+        inserted=1,
+        updated=1,
+        deleted=1,
+        unchanged=932,
+    )
+    assert unihan.version == "10.0.0"
+    assert unihan.lookup_char("㐁").first() is None
+    row = unihan.lookup_char("\U0002b740").first()
+    assert row is not None
+    assert row.kDefinition == "newly encoded"
+    assert not list(unihan.reverse_char("hillock", ["kDefinition"]))
+    assert "㐀" in [row.char for row in unihan.reverse_char("mound", ["kDefinition"])]
+
+
+def test_content_hash_column_added(unihan_cihai: Cihai) -> None:
+    """Bootstrap adds and fills content_hash in tables imported without it."""
+    unihan = unihan_cihai.unihan
+    with unihan.sql.engine.begin() as conn:
+        conn.exec_driver_sql('ALTER TABLE "Unihan" DROP COLUMN content_hash')
+    unihan.sql.metadata.clear()
+    unihan.sql.reflect_db()
+    assert not unihan.is_bootstrapped
+
+    assert unihan.bootstrap().delta is None
+    assert unihan.is_bootstrapped
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    with unihan.sql.engine.connect() as conn:
+        hashes = conn.execute(
+            sqlalchemy.select(table.c[bootstrap.HASH_COLUMN]),
+        ).scalars()
+        assert None not in set(hashes)
+
+
+def test_codepoint_column_added(unihan_cihai: Cihai) -> None:
+    """Codepoints of tables imported without them are filled in chunks."""
+    sql = unihan_cihai.unihan.sql
+    with sql.engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP INDEX {bootstrap.index_name('codepoint')}")
+        conn.exec_driver_sql('ALTER TABLE "Unihan" DROP COLUMN codepoint')
+    sql.metadata.clear()
+    sql.reflect_db()
+
+    statements = []
+
+    def record(conn: t.Any, cursor: t.Any, statement: str, *args: t.Any) -> None:
+        statements.append(statement)
+
+    sqlalchemy.event.listen(sql.engine, "before_cursor_execute", record)
+    assert bootstrap.add_unihan_codepoints(sql.engine, sql.metadata, chunk_size=7)
+    sqlalchemy.event.remove(sql.engine, "before_cursor_execute", record)
+    assert not any("unicode(" in statement.lower() for statement in statements)
+
+    table = sql.metadata.tables[bootstrap.TABLE_NAME]
+    with sql.engine.connect() as conn:
+        rows = conn.execute(sqlalchemy.select(table.c.char, table.c.codepoint)).all()
+    assert rows
+    assert all(codepoint == ord(char) for char, codepoint in rows)
+
+
+class ParseCase(t.NamedTuple):
+    """UNIHAN parsing case, compared against parsing whole files serially."""
+
+    workers: int
+    shard_size: int
+    test_id: str
+
+
+PARSE_CASES = [
+    ParseCase(workers=1, shard_size=97, test_id="serial-shards"),
+    ParseCase(workers=2, shard_size=BOOTSTRAP_SHARD_SIZE, test_id="files"),
+    ParseCase(workers=3, shard_size=1009, test_id="parallel-shards"),
+]
+
+
+@pytest.mark.parametrize(
+    list(ParseCase._fields),
+    PARSE_CASES,
+    ids=[case.test_id for case in PARSE_CASES],
+)
+def test_iter_unihan_values_parallel(
+    fixture_path: pathlib.Path,
+    workers: int,
+    shard_size: int,
+    test_id: str,
+) -> None:
+    """Sharded and parallel parsing yield exactly what serial parsing does."""
+    files = [fixture_path / f for f in UNIHAN_FILES]
+    expected = list(bootstrap.iter_unihan_values(files, UNIHAN_FIELDS))
+    values = bootstrap.iter_unihan_values(
+        files,
+        UNIHAN_FIELDS,
+        workers=workers,
+        shard_size=shard_size,
+    )
+
+    assert len(bootstrap.unihan_shards(files, shard_size)) >= len(files)
+    assert list(values) == expected
+
+
+def test_bootstrap_parallel(
+    tmp_path: pathlib.Path,
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Bootstrapping with worker processes imports the same table."""
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'par.db'}"}})
+    delta = c.unihan.bootstrap(dict(unihan_options), workers=2).delta
+    assert delta is not None
+    assert delta.inserted == 934
+
+    def dump(c: Cihai) -> list[tuple[t.Any, ...]]:
+        table = c.sql.metadata.tables[bootstrap.TABLE_NAME]
+        with c.sql.engine.connect() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(table.select().order_by(table.c.codepoint))
+            ]
+
+    assert dump(c) == dump(unihan_cihai)
+
+
+def test_bulk_load_profile(tmp_path: pathlib.Path) -> None:
+    """Bulk load PRAGMAs hold on the profile's own connections only."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    pragmas = list(bootstrap.SQLITE_BULK_LOAD_PRAGMAS)
+
+    def read_pragmas(conn: sqlalchemy.Connection) -> list[t.Any]:
+        return [conn.exec_driver_sql(f"PRAGMA {p}").scalar() for p in pragmas]
+
+    with engine.connect() as conn:
+        defaults = read_pragmas(conn)
+    with bootstrap.bulk_load_profile(engine) as bulk, bulk.connect() as conn:
+        assert read_pragmas(conn) == ["memory", 0, -65536]
+        with engine.connect() as other:
+            assert read_pragmas(other) == defaults
+    with engine.connect() as conn, engine.connect() as other:
+        assert read_pragmas(conn) == defaults
+        assert read_pragmas(other) == defaults
+
+
+def record_journal_modes(engine: sqlalchemy.Engine) -> list[tuple[str, str]]:
+    """Record each statement run on ``engine`` with the journal mode it ran in."""
+    statements: list[tuple[str, str]] = []
+
+    def before_cursor_execute(
+        conn: sqlalchemy.Connection,
+        cursor: t.Any,
+        statement: str,
+        *args: t.Any,
+    ) -> None:
+        mode = cursor.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        statements.append((statement, mode))
+
+    sqlalchemy.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def test_bootstrap_publishes_with_journal(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Only a bulk load build skips the journal, publishing the table keeps it."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'journal.db'}")
+    statements = record_journal_modes(engine)
+    bootstrap.bootstrap_unihan(
+        engine,
+        sqlalchemy.MetaData(),
+        dict(unihan_options),
+        bulk_load=True,
+    )
+
+    staged = {
+        mode
+        for statement, mode in statements
+        if statement.startswith(f'INSERT INTO "{bootstrap.BUILD_STAGING_TABLE_NAME}"')
+    }
+    assert staged == {"memory"}
+    published = [mode for statement, mode in statements if "RENAME TO" in statement]
+    assert published == ["delete"]
+
+
+def test_bootstrap_keeps_journal_by_default(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Without bulk_load, every statement of a bootstrap keeps the journal."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'journal.db'}")
+    statements = record_journal_modes(engine)
+    bootstrap.bootstrap_unihan(engine, sqlalchemy.MetaData(), dict(unihan_options))
+
+    assert statements
+    assert {mode for _, mode in statements} == {"delete"}
+
+
+def test_bootstrap_updates_with_journal(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Upgrades and updates of the live UNIHAN table keep the journal."""
+    sql = unihan_cihai.sql
+    with sql.engine.begin() as conn:
+        conn.exec_driver_sql('ALTER TABLE "Unihan" DROP COLUMN content_hash')
+    sql.metadata.clear()
+    sql.reflect_db()
+    statements = record_journal_modes(sql.engine)
+    bootstrap.bootstrap_unihan(
+        sql.engine,
+        sql.metadata,
+        dict(unihan_options),
+        update=True,
+    )
+
+    assert any("ADD COLUMN content_hash" in statement for statement, _ in statements)
+    assert any(statement.startswith('UPDATE "Unihan"') for statement, _ in statements)
+    assert {mode for _, mode in statements} == {"delete"}
+
+
+def test_bootstrap_analyzes(unihan_cihai: Cihai) -> None:
+    """Bootstrap leaves planner statistics for the UNIHAN table."""
+    with unihan_cihai.sql.engine.connect() as conn:
+        tables = conn.exec_driver_sql("SELECT DISTINCT tbl FROM sqlite_stat1")
+        assert bootstrap.TABLE_NAME in tables.scalars().all()
+
+
+def test_bootstrap_publishes_atomically(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Readers see no UNIHAN table until it is complete, even if the load fails."""
+    url = f"sqlite:///{tmp_path / 'atomic.db'}"
+    reader = Cihai(config={"database": {"url": url}})
+    assert reader.unihan.generation == 0
+    apply_unihan = bootstrap.apply_unihan
+
+    def failing_apply_unihan(*args: t.Any, **kwargs: t.Any) -> bootstrap.UnihanDelta:
+        apply_unihan(*args, **kwargs)
+        assert not sqlalchemy.inspect(reader.sql.engine).has_table(
+            bootstrap.TABLE_NAME,
+        )
+        raise RuntimeError
+
+    monkeypatch.setattr(bootstrap, "apply_unihan", failing_apply_unihan)
+    writer = Cihai(config={"database": {"url": url}})
+    with pytest.raises(RuntimeError):
+        writer.unihan.bootstrap(dict(unihan_options), resume=False)
+    assert not sqlalchemy.inspect(reader.sql.engine).has_table(bootstrap.TABLE_NAME)
+    assert not reader.unihan.refresh()
+
+    monkeypatch.setattr(bootstrap, "apply_unihan", apply_unihan)
+    writer.unihan.bootstrap(dict(unihan_options), resume=False)
+    assert writer.unihan.is_bootstrapped
+    inspector = sqlalchemy.inspect(reader.sql.engine)
+    assert not inspector.has_table(bootstrap.BUILD_TABLE_NAME)
+    assert not inspector.has_table(bootstrap.BUILD_STAGING_TABLE_NAME)
+
+
+def test_refresh(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Readers opened before a bootstrap pick it up with refresh()."""
+    url = f"sqlite:///{tmp_path / 'refresh.db'}"
+    reader = Cihai(config={"database": {"url": url}})
+    reader.unihan.add_plugin(
+        "cihai.data.unihan.dataset.UnihanVariants",
+        namespace="variants",
+    )
+    assert not reader.unihan.is_bootstrapped
+    assert not reader.unihan.refresh()
+
+    writer = Cihai(config={"database": {"url": url}})
+    writer.unihan.bootstrap(dict(unihan_options))
+    assert writer.unihan.generation == 1
+
+    assert reader.unihan.refresh()
+    assert reader.unihan.is_bootstrapped
+    row = reader.unihan.lookup_char("㐀").first()
+    assert row is not None
+    assert callable(row.untagged_vars)
+    assert not reader.unihan.refresh()
+
+    writer.unihan.bootstrap(dict(unihan_options), update=True)
+    assert reader.unihan.generation == 2
+    assert reader.unihan.refresh()
+
+
+def test_variant_table(unihan_cihai: Cihai) -> None:
+    """Bootstrap explodes variant fields into an edge per variant."""
+    unihan = unihan_cihai.unihan
+    expected = {
+        (row.char, kind, dst, tag)
+        for kind in UNIHAN_VARIANT_FIELDS
+        for row in unihan.with_fields([kind])
+        for dst, tag in parse_vars(getattr(row, kind))
+    }
+    variants = unihan_cihai.sql.metadata.tables[bootstrap.VARIANT_TABLE_NAME]
+    with unihan_cihai.sql.engine.connect() as conn:
+        assert {tuple(row) for row in conn.execute(variants.select())} == expected
+        plan = conn.execute(
+            sqlalchemy.text(
+                f"EXPLAIN QUERY PLAN SELECT * FROM {bootstrap.VARIANT_TABLE_NAME} "
+                "WHERE dst = :char",
+            ),
+            {"char": "乱"},
+        ).all()
+    assert "ix_Unihan_variant_dst" in str(plan)
+
+
+def test_variant_lookups(unihan_cihai: Cihai) -> None:
+    """Variants are looked up from a character and back to it."""
+    variants = UnihanVariants()
+    variants.sql = unihan_cihai.sql
+
+    assert variants.lookup_variants("㐅") == [
+        UnihanVariant("㐅", "五", "kSemanticVariant", "kMatthews"),
+    ]
+    assert variants.lookup_variants("亂", ["kSimplifiedVariant"]) == [
+        UnihanVariant("亂", "乱", "kSimplifiedVariant", None),
+    ]
+    assert variants.reverse_variants("乱") == [
+        UnihanVariant("亂", "乱", "kSemanticVariant", "kMatthews,kMeyerWempe"),
+        UnihanVariant("亂", "乱", "kSimplifiedVariant", None),
+    ]
+    assert variants.reverse_variants("乱", ["kTraditionalVariant"]) == []
+    assert variants.lookup_variants("a") == []
+
+
+class DerivedTableCase(t.NamedTuple):
+    """Table bootstrap derives from UNIHAN fields."""
+
+    table: str
+    expected_count: int
+    test_id: str
+
+
+DERIVED_TABLE_CASES = [
+    DerivedTableCase(
+        table=bootstrap.VARIANT_TABLE_NAME,
+        expected_count=518,
+        test_id="variants",
+    ),
+    DerivedTableCase(
+        table=bootstrap.READING_TABLE_NAME,
+        expected_count=480,
+        test_id="readings",
+    ),
+    DerivedTableCase(
+        table=bootstrap.RADICAL_TABLE_NAME,
+        expected_count=147,
+        test_id="radicals",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(DerivedTableCase._fields),
+    DERIVED_TABLE_CASES,
+    ids=[case.test_id for case in DERIVED_TABLE_CASES],
+)
+def test_bootstrap_adds_derived_table(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+    table: str,
+    expected_count: int,
+    test_id: str,
+) -> None:
+    """Bootstrapping a table imported without a derived table adds it."""
+    engine = unihan_cihai.sql.engine
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"DROP TABLE {table}")
+    unihan_cihai.sql.metadata.clear()
+    unihan_cihai.unihan.sql.reflect_db()
+    generation = unihan_cihai.unihan.generation
+
+    report = unihan_cihai.unihan.bootstrap(dict(unihan_options))
+    assert [phase.name for phase in report.phases] == ["upgrade", "index"]
+    assert unihan_cihai.unihan.generation == generation + 1
+    with engine.connect() as conn:
+        count = conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+    assert count == expected_count
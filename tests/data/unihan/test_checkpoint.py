@@ -0,0 +1,193 @@
+"""Tests for resuming interrupted UNIHAN bootstraps."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+import sqlalchemy
+
+from cihai.core import Cihai
+from cihai.data.unihan import bootstrap
+from cihai.data.unihan.checkpoint import BootstrapCheckpoint
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+def dump(engine: sqlalchemy.Engine) -> list[tuple[t.Any, ...]]:
+    """Return rows of the UNIHAN table, by character."""
+    metadata = sqlalchemy.MetaData()
+    table = sqlalchemy.Table(bootstrap.TABLE_NAME, metadata, autoload_with=engine)
+    with engine.connect() as conn:
+        return [tuple(row) for row in conn.execute(table.select().order_by("char"))]
+
+
+class Interrupt(Exception):
+    """Stand-in for a bootstrap killed part way."""
+
+
+class InterruptCase(t.NamedTuple):
+    """Bootstrap interrupted in one of its steps."""
+
+    target: str
+    calls: int
+    expected_phases: list[str]
+    expected_staged: int
+    test_id: str
+
+
+INTERRUPT_CASES = [
+    InterruptCase(
+        target="stage_unihan",
+        calls=3,
+        expected_phases=["parse", "insert", "index", "publish"],
+        expected_staged=4,
+        test_id="staging",
+    ),
+    InterruptCase(
+        target="create_unihan_indexes",
+        calls=1,
+        expected_phases=["index", "publish"],
+        expected_staged=0,
+        test_id="indexing",
+    ),
+    InterruptCase(
+        target="publish_unihan",
+        calls=1,
+        expected_phases=["publish"],
+        expected_staged=0,
+        test_id="publishing",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(InterruptCase._fields),
+    INTERRUPT_CASES,
+    ids=[case.test_id for case in INTERRUPT_CASES],
+)
+def test_bootstrap_resumes(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    target: str,
+    calls: int,
+    expected_phases: list[str],
+    expected_staged: int,
+    test_id: str,
+) -> None:
+    """A bootstrap run again after dying skips the steps it completed."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'resume.db'}")
+    checkpoint_dir = tmp_path / "checkpoints"
+    original = getattr(bootstrap, target)
+    seen = 0
+
+    def interrupted(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        nonlocal seen
+        seen += 1
+        if seen == calls:
+            raise Interrupt
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bootstrap, target, interrupted)
+    with pytest.raises(Interrupt):
+        bootstrap.bootstrap_unihan(
+            engine,
+            sqlalchemy.MetaData(),
+            dict(unihan_options),
+            checkpoint_dir=checkpoint_dir,
+        )
+    assert list(checkpoint_dir.iterdir())
+
+    monkeypatch.setattr(bootstrap, target, original)
+    stage_unihan = bootstrap.stage_unihan
+    staged = 0
+
+    def counted(*args: t.Any, **kwargs: t.Any) -> None:
+        nonlocal staged
+        staged += 1
+        stage_unihan(*args, **kwargs)
+
+    monkeypatch.setattr(bootstrap, "stage_unihan", counted)
+    report = bootstrap.bootstrap_unihan(
+        engine,
+        sqlalchemy.MetaData(),
+        dict(unihan_options),
+        checkpoint_dir=checkpoint_dir,
+    )
+
+    assert [phase.name for phase in report.phases] == expected_phases
+    assert staged == expected_staged
+    assert report.delta == bootstrap.UnihanDelta("9.0.0", 934, 0, 0, 0)
+    assert dump(engine) == dump(unihan_cihai.sql.engine)
+    assert not list(checkpoint_dir.iterdir())
+
+
+def test_bootstrap_restarts_for_new_archive(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Checkpoints of another UNIHAN archive are not resumed."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'restart.db'}")
+    checkpoint = BootstrapCheckpoint.for_database(tmp_path, engine)
+    checkpoint.start(archive="0" * 64, fields=[], schema_version=0)
+    checkpoint.mark("create")
+    checkpoint.mark("insert", {"version": None, "inserted": 1})
+
+    report = bootstrap.bootstrap_unihan(
+        engine,
+        sqlalchemy.MetaData(),
+        dict(unihan_options),
+        checkpoint_dir=tmp_path,
+    )
+    names = [phase.name for phase in report.phases]
+    assert names[-6:] == ["extract", "create", "parse", "insert", "index", "publish"]
+    assert report.delta == bootstrap.UnihanDelta("9.0.0", 934, 0, 0, 0)
+
+
+def test_checkpoint_per_database(tmp_path: pathlib.Path) -> None:
+    """Each database has its own checkpoint, saved across instances."""
+    a = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    b = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'b.db'}")
+    checkpoint = BootstrapCheckpoint.for_database(tmp_path, a)
+    assert not checkpoint.start(archive="a")
+    checkpoint.mark("extract", {"Unihan_Readings.txt": 1})
+    checkpoint.add_shard((tmp_path / "Unihan_Readings.txt", 0, 1))
+
+    resumed = BootstrapCheckpoint.for_database(tmp_path, a)
+    assert resumed.start(archive="a")
+    assert resumed.get("extract") == {"Unihan_Readings.txt": 1}
+    assert resumed.has_shard((tmp_path / "Unihan_Readings.txt", 0, 1))
+    assert not resumed.has_shard((tmp_path / "Unihan_Readings.txt", 1, 2))
+    assert not BootstrapCheckpoint.for_database(tmp_path, b).done("extract")
+
+    resumed.forget("extract")
+    assert not resumed.done("extract")
+    assert not resumed.has_shard((tmp_path / "Unihan_Readings.txt", 0, 1))
+    resumed.clear()
+    assert not resumed.path.exists()
+
+
+def test_unihan_bootstrap_checkpoints_in_cache_dir(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unihan.bootstrap() keeps its checkpoints in the cache directory."""
+    cache_dir = tmp_path / "cache"
+    c = Cihai(
+        config={
+            "database": {"url": f"sqlite:///{tmp_path / 'cache.db'}"},
+            "dirs": {"cache": str(cache_dir)},
+        },
+    )
+
+    def publish_unihan(*args: t.Any, **kwargs: t.Any) -> int:
+        raise Interrupt
+
+    monkeypatch.setattr(bootstrap, "publish_unihan", publish_unihan)
+    with pytest.raises(Interrupt):
+        c.unihan.bootstrap(dict(unihan_options))
+    assert [p.suffix for p in (cache_dir / "unihan").iterdir()] == [".json"]
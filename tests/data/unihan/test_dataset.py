@@ -0,0 +1,1102 @@
+"""Tests for the UNIHAN dataset."""
+
+from __future__ import annotations
+
+import copy
+import tracemalloc
+import typing as t
+
+import pytest
+import sqlalchemy
+
+from cihai.constants import UNIHAN_CONFIG
+from cihai.conversion import parse_radical_strokes
+from cihai.core import Cihai
+from cihai.data.unihan import bootstrap, constants
+from cihai.data.unihan.dataset import READING_MATCHES, block_name
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from cihai.data.unihan.dataset import NumericRange, ReadingMatch, ReverseMatch
+
+    from ...types import UnihanOptions
+
+
+class LookupCharsCase(t.NamedTuple):
+    """Batched character lookup case."""
+
+    chars: str | list[str]
+    expected_keys: list[str]
+    expected_misses: list[str]
+    test_id: str
+
+
+LOOKUP_CHARS_CASES = [
+    LookupCharsCase(
+        chars="㐭㐀㐭",
+        expected_keys=["㐭", "㐀"],
+        expected_misses=[],
+        test_id="text-deduplicated",
+    ),
+    LookupCharsCase(
+        chars=["a", "㐀", "㐭"],
+        expected_keys=["a", "㐀", "㐭"],
+        expected_misses=["a"],
+        test_id="iterable-with-miss",
+    ),
+    LookupCharsCase(
+        chars="",
+        expected_keys=[],
+        expected_misses=[],
+        test_id="empty",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupCharsCase._fields),
+    LOOKUP_CHARS_CASES,
+    ids=[case.test_id for case in LOOKUP_CHARS_CASES],
+)
+def test_lookup_chars(
+    unihan_cihai: Cihai,
+    chars: str | list[str],
+    expected_keys: list[str],
+    expected_misses: list[str],
+    test_id: str,
+) -> None:
+    """lookup_chars() returns an order-preserving mapping, misses included."""
+    results = unihan_cihai.unihan.lookup_chars(chars)
+
+    assert list(results) == expected_keys
+    assert [char for char, row in results.items() if row is None] == expected_misses
+    for char, row in results.items():
+        if row is not None:
+            assert row.char == char
+            assert row is unihan_cihai.unihan.lookup_char(char).first()
+
+
+def test_lookup_chars_chunks_queries(
+    unihan_cihai: Cihai,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """lookup_chars() issues one query per chunk of characters."""
+    monkeypatch.setattr(
+        "cihai.data.unihan.dataset.LOOKUP_CHUNK_SIZE",
+        100,
+    )
+    chars = [row.char for row in unihan_cihai.unihan.with_fields([])][:250]
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: t.Any) -> None:
+        statements.append(args[2])
+
+    engine = unihan_cihai.sql.engine
+    sqlalchemy.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        results = unihan_cihai.unihan.lookup_chars(chars)
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 3
+    assert list(results) == chars
+    assert all(row is not None for row in results.values())
+    assert constants.LOOKUP_CHUNK_SIZE <= 999
+
+
+ZORK_ROWS: list[dict[str, str | int | None]] = [
+    {
+        "char": "a",
+        "ucn": "U+0061",
+        "codepoint": 0x61,
+        "kDefinition": "plyzork",
+        "kCangjie": None,
+    },
+    {
+        "char": "b",
+        "ucn": "U+0062",
+        "codepoint": 0x62,
+        "kDefinition": "zork, timber",
+        "kCangjie": None,
+    },
+    {
+        "char": "c",
+        "ucn": "U+0063",
+        "codepoint": 0x63,
+        "kDefinition": "zorkland",
+        "kCangjie": "ZORK",
+    },
+    {
+        "char": "d",
+        "ucn": "U+0064",
+        "codepoint": 0x64,
+        "kDefinition": "ÉCLAIR, a pastry",
+        "kCangjie": None,
+    },
+]
+
+
+class ReverseCharCase(t.NamedTuple):
+    """Reverse lookup case, compared with and without the full-text index."""
+
+    hints: str | list[str]
+    fields: list[str] | None
+    match: ReverseMatch
+    expected_chars: set[str]
+    test_id: str
+
+
+REVERSE_CHAR_CASES = [
+    ReverseCharCase(
+        hints="granary",
+        fields=None,
+        match="substring",
+        expected_chars={"㐭"},
+        test_id="single-hint",
+    ),
+    ReverseCharCase(
+        hints=["GRANARY", "hillock"],
+        fields=None,
+        match="substring",
+        expected_chars={"㐭", "㐀"},
+        test_id="case-insensitive-multiple-hints",
+    ),
+    ReverseCharCase(
+        hints="qiū",
+        fields=None,
+        match="substring",
+        expected_chars={"㐀"},
+        test_id="non-ascii",
+    ),
+    ReverseCharCase(
+        hints="U+",
+        fields=["kCangjie"],
+        match="substring",
+        expected_chars=set(),
+        test_id="short-hint-like-fallback",
+    ),
+    ReverseCharCase(
+        hints='"granary',
+        fields=None,
+        match="substring",
+        expected_chars=set(),
+        test_id="quoted",
+    ),
+    ReverseCharCase(
+        hints="zork",
+        fields=None,
+        match="substring",
+        expected_chars={"a", "b", "c"},
+        test_id="substring-zork",
+    ),
+    ReverseCharCase(
+        hints="zork",
+        fields=None,
+        match="token",
+        expected_chars={"b", "c"},
+        test_id="token-zork",
+    ),
+    ReverseCharCase(
+        hints="zork",
+        fields=["kDefinition"],
+        match="token",
+        expected_chars={"b"},
+        test_id="token-zork-in-definition",
+    ),
+    ReverseCharCase(
+        hints="zork",
+        fields=["kDefinition"],
+        match="prefix",
+        expected_chars={"b", "c"},
+        test_id="prefix-zork-in-definition",
+    ),
+    ReverseCharCase(
+        hints="zork",
+        fields=["kMandarin"],
+        match="substring",
+        expected_chars=set(),
+        test_id="substring-zork-in-mandarin",
+    ),
+    ReverseCharCase(
+        hints="éclair",
+        fields=None,
+        match="substring",
+        expected_chars={"d"},
+        test_id="substring-non-ascii-case",
+    ),
+    ReverseCharCase(
+        hints="éc",
+        fields=["kDefinition"],
+        match="substring",
+        expected_chars={"d"},
+        test_id="short-hint-non-ascii-case",
+    ),
+    ReverseCharCase(
+        hints="éclair",
+        fields=["kDefinition"],
+        match="token",
+        expected_chars={"d"},
+        test_id="token-non-ascii-case",
+    ),
+    ReverseCharCase(
+        hints=["a granary", "qiū"],
+        fields=["kDefinition", "kMandarin"],
+        match="token",
+        expected_chars={"㐭", "㐀"},
+        test_id="token-phrase-and-reading",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ReverseCharCase._fields),
+    REVERSE_CHAR_CASES,
+    ids=[case.test_id for case in REVERSE_CHAR_CASES],
+)
+def test_reverse_char_fts(
+    unihan_cihai: Cihai,
+    hints: str | list[str],
+    fields: list[str] | None,
+    match: ReverseMatch,
+    expected_chars: set[str],
+    test_id: str,
+) -> None:
+    """reverse_char() returns the same rows with and without the FTS index."""
+    unihan = unihan_cihai.unihan
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    with unihan.sql.engine.begin() as conn:
+        conn.execute(sqlalchemy.insert(table), ZORK_ROWS)
+
+    assert not unihan.has_fts
+    scan = {row.char for row in unihan.reverse_char(hints, fields, match)}
+
+    assert bootstrap.create_unihan_fts(unihan.sql.engine, unihan.sql.metadata)
+    unihan.sql.reflect_db()
+    assert unihan.has_fts
+
+    fts = {row.char for row in unihan.reverse_char(hints, fields, match)}
+    assert fts == scan
+    assert expected_chars <= fts
+    if hints == "zork":
+        assert fts == expected_chars
+
+
+class ReverseCharErrorCase(t.NamedTuple):
+    """Invalid reverse lookup arguments."""
+
+    fields: list[str] | None
+    match: str
+    test_id: str
+
+
+REVERSE_CHAR_ERROR_CASES = [
+    ReverseCharErrorCase(
+        fields=["kDefinition", "kNotAField"],
+        match="substring",
+        test_id="unknown-field",
+    ),
+    ReverseCharErrorCase(
+        fields=None,
+        match="regex",
+        test_id="unknown-match",
+    ),
+    ReverseCharErrorCase(
+        fields=["codepoint"],
+        match="substring",
+        test_id="not-text-field",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ReverseCharErrorCase._fields),
+    REVERSE_CHAR_ERROR_CASES,
+    ids=[case.test_id for case in REVERSE_CHAR_ERROR_CASES],
+)
+def test_reverse_char_invalid(
+    unihan_cihai: Cihai,
+    fields: list[str] | None,
+    match: str,
+    test_id: str,
+) -> None:
+    """reverse_char() rejects unknown fields and match modes."""
+    with pytest.raises(ValueError):
+        unihan_cihai.unihan.reverse_char(
+            "wood",
+            fields=fields,
+            match=match,  # type: ignore[arg-type]
+        )
+
+
+def test_reverse_char_fts_ranked(
+    tmp_path: pathlib.Path,
+    unihan_options: UnihanOptions,
+) -> None:
+    """FTS matches come back most relevant first."""
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'fts.db'}"}})
+    unihan = c.unihan
+    unihan.bootstrap(dict(unihan_options), fts=True)
+    assert unihan.has_fts
+
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    with unihan.sql.engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.insert(table),
+            [
+                {
+                    "char": "a",
+                    "ucn": "U+0061",
+                    "codepoint": 0x61,
+                    "kDefinition": "a zyzzyva, among many other things",
+                },
+                {
+                    "char": "b",
+                    "ucn": "U+0062",
+                    "codepoint": 0x62,
+                    "kDefinition": "zyzzyva zyzzyva",
+                },
+            ],
+        )
+
+    assert [row.char for row in unihan.reverse_char("zyzzyva")] == ["b", "a"]
+
+
+def test_reverse_char_fts_in_sync(unihan_cihai: Cihai) -> None:
+    """Changes to the UNIHAN table reach the FTS index through triggers."""
+    unihan = unihan_cihai.unihan
+    engine = unihan.sql.engine
+    bootstrap.create_unihan_fts(engine, unihan.sql.metadata)
+    unihan.sql.reflect_db()
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.insert(table),
+            {
+                "char": "a",
+                "ucn": "U+0061",
+                "codepoint": 0x61,
+                "kDefinition": "zyzzyva",
+            },
+        )
+    assert [row.char for row in unihan.reverse_char("zyzzyva")] == ["a"]
+
+    with engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.update(table)
+            .where(table.c.char == "a")
+            .values(kDefinition="aardvark"),
+        )
+    unihan.sql.session.expire_all()
+    assert not list(unihan.reverse_char("zyzzyva"))
+    assert [row.char for row in unihan.reverse_char("aardvark")] == ["a"]
+
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.delete(table).where(table.c.char == "a"))
+    assert not list(unihan.reverse_char("aardvark"))
+
+
+@pytest.fixture
+def cached_cihai(
+    tmp_path: pathlib.Path,
+    unihan_options: UnihanOptions,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Cihai:
+    """Return Cihai with UNIHAN bootstrapped and a small UNIHAN result cache."""
+    # Cihai merges config into its defaults in place, keep the cache config here
+    monkeypatch.setattr(Cihai, "default_config", copy.deepcopy(Cihai.default_config))
+    monkeypatch.setattr("cihai.core.UNIHAN_CONFIG", copy.deepcopy(UNIHAN_CONFIG))
+    c = Cihai(
+        config={
+            "database": {"url": f"sqlite:///{tmp_path / 'cached.db'}"},
+            "cache": {"unihan": {"maxsize": 3}},
+        },
+    )
+    c.unihan.bootstrap(dict(unihan_options))
+    return c
+
+
+def test_lookup_char_cached(cached_cihai: Cihai) -> None:
+    """Repeated lookups are answered from the cache, without a query."""
+    unihan = cached_cihai.unihan
+    cache = unihan.cache
+    assert cache is not None
+    assert cache is cached_cihai.sql.caches["unihan"]
+
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: t.Any) -> None:
+        statements.append(args[2])
+
+    engine = unihan.sql.engine
+    sqlalchemy.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        row = unihan.lookup_char("㐭").first()
+        assert row is not None
+        assert unihan.lookup_char("㐭").first() is row
+        assert [r.char for r in unihan.lookup_char("㐀")] == ["㐀"]
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 2
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions) == (1, 2, 0)
+    assert info.currbytes > 0
+
+    # different fields, match modes and hints are different entries
+    assert list(unihan.with_fields(["kDefinition"]))
+    assert list(unihan.reverse_char("granary"))
+    assert cache.info().evictions == 1
+    assert not list(unihan.reverse_char("granary", match="token", fields=["ucn"]))
+    assert cache.info().currsize == 3
+
+
+def test_lookup_chars_cached(cached_cihai: Cihai) -> None:
+    """lookup_chars() is answered from the cache, narrowed to ``columns``."""
+    unihan = cached_cihai.unihan
+    cache = unihan.cache
+    assert cache is not None
+
+    first = unihan.lookup_chars("㐭㐀", columns=["kDefinition"])
+    assert unihan.lookup_chars("㐭㐀", columns=["kDefinition"]) == first
+    info = cache.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    row = first["㐭"]
+    assert row is not None
+    assert "kDefinition" in vars(row)
+    assert "kMandarin" not in vars(row)
+
+
+def test_cache_invalidated_on_bootstrap(
+    cached_cihai: Cihai,
+    unihan_options: UnihanOptions,
+) -> None:
+    """reflect_db(), and so bootstrap(), empties the cache."""
+    unihan = cached_cihai.unihan
+    cache = unihan.cache
+    assert cache is not None
+
+    assert unihan.lookup_char("㐭").first() is not None
+    assert len(cache) == 1
+    unihan.sql.reflect_db()
+    assert len(cache) == 0
+
+    unihan.lookup_char("㐭").first()
+    with unihan.sql.engine.begin() as conn:
+        for table in reversed(unihan.sql.metadata.sorted_tables):
+            conn.execute(sqlalchemy.text(f'DROP TABLE "{table.name}"'))
+    unihan.sql.metadata.clear()
+    unihan.sql.session.expunge_all()
+    unihan.bootstrap(dict(unihan_options))
+    assert len(cache) == 0
+    assert unihan.lookup_char("㐭").first() is not None
+
+
+def test_uncached_by_default(unihan_cihai: Cihai) -> None:
+    """Datasets without cache config are not cached."""
+    assert unihan_cihai.unihan.cache is None
+    assert unihan_cihai.sql.cache("unihan") is None
+    assert unihan_cihai.sql.caches == {}
+
+
+class ProjectionCase(t.NamedTuple):
+    """Column projection case for lookup_char() and with_fields()."""
+
+    columns: list[str] | None
+    expected_fields: tuple[str, ...] | None
+    test_id: str
+
+
+PROJECTION_CASES = [
+    ProjectionCase(
+        columns=["char", "kDefinition"],
+        expected_fields=("char", "kDefinition"),
+        test_id="columns",
+    ),
+    ProjectionCase(
+        columns=["kDefinition"],
+        expected_fields=("kDefinition",),
+        test_id="without-char",
+    ),
+    ProjectionCase(
+        columns=None,
+        expected_fields=None,
+        test_id="all-columns",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ProjectionCase._fields),
+    PROJECTION_CASES,
+    ids=[case.test_id for case in PROJECTION_CASES],
+)
+def test_projection_raw(
+    unihan_cihai: Cihai,
+    columns: list[str] | None,
+    expected_fields: tuple[str, ...] | None,
+    test_id: str,
+) -> None:
+    """raw=True returns named tuples holding just the requested columns."""
+    unihan = unihan_cihai.unihan
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    if expected_fields is None:
+        expected_fields = tuple(table.columns.keys())
+
+    row = unihan.lookup_char("㐭", columns=columns, raw=True).one()
+    assert row._fields == expected_fields
+    assert row.kDefinition == unihan.lookup_char("㐭").one().kDefinition
+
+    rows = unihan.with_fields(["kSemanticVariant"], columns=columns, raw=True).all()
+    expected = unihan.with_fields(["kSemanticVariant"]).all()
+    assert rows
+    assert [r.kDefinition for r in rows] == [r.kDefinition for r in expected]
+    assert all(r._fields == expected_fields for r in rows)
+
+
+def test_projection_orm(unihan_cihai: Cihai) -> None:
+    """columns= without raw loads only those columns of ORM objects."""
+    unihan = unihan_cihai.unihan
+    row = unihan.lookup_char("㐭", columns=["kDefinition"]).one()
+    loaded = set(vars(row))
+    assert {"char", "ucn", "kDefinition"} <= loaded
+    assert "kMandarin" not in loaded
+    assert row.kMandarin  # type: ignore[attr-defined]  # deferred, loads on access
+
+    rows = unihan.with_fields(["kSemanticVariant"], columns=["kSemanticVariant"])
+    assert all(vars(r).get("kSemanticVariant") for r in rows)
+
+
+def test_projection_invalid(unihan_cihai: Cihai) -> None:
+    """Unknown columns are rejected."""
+    with pytest.raises(ValueError):
+        unihan_cihai.unihan.lookup_char("㐭", columns=["kNotAField"], raw=True)
+    with pytest.raises(ValueError):
+        unihan_cihai.unihan.with_fields([], columns=["kNotAField"])
+
+
+def test_projection_cached(cached_cihai: Cihai) -> None:
+    """Raw projections are served from the dataset cache too."""
+    unihan = cached_cihai.unihan
+    cache = unihan.cache
+    assert cache is not None
+
+    first = unihan.lookup_char("㐭", columns=["char"], raw=True).all()
+    second = unihan.lookup_char("㐭", columns=["char"], raw=True).all()
+    assert [tuple(row) for row in first] == [tuple(row) for row in second]
+    assert [row.char for row in first] == ["㐭"]
+    assert (cache.info().hits, cache.info().misses) == (1, 1)
+
+
+def _peak_memory(rows: t.Iterable[t.Any]) -> int:
+    """Return peak traced memory while walking ``rows``, in bytes."""
+    tracemalloc.start()
+    try:
+        for _row in rows:
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("raw", [False, True], ids=["orm", "raw"])
+def test_iter_with_fields(unihan_cihai: Cihai, raw: bool) -> None:
+    """iter_with_fields() yields what with_fields() does, without the session."""
+    unihan = unihan_cihai.unihan
+    fields = ["kSemanticVariant"]
+    expected = [(r.char, r.kDefinition) for r in unihan.with_fields(fields)]
+    unihan.sql.session.expunge_all()
+
+    rows = list(unihan.iter_with_fields(fields, raw=raw, batch_size=2))
+    assert [(r.char, r.kDefinition) for r in rows] == expected
+    assert len(unihan.sql.session.identity_map) == 0
+
+    columns = ["char", "kSemanticVariant"]
+    projected = list(unihan.iter_with_fields(fields, columns=columns, raw=raw))
+    assert [r.char for r in projected] == [char for char, _ in expected]
+
+
+def test_iter_with_fields_flat_memory(unihan_cihai: Cihai) -> None:
+    """Streaming memory does not grow with the number of rows matched."""
+    unihan = unihan_cihai.unihan
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    fields = ["kDefinition"]
+
+    def stream() -> t.Iterator[t.Any]:
+        return unihan.iter_with_fields(fields, batch_size=100)
+
+    count = unihan.with_fields(fields).count()
+    unihan.sql.session.expunge_all()
+    _peak_memory(stream())  # warm up statement caches
+    stream_peak = _peak_memory(stream())
+
+    with unihan.sql.engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.insert(table),
+            [
+                {
+                    "char": chr(0xF0000 + i),
+                    "ucn": f"U+{0xF0000 + i:X}",
+                    "kDefinition": f"private use {i}",
+                }
+                for i in range(count * 10)
+            ],
+        )
+    assert unihan.with_fields(fields).count() == count * 11
+    unihan.sql.session.expunge_all()
+
+    # 11x the rows: streaming stays put, buffering grows with the rows
+    assert _peak_memory(stream()) < stream_peak * 2
+    assert _peak_memory(unihan.with_fields(fields)) > stream_peak * 5
+
+
+class LookupRangeCase(t.NamedTuple):
+    """Code point range lookup case."""
+
+    start: int | str
+    end: int | str
+    expected_count: int
+    test_id: str
+
+
+LOOKUP_RANGE_CASES = [
+    LookupRangeCase(
+        start="U+3400",
+        end="U+4DBF",
+        expected_count=731,
+        test_id="ucn-extension-a",
+    ),
+    LookupRangeCase(
+        start="㐀",
+        end="㐀",
+        expected_count=1,
+        test_id="single-char",
+    ),
+    LookupRangeCase(
+        start=0x4E00,
+        end=0x2A6DF,
+        expected_count=188 + 15,
+        test_id="int-across-hex-widths",
+    ),
+    LookupRangeCase(
+        start="a",
+        end="z",
+        expected_count=0,
+        test_id="empty",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupRangeCase._fields),
+    LOOKUP_RANGE_CASES,
+    ids=[case.test_id for case in LOOKUP_RANGE_CASES],
+)
+def test_lookup_range(
+    unihan_cihai: Cihai,
+    start: int | str,
+    end: int | str,
+    expected_count: int,
+    test_id: str,
+) -> None:
+    """lookup_range() returns the characters in range, in code point order."""
+    unihan = unihan_cihai.unihan
+    rows = unihan.lookup_range(start, end).all()
+    codepoints = [ord(row.char) for row in rows]
+
+    assert len(rows) == expected_count
+    assert codepoints == sorted(codepoints)
+    assert [r.codepoint for r in rows] == codepoints  # type: ignore[attr-defined]
+
+    raw = unihan.lookup_range(start, end, columns=["char"], raw=True).all()
+    assert [row.char for row in raw] == [row.char for row in rows]
+
+
+def test_lookup_range_uses_index(unihan_cihai: Cihai) -> None:
+    """Range lookups scan the codepoint index."""
+    unihan = unihan_cihai.unihan
+    statement = unihan.lookup_range(0x3400, 0x4DBF).statement
+    compiled = statement.compile(
+        unihan.sql.engine,
+        compile_kwargs={"literal_binds": True},
+    )
+    with unihan.sql.engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    assert "ix_Unihan_codepoint" in str(plan)
+
+
+def test_lookup_block(unihan_cihai: Cihai) -> None:
+    """lookup_block() returns every character of the block."""
+    unihan = unihan_cihai.unihan
+    rows = unihan.lookup_block("CJK Unified Ideographs Extension B").all()
+
+    assert len(rows) == 15
+    assert {block_name(row.char) for row in rows} == {
+        "CJK Unified Ideographs Extension B",
+    }
+    with pytest.raises(ValueError):
+        unihan.lookup_block("Basic Latin")
+
+
+def test_codepoint_column_added(
+    unihan_cihai: Cihai,
+    unihan_options: UnihanOptions,
+) -> None:
+    """Bootstrap adds and fills codepoint in tables imported without it."""
+    unihan = unihan_cihai.unihan
+    with unihan.sql.engine.begin() as conn:
+        conn.exec_driver_sql('DROP INDEX "ix_Unihan_codepoint"')
+        conn.exec_driver_sql('ALTER TABLE "Unihan" DROP COLUMN codepoint')
+    unihan.sql.metadata.clear()
+    unihan.sql.reflect_db()
+    assert not unihan.is_bootstrapped
+
+    unihan.bootstrap(dict(unihan_options))
+    assert unihan.is_bootstrapped
+    assert len(unihan.lookup_block("CJK Unified Ideographs Extension A").all()) == 731
+
+
+class LookupReadingCase(t.NamedTuple):
+    """Lookup by reading case."""
+
+    reading: str
+    system: str | list[str] | None
+    match: ReadingMatch
+    expected: str
+    test_id: str
+
+
+LOOKUP_READING_CASES = [
+    LookupReadingCase(
+        reading="qiū",
+        system=None,
+        match="exact",
+        expected="㐀",
+        test_id="exact-pinyin",
+    ),
+    LookupReadingCase(
+        reading="qiu",
+        system="kMandarin",
+        match="exact",
+        expected="",
+        test_id="exact-needs-tone",
+    ),
+    LookupReadingCase(
+        reading="qiu",
+        system=None,
+        match="toneless",
+        expected="㐀㐤",
+        test_id="toneless-all-systems",
+    ),
+    LookupReadingCase(
+        reading="jau1",
+        system="kCantonese",
+        match="exact",
+        expected="㐀",
+        test_id="exact-jyutping",
+    ),
+    LookupReadingCase(
+        reading="zaa",
+        system=["kCantonese"],
+        match="prefix",
+        expected="㐆㐱㑇㑜㑳㒡",
+        test_id="prefix-jyutping",
+    ),
+    LookupReadingCase(
+        reading="Han",
+        system="kJapaneseOn",
+        match="toneless",
+        expected="膰",
+        test_id="toneless-ignores-case",
+    ),
+    LookupReadingCase(
+        reading="qi",
+        system="kHanyuPinyin",
+        match="prefix",
+        expected="㐤㐸㑋㒅㓎",
+        test_id="prefix-after-location",
+    ),
+    LookupReadingCase(
+        reading="발",
+        system="kHangul",
+        match="exact",
+        expected="醱",
+        test_id="exact-hangul",
+    ),
+    LookupReadingCase(
+        reading="xia",
+        system="kHanyuPinlu",
+        match="exact",
+        expected="下",
+        test_id="exact-without-frequency",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupReadingCase._fields),
+    LOOKUP_READING_CASES,
+    ids=[case.test_id for case in LOOKUP_READING_CASES],
+)
+def test_lookup_reading(
+    unihan_cihai: Cihai,
+    reading: str,
+    system: str | list[str] | None,
+    match: ReadingMatch,
+    expected: str,
+    test_id: str,
+) -> None:
+    """lookup_reading() finds characters by reading, in code point order."""
+    rows = unihan_cihai.unihan.lookup_reading(reading, system=system, match=match)
+    assert "".join(row.char for row in rows) == expected
+
+
+def test_lookup_reading_uses_index(unihan_cihai: Cihai) -> None:
+    """Reading lookups search the readings table by index."""
+    unihan = unihan_cihai.unihan
+    with unihan.sql.engine.connect() as conn:
+        for match in READING_MATCHES:
+            statement = unihan.lookup_reading("qiu", match=match).statement
+            compiled = statement.compile(
+                unihan.sql.engine,
+                compile_kwargs={"literal_binds": True},
+            )
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+            assert "USING INDEX ix_Unihan_reading_reading" in str(plan)
+
+
+def test_lookup_reading_invalid(unihan_cihai: Cihai) -> None:
+    """lookup_reading() rejects fields other than readings and unknown matches."""
+    with pytest.raises(ValueError, match="reading fields"):
+        unihan_cihai.unihan.lookup_reading("qiu", system="kDefinition")
+    with pytest.raises(ValueError, match="match must be"):
+        unihan_cihai.unihan.lookup_reading("qiu", match="fuzzy")  # type: ignore[arg-type]
+
+
+class LookupNumericCase(t.NamedTuple):
+    """Integer column range lookup case."""
+
+    ranges: dict[str, NumericRange]
+    expected_count: int
+    expected_chars: str | None
+    test_id: str
+
+
+LOOKUP_NUMERIC_CASES = [
+    LookupNumericCase(
+        ranges={"total_strokes": (5, 8)},
+        expected_count=85,
+        expected_chars=None,
+        test_id="stroke-range",
+    ),
+    LookupNumericCase(
+        ranges={"total_strokes": 5},
+        expected_count=15,
+        expected_chars=None,
+        test_id="stroke-count",
+    ),
+    LookupNumericCase(
+        ranges={"primary_numeric": (101, None)},
+        expected_count=5,
+        expected_chars="万亿億兆千",
+        test_id="open-range-beyond-int32",
+    ),
+    LookupNumericCase(
+        ranges={"accounting_numeric": (None, None)},
+        expected_count=26,
+        expected_chars=None,
+        test_id="holding-a-value",
+    ),
+    LookupNumericCase(
+        ranges={"total_strokes": (5, 8), "primary_numeric": (None, None)},
+        expected_count=0,
+        expected_chars="",
+        test_id="all-ranges-match",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupNumericCase._fields),
+    LOOKUP_NUMERIC_CASES,
+    ids=[case.test_id for case in LOOKUP_NUMERIC_CASES],
+)
+def test_lookup_numeric(
+    unihan_cihai: Cihai,
+    ranges: dict[str, NumericRange],
+    expected_count: int,
+    expected_chars: str | None,
+    test_id: str,
+) -> None:
+    """lookup_numeric() compares integers, not strings, in code point order."""
+    unihan = unihan_cihai.unihan
+    rows = unihan.lookup_numeric(ranges).all()
+    codepoints = [ord(row.char) for row in rows]
+
+    assert len(rows) == expected_count
+    assert codepoints == sorted(codepoints)
+    if expected_chars is not None:
+        assert "".join(row.char for row in rows) == expected_chars
+    for row in rows:
+        for name, bounds in ranges.items():
+            value = getattr(row, name)
+            low, high = (bounds, bounds) if isinstance(bounds, int) else bounds
+            assert value is not None
+            assert low is None or value >= low
+            assert high is None or value <= high
+
+    raw = unihan.lookup_numeric(ranges, columns=["char"], raw=True).all()
+    assert [row.char for row in raw] == [row.char for row in rows]
+
+
+def test_lookup_numeric_uses_index(unihan_cihai: Cihai) -> None:
+    """Integer ranges scan the column's index."""
+    unihan = unihan_cihai.unihan
+    statement = unihan.lookup_numeric({"total_strokes": (5, 8)}).statement
+    compiled = statement.compile(
+        unihan.sql.engine,
+        compile_kwargs={"literal_binds": True},
+    )
+    with unihan.sql.engine.connect() as conn:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    assert "ix_Unihan_total_strokes" in str(plan)
+
+
+def test_lookup_numeric_invalid(unihan_cihai: Cihai) -> None:
+    """lookup_numeric() only ranges over the integer columns."""
+    with pytest.raises(ValueError, match="integer columns"):
+        unihan_cihai.unihan.lookup_numeric({"kTotalStrokes": (5, 8)})
+
+
+def test_numeric_columns_added(
+    unihan_cihai: Cihai,
+    unihan_options: UnihanOptions,
+) -> None:
+    """Bootstrap adds and fills the integer columns of tables imported without."""
+    unihan = unihan_cihai.unihan
+    with unihan.sql.engine.begin() as conn:
+        for name in bootstrap.NUMERIC_COLUMNS:
+            conn.exec_driver_sql(f'DROP INDEX "{bootstrap.index_name(name)}"')
+            conn.exec_driver_sql(f'ALTER TABLE "Unihan" DROP COLUMN {name}')
+    unihan.sql.metadata.clear()
+    unihan.sql.reflect_db()
+    assert not unihan.is_bootstrapped
+
+    unihan.bootstrap(dict(unihan_options))
+    assert unihan.is_bootstrapped
+    assert len(unihan.lookup_numeric({"total_strokes": (5, 8)}).all()) == 85
+
+
+class ByRadicalCase(t.NamedTuple):
+    """Radical/stroke lookup case."""
+
+    radical: int
+    strokes: int | None
+    simplified: bool | None
+    expected_count: int
+    expected_chars: str | None
+    test_id: str
+
+
+BY_RADICAL_CASES = [
+    ByRadicalCase(
+        radical=9,
+        strokes=None,
+        simplified=None,
+        expected_count=98,
+        expected_chars=None,
+        test_id="radical",
+    ),
+    ByRadicalCase(
+        radical=9,
+        strokes=5,
+        simplified=None,
+        expected_count=8,
+        expected_chars="㑁㑂㑃㑄㑅㑆㑇㑈",
+        test_id="residual-strokes",
+    ),
+    ByRadicalCase(
+        radical=120,
+        strokes=None,
+        simplified=True,
+        expected_count=1,
+        expected_chars="䌶",
+        test_id="simplified-radical",
+    ),
+    ByRadicalCase(
+        radical=120,
+        strokes=None,
+        simplified=False,
+        expected_count=0,
+        expected_chars="",
+        test_id="traditional-radical",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ByRadicalCase._fields),
+    BY_RADICAL_CASES,
+    ids=[case.test_id for case in BY_RADICAL_CASES],
+)
+def test_by_radical(
+    unihan_cihai: Cihai,
+    radical: int,
+    strokes: int | None,
+    simplified: bool | None,
+    expected_count: int,
+    expected_chars: str | None,
+    test_id: str,
+) -> None:
+    """by_radical() lists characters by residual strokes, then code point."""
+    rows = unihan_cihai.unihan.by_radical(radical, strokes, simplified).all()
+
+    assert len(rows) == expected_count
+    if expected_chars is not None:
+        assert "".join(row.char for row in rows) == expected_chars
+    keys = []
+    for row in rows:
+        value = row.kRSUnicode  # type: ignore[attr-defined]
+        residual = [s for r, _, s in parse_radical_strokes(value) if r == radical]
+        assert residual
+        keys.append((residual[0], ord(row.char)))
+    assert keys == sorted(keys)
+
+
+def test_by_radical_lists_once(unihan_cihai: Cihai) -> None:
+    """Characters listed under both forms of a radical are counted once."""
+    unihan = unihan_cihai.unihan
+    table = unihan.sql.metadata.tables[bootstrap.TABLE_NAME]
+    radicals = unihan.sql.metadata.tables[bootstrap.RADICAL_TABLE_NAME]
+    with unihan.sql.engine.begin() as conn:
+        conn.execute(
+            sqlalchemy.update(table)
+            .where(table.c.char == "䌶")
+            .values(kRSUnicode="120'.3 120.5"),
+        )
+        conn.execute(sqlalchemy.delete(radicals))
+        bootstrap.load_unihan_radicals(conn, radicals)
+
+    for strokes, expected in ((None, 3), (3, 3), (5, 5)):
+        query = unihan.by_radical(120, strokes)
+        rows = query.all()
+        assert [row.char for row in rows] == ["䌶"]
+        assert query.count() == 1
+        residual = query.with_entities(radicals.c.residual_strokes).scalar()
+        assert residual == expected
+
+
+def test_by_radical_uses_index(unihan_cihai: Cihai) -> None:
+    """Radical lookups seek the radical index, in its order."""
+    unihan = unihan_cihai.unihan
+    statement = unihan.by_radical(9, 5).statement
+    compiled = statement.compile(
+        unihan.sql.engine,
+        compile_kwargs={"literal_binds": True},
+    )
+    with unihan.sql.engine.connect() as conn:
+        plan = str(conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all())
+    assert "ix_Unihan_radical_radical (radical=? AND residual_strokes=?)" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,120 @@
+"""Tests for UNIHAN bootstrap timing and progress."""
+
+from __future__ import annotations
+
+import json
+import logging
+import typing as t
+
+import sqlalchemy
+
+from cihai.core import Cihai
+from cihai.data.unihan import bootstrap
+from cihai.data.unihan.instrument import (
+    BootstrapHooks,
+    BootstrapPhase,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+
+class RecordingHooks(BootstrapHooks):
+    """Keep the events of a bootstrap."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.progress_rows: list[int] = []
+        self.finished: list[BootstrapPhase] = []
+
+    def phase_started(self, name: str) -> None:
+        """Record start of phase ``name``."""
+        self.events.append(("started", name))
+
+    def progress(self, name: str, rows: int, bytes_read: int) -> None:
+        """Record rows of phase ``parse`` so far."""
+        if name == "parse":
+            self.progress_rows.append(rows)
+
+    def phase_finished(self, phase: BootstrapPhase) -> None:
+        """Record phase."""
+        self.events.append(("finished", phase.name))
+        self.finished.append(phase)
+
+
+def test_bootstrap_phases(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Each phase of a bootstrap is timed, reported to hooks and summed up."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'phases.db'}")
+    hooks = RecordingHooks()
+    report = bootstrap.bootstrap_unihan(
+        engine,
+        sqlalchemy.MetaData(),
+        dict(unihan_options),
+        chunk_size=200,
+        hooks=hooks,
+    )
+
+    names = [phase.name for phase in report.phases]
+    assert names[-5:] == ["create", "parse", "insert", "index", "publish"]
+    assert set(names) <= {"download", "extract", *names[-5:]}
+    assert hooks.finished == report.phases
+    for i, name in enumerate(names):
+        assert hooks.events.index(("started", name)) == 2 * i
+        assert hooks.events.index(("finished", name)) == 2 * i + 1
+
+    parse = report.phase("parse")
+    assert parse is not None
+    assert parse.bytes_read > 0
+    assert len(hooks.progress_rows) > 1
+    assert hooks.progress_rows == sorted(hooks.progress_rows)
+    assert hooks.progress_rows[-1] == parse.rows
+    insert = report.phase("insert")
+    assert insert is not None
+    assert insert.rows == 934
+    publish = report.phase("publish")
+    assert publish is not None
+    assert publish.rows > 0
+    assert report.phase("fts") is None
+    assert report.seconds == sum(phase.seconds for phase in report.phases)
+    assert all(phase.seconds >= 0 for phase in report.phases)
+
+    summary = json.loads(json.dumps(report.to_dict()))
+    assert summary["delta"]["inserted"] == 934
+    assert [phase["name"] for phase in summary["phases"]] == names
+
+
+def test_rebootstrap_phases(
+    unihan_cihai: Cihai,
+    unihan_options: dict[str, object],
+) -> None:
+    """Bootstraps of an imported UNIHAN only upgrade it, unless updating."""
+    report = unihan_cihai.unihan.bootstrap(dict(unihan_options))
+    assert [phase.name for phase in report.phases] == ["upgrade", "index"]
+
+    report = unihan_cihai.unihan.bootstrap(dict(unihan_options), update=True)
+    names = [phase.name for phase in report.phases]
+    assert names[0] == "upgrade"
+    assert names[-5:] == ["create", "parse", "insert", "publish", "index"]
+    insert = report.phase("insert")
+    assert insert is not None
+    assert insert.rows == 0
+
+
+def test_logging_hooks(
+    unihan_options: dict[str, object],
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Bootstraps log each phase by default."""
+    caplog.set_level(logging.INFO, logger="cihai.data.unihan.instrument")
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'log.db'}"}})
+    report = c.unihan.bootstrap(dict(unihan_options))
+
+    messages = [r.getMessage() for r in caplog.records if r.name.endswith("instrument")]
+    assert len(messages) == len(report.phases)
+    assert messages[-1].startswith("UNIHAN bootstrap publish took")
@@ -0,0 +1,172 @@
+"""Tests for the in-memory UNIHAN dataset."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from cihai.core import Cihai
+from cihai.data.unihan.memory import (
+    InMemoryUnihan,
+    UnihanNotBootstrappedError,
+    UnihanRow,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from cihai.data.unihan.dataset import ReverseMatch
+
+    from ...types import UnihanOptions
+
+
+@pytest.fixture
+def memory_unihan(unihan_cihai: Cihai) -> InMemoryUnihan:
+    """Return in-memory UNIHAN sharing the database of ``unihan_cihai``."""
+    unihan_cihai.add_dataset(InMemoryUnihan, namespace="memory")
+    memory = unihan_cihai.memory
+    assert isinstance(memory, InMemoryUnihan)
+    return memory
+
+
+def test_lookup_char(unihan_cihai: Cihai, memory_unihan: InMemoryUnihan) -> None:
+    """In-memory rows hold the same values as the database rows."""
+    names = memory_unihan.columns.columns
+    for row in unihan_cihai.unihan.with_fields([]):
+        memory_row = memory_unihan.lookup_char(row.char).first()
+        assert memory_row is not None
+        assert {n: getattr(memory_row, n) for n in names} == {
+            n: getattr(row, n) for n in names
+        }
+
+    assert memory_unihan.lookup_char("a").first() is None
+    assert memory_unihan.lookup_char("㐀㐭") == []
+
+
+def test_lookup_chars(memory_unihan: InMemoryUnihan) -> None:
+    """lookup_chars() returns an order-preserving mapping, misses included."""
+    results = memory_unihan.lookup_chars("㐭a㐀㐭")
+
+    assert list(results) == ["㐭", "a", "㐀"]
+    assert results["a"] is None
+    assert results["㐭"] == memory_unihan.lookup_char("㐭").first()
+
+
+class ReverseCharCase(t.NamedTuple):
+    """Reverse lookup case, compared against the SQL-backed dataset."""
+
+    hints: str | list[str]
+    fields: list[str] | None
+    match: ReverseMatch
+    test_id: str
+
+
+REVERSE_CHAR_CASES = [
+    ReverseCharCase(
+        hints="granary",
+        fields=None,
+        match="substring",
+        test_id="substring",
+    ),
+    ReverseCharCase(
+        hints=["U+4E18", "hillock"],
+        fields=None,
+        match="token",
+        test_id="token-multiple-hints",
+    ),
+    ReverseCharCase(
+        hints="ho",
+        fields=["kCantonese"],
+        match="prefix",
+        test_id="prefix-in-field",
+    ),
+    ReverseCharCase(
+        hints="wo",
+        fields=["kDefinition"],
+        match="substring",
+        test_id="short-substring-in-field",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ReverseCharCase._fields),
+    REVERSE_CHAR_CASES,
+    ids=[case.test_id for case in REVERSE_CHAR_CASES],
+)
+def test_reverse_char(
+    unihan_cihai: Cihai,
+    memory_unihan: InMemoryUnihan,
+    hints: str | list[str],
+    fields: list[str] | None,
+    match: ReverseMatch,
+    test_id: str,
+) -> None:
+    """reverse_char() matches the same rows as the SQL-backed dataset."""
+    expected = [
+        row.char for row in unihan_cihai.unihan.reverse_char(hints, fields, match)
+    ]
+    rows = memory_unihan.reverse_char(hints, fields, match)
+
+    assert expected
+    assert sorted(str(row.char) for row in rows) == sorted(expected)
+
+
+def test_reverse_char_invalid(memory_unihan: InMemoryUnihan) -> None:
+    """reverse_char() rejects unknown fields and match modes."""
+    with pytest.raises(ValueError):
+        memory_unihan.reverse_char("wood", fields=["kNotAField"])
+    with pytest.raises(ValueError):
+        memory_unihan.reverse_char("wood", match="regex")  # type: ignore[arg-type]
+
+
+def test_with_fields(unihan_cihai: Cihai, memory_unihan: InMemoryUnihan) -> None:
+    """with_fields() matches the same rows as the SQL-backed dataset."""
+    fields = ["kSemanticVariant", "kDefinition"]
+    expected = [row.char for row in unihan_cihai.unihan.with_fields(fields)]
+    rows = memory_unihan.with_fields(fields)
+
+    assert expected
+    assert sorted(str(row.char) for row in rows) == sorted(expected)
+    assert all(isinstance(row, UnihanRow) for row in rows)
+    for row in rows:
+        assert row.kSemanticVariant
+        assert list(row.untagged_vars("kSemanticVariant"))
+
+
+def test_columns_compact(memory_unihan: InMemoryUnihan) -> None:
+    """Columns hold each distinct value once, with narrow id arrays."""
+    columns = memory_unihan.columns
+
+    assert len(columns) == len(columns.index)
+    assert columns.nbytes > 0
+    assert columns.ids["kTotalStrokes"].typecode == "B"
+    assert columns.values["kTotalStrokes"][0] is None
+    assert len(set(columns.values["kTotalStrokes"])) == len(
+        columns.values["kTotalStrokes"],
+    )
+    assert columns is memory_unihan.columns
+
+
+def test_not_bootstrapped(
+    tmp_path: pathlib.Path,
+    unihan_options: UnihanOptions,
+) -> None:
+    """Lookups wait for bootstrap, which reloads the in-memory table."""
+    c = Cihai(
+        config={"database": {"url": f"sqlite:///{tmp_path / 'memory.db'}"}},
+        unihan=False,
+    )
+    c.add_dataset(InMemoryUnihan, namespace="unihan")
+    unihan = c.unihan
+    assert isinstance(unihan, InMemoryUnihan)
+    assert not unihan.is_bootstrapped
+    with pytest.raises(UnihanNotBootstrappedError):
+        unihan.lookup_char("㐭")
+
+    unihan.bootstrap(dict(unihan_options))
+    assert unihan.is_bootstrapped
+    row = unihan.lookup_char("㐭").first()
+    assert row is not None
+    assert "granary" in str(row.kDefinition)
@@ -0,0 +1,141 @@
+"""Tests for prebuilt UNIHAN database snapshots."""
+
+from __future__ import annotations
+
+import json
+import typing as t
+import zipfile
+
+import pytest
+import sqlalchemy
+
+from cihai.core import Cihai
+from cihai.data.unihan import bootstrap, snapshot
+from cihai.data.unihan.constants import UNIHAN_FIELDS
+from unihan_etl import core as unihan
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def snapshot_path(unihan_cihai: Cihai, tmp_path: pathlib.Path) -> pathlib.Path:
+    """Return snapshot of the UNIHAN fixtures."""
+    path = tmp_path / "unihan-snapshot.zip"
+    snapshot.write_unihan_snapshot(unihan_cihai.sql.engine, path)
+    return path
+
+
+def test_bootstrap_from_snapshot(
+    unihan_cihai: Cihai,
+    snapshot_path: pathlib.Path,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bootstrap installs a snapshot without downloading or parsing UNIHAN."""
+
+    def download(*args: t.Any, **kwargs: t.Any) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(unihan, "download", download)
+    monkeypatch.setattr(unihan, "extract_zip", download)
+
+    manifest = snapshot.read_unihan_snapshot_manifest(snapshot_path)
+    assert manifest.unihan_version == "9.0.0"
+    assert manifest.fields == sorted(UNIHAN_FIELDS)
+    assert manifest.rows == 934
+
+    c = Cihai(config={"database": {"url": f"sqlite:///{tmp_path / 'snap.db'}"}})
+    assert not c.unihan.is_bootstrapped
+    delta = c.unihan.bootstrap(snapshot=snapshot_path).delta
+
+    assert delta == bootstrap.UnihanDelta("9.0.0", 934, 0, 0, 0)
+    assert c.unihan.is_bootstrapped
+    assert c.unihan.version == "9.0.0"
+    for char in "㐀丘\U0002626d":
+        row = c.unihan.lookup_char(char).first()
+        expected = unihan_cihai.unihan.lookup_char(char).first()
+        assert row is not None
+        assert expected is not None
+        assert row.kDefinition == expected.kDefinition
+
+    assert c.unihan.bootstrap(snapshot=snapshot_path).delta is None
+
+
+class InvalidSnapshotCase(t.NamedTuple):
+    """Snapshot rejected before install."""
+
+    manifest: dict[str, t.Any]
+    match: str
+    test_id: str
+
+
+INVALID_SNAPSHOT_CASES = [
+    InvalidSnapshotCase(
+        manifest={"schema_version": bootstrap.SCHEMA_VERSION + 1},
+        match="schema version",
+        test_id="schema-version",
+    ),
+    InvalidSnapshotCase(
+        manifest={"fields": ["kDefinition"]},
+        match="fields differ",
+        test_id="fields",
+    ),
+    InvalidSnapshotCase(
+        manifest={"sha256": "0" * 64},
+        match="checksum",
+        test_id="checksum",
+    ),
+    InvalidSnapshotCase(
+        manifest={"unknown": True},
+        match="not a UNIHAN snapshot",
+        test_id="unreadable-manifest",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(InvalidSnapshotCase._fields),
+    INVALID_SNAPSHOT_CASES,
+    ids=[case.test_id for case in INVALID_SNAPSHOT_CASES],
+)
+def test_install_invalid_snapshot(
+    snapshot_path: pathlib.Path,
+    tmp_path: pathlib.Path,
+    manifest: dict[str, t.Any],
+    match: str,
+    test_id: str,
+) -> None:
+    """Snapshots not matching their manifest, or this cihai, are refused."""
+    invalid = tmp_path / "invalid.zip"
+    with (
+        zipfile.ZipFile(snapshot_path) as source,
+        zipfile.ZipFile(invalid, "w") as target,
+    ):
+        target.writestr(
+            snapshot.DATABASE_NAME,
+            source.read(snapshot.DATABASE_NAME),
+        )
+        original = json.loads(source.read(snapshot.MANIFEST_NAME))
+        target.writestr(snapshot.MANIFEST_NAME, json.dumps({**original, **manifest}))
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'invalid.db'}")
+    with pytest.raises(snapshot.UnihanSnapshotError, match=match):
+        snapshot.install_unihan_snapshot(engine, invalid)
+    assert not sqlalchemy.inspect(engine).get_table_names()
+
+
+def test_install_snapshot_into_non_empty_database(
+    unihan_cihai: Cihai,
+    snapshot_path: pathlib.Path,
+) -> None:
+    """Snapshots do not overwrite a database holding tables."""
+    with pytest.raises(snapshot.UnihanSnapshotError, match="empty database"):
+        snapshot.install_unihan_snapshot(unihan_cihai.sql.engine, snapshot_path)
+
+
+def test_write_snapshot_not_bootstrapped(tmp_path: pathlib.Path) -> None:
+    """Only bootstrapped databases are snapshotted."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    with pytest.raises(snapshot.UnihanSnapshotError, match="bootstrapped"):
+        snapshot.write_unihan_snapshot(engine, tmp_path / "empty.zip")
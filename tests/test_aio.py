@@ -0,0 +1,123 @@
+"""Tests for cihai's asyncio API."""
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+import pytest
+import sqlalchemy
+
+from cihai.aio import AsyncCihai
+
+if t.TYPE_CHECKING:
+    from cihai.core import Cihai
+
+pytest.importorskip("aiosqlite")
+
+
+def async_config(c: Cihai) -> dict[str, object]:
+    """Return config of an AsyncCihai on the database of ``c``."""
+    return {"database": {"url": c.sql.engine.url.render_as_string()}}
+
+
+def test_async_lookups(unihan_cihai: Cihai) -> None:
+    """Awaited lookups return the rows of the synchronous ones."""
+    unihan = unihan_cihai.unihan
+    chars = [row.char for row in unihan.with_fields(["kDefinition"])]
+
+    async def main() -> None:
+        async with AsyncCihai(config=async_config(unihan_cihai)) as c:
+            assert str(c.sql.engine.url).startswith("sqlite+aiosqlite://")
+
+            rows = await c.unihan.lookup_char("㐀")
+            assert [row.kDefinition for row in rows] == [
+                row.kDefinition for row in unihan.lookup_char("㐀")
+            ]
+            raw = await c.unihan.lookup_char("㐀", ["char", "ucn"], raw=True)
+            assert [tuple(row) for row in raw] == [("㐀", "U+3400")]
+
+            found = await c.unihan.lookup_chars(["㐀", "a"])
+            assert found["㐀"].char == "㐀"
+            assert found["a"] is None
+
+            matches = await c.unihan.reverse_char("wood", ["kDefinition"])
+            assert {row.char for row in matches} == {
+                row.char for row in unihan.reverse_char("wood", ["kDefinition"])
+            }
+
+            with_fields = await c.unihan.with_fields(["kDefinition"], ["char"])
+            assert [row.char for row in with_fields] == chars
+
+            streamed = [
+                row.char
+                async for row in c.unihan.iter_with_fields(
+                    ["kDefinition"],
+                    ["char"],
+                    batch_size=10,
+                )
+            ]
+            assert streamed == chars
+            raw_streamed = [
+                row.char
+                async for row in c.unihan.iter_with_fields(
+                    ["kDefinition"],
+                    ["char"],
+                    raw=True,
+                    batch_size=10,
+                )
+            ]
+            assert raw_streamed == chars
+
+    asyncio.run(main())
+
+
+def test_concurrent_lookups_overlap(unihan_cihai: Cihai) -> None:
+    """Lookups gathered together run their queries at the same time."""
+    unihan = unihan_cihai.unihan
+    chars = [row.char for row in unihan.with_fields(["kDefinition"])][:40]
+    expected = {char: unihan.lookup_char(char).one().kDefinition for char in chars}
+    running = 0
+    most_running = 0
+
+    def before(*args: t.Any) -> None:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+
+    def after(*args: t.Any) -> None:
+        nonlocal running
+        running -= 1
+
+    async def main() -> dict[str, str]:
+        async with AsyncCihai(config=async_config(unihan_cihai)) as c:
+            engine = c.sql.engine.sync_engine
+            sqlalchemy.event.listen(engine, "before_cursor_execute", before)
+            sqlalchemy.event.listen(engine, "after_cursor_execute", after)
+
+            async def lookup(char: str) -> tuple[str, str]:
+                rows = await c.unihan.lookup_char(char, ["char", "kDefinition"])
+                return char, rows[0].kDefinition
+
+            return dict(await asyncio.gather(*(lookup(char) for char in chars)))
+
+    assert asyncio.run(main()) == expected
+    assert most_running > 1
+    assert running == 0
+
+
+def test_async_cihai_without_unihan() -> None:
+    """AsyncCihai without UNIHAN has no dataset to await."""
+    config: dict[str, object] = {"database": {"url": "sqlite://"}}
+
+    def select_one() -> int | None:
+        return c.cihai.sql.session.execute(sqlalchemy.text("SELECT 1")).scalar()
+
+    c = AsyncCihai(config=config, unihan=False)
+
+    async def main() -> int | None:
+        async with c:
+            assert not hasattr(c, "unihan")
+            return await c.sql.run_sync(select_one)
+
+    assert asyncio.run(main()) == 1
@@ -0,0 +1,115 @@
+"""Test benchmarks/ found in cihai source directory.
+
+These only check that each benchmark still runs against the fixture data,
+timings are not asserted.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pathlib
+    import types
+
+    from .types import UnihanOptions
+
+
+def load_benchmark(benchmark: str, project_root: pathlib.Path) -> types.ModuleType:
+    """Load benchmark script as module via name and project root."""
+    file_path = f"{project_root}/benchmarks/{benchmark}.py"
+    module_name = "bench"
+
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    assert spec is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def test_lookup_chars(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test lookup_chars benchmark."""
+    benchmark = load_benchmark("lookup_chars", project_root=project_root)
+    timings = benchmark.run(
+        unihan_options=unihan_options,
+        config={"database": {"url": f"sqlite:///{tmp_path / 'bench.db'}"}},
+        text_length=200,
+        number=1,
+    )
+    assert set(timings) == {"lookup_char", "lookup_chars"}
+
+
+def test_in_memory_unihan(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test in_memory_unihan benchmark."""
+    benchmark = load_benchmark("in_memory_unihan", project_root=project_root)
+    timings = benchmark.run(
+        unihan_options=unihan_options,
+        config={"database": {"url": f"sqlite:///{tmp_path / 'bench.db'}"}},
+        number=1,
+    )
+    assert set(timings) == {"sql", "memory"}
+
+
+def test_with_fields_projection(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test with_fields_projection benchmark."""
+    benchmark = load_benchmark("with_fields_projection", project_root=project_root)
+    timings = benchmark.run(
+        unihan_options=unihan_options,
+        config={"database": {"url": f"sqlite:///{tmp_path / 'bench.db'}"}},
+        number=1,
+    )
+    assert set(timings) == {"orm", "orm_columns", "raw"}
+
+
+def test_bootstrap_memory(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+) -> None:
+    """Test bootstrap_memory benchmark."""
+    benchmark = load_benchmark("bootstrap_memory", project_root=project_root)
+    peaks = benchmark.run(unihan_options=unihan_options, chunk_size=200)
+    assert set(peaks) == {"buffered", "streamed"}
+    assert peaks["streamed"] < peaks["buffered"]
+
+
+def test_bootstrap_profile(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+) -> None:
+    """Test bootstrap_profile benchmark."""
+    benchmark = load_benchmark("bootstrap_profile", project_root=project_root)
+    timings = benchmark.run(unihan_options=unihan_options, number=1)
+    assert set(timings) == {"default", "bulk_load"}
+
+
+def test_lazy_construction(
+    unihan_options: UnihanOptions,
+    project_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test lazy_construction benchmark."""
+    benchmark = load_benchmark("lazy_construction", project_root=project_root)
+    timings = benchmark.run(
+        unihan_options=unihan_options,
+        config={"database": {"url": f"sqlite:///{tmp_path / 'bench.db'}"}},
+        number=1,
+    )
+    assert set(timings) == {"eager", "lazy", "lazy_first_lookup"}
@@ -0,0 +1,115 @@
+"""Tests for cihai's result caches."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from cihai.cache import LRUCache
+
+
+class EvictionCase(t.NamedTuple):
+    """LRU eviction case."""
+
+    maxsize: int | None
+    maxbytes: int | None
+    entries: list[tuple[str, int]]
+    touched: list[str]
+    expected_keys: list[str]
+    expected_evictions: int
+    test_id: str
+
+
+EVICTION_CASES = [
+    EvictionCase(
+        maxsize=2,
+        maxbytes=None,
+        entries=[("a", 0), ("b", 0), ("c", 0)],
+        touched=[],
+        expected_keys=["b", "c"],
+        expected_evictions=1,
+        test_id="maxsize-oldest-first",
+    ),
+    EvictionCase(
+        maxsize=2,
+        maxbytes=None,
+        entries=[("a", 0), ("b", 0), ("c", 0)],
+        touched=["a"],
+        expected_keys=["a", "c"],
+        expected_evictions=1,
+        test_id="maxsize-least-recently-used",
+    ),
+    EvictionCase(
+        maxsize=None,
+        maxbytes=100,
+        entries=[("a", 40), ("b", 40), ("c", 40)],
+        touched=[],
+        expected_keys=["b", "c"],
+        expected_evictions=1,
+        test_id="maxbytes",
+    ),
+    EvictionCase(
+        maxsize=None,
+        maxbytes=100,
+        entries=[("a", 40), ("b", 40), ("c", 101)],
+        touched=[],
+        expected_keys=["a", "b"],
+        expected_evictions=0,
+        test_id="maxbytes-oversized-entry-skipped",
+    ),
+    EvictionCase(
+        maxsize=None,
+        maxbytes=None,
+        entries=[("a", 40), ("b", 40), ("c", 40)],
+        touched=[],
+        expected_keys=["a", "b", "c"],
+        expected_evictions=0,
+        test_id="unbounded",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(EvictionCase._fields),
+    EVICTION_CASES,
+    ids=[case.test_id for case in EVICTION_CASES],
+)
+def test_lru_cache_eviction(
+    maxsize: int | None,
+    maxbytes: int | None,
+    entries: list[tuple[str, int]],
+    touched: list[str],
+    expected_keys: list[str],
+    expected_evictions: int,
+    test_id: str,
+) -> None:
+    """LRUCache drops least recently used entries to stay within its bounds."""
+    cache = LRUCache(maxsize=maxsize, maxbytes=maxbytes)
+    for key, nbytes in entries[:-1]:
+        cache.set(key, key.upper(), nbytes=nbytes)
+    for key in touched:
+        assert cache.get(key) == key.upper()
+    key, nbytes = entries[-1]
+    cache.set(key, key.upper(), nbytes=nbytes)
+
+    info = cache.info()
+    assert info.evictions == expected_evictions
+    assert info.currsize == len(cache) == len(expected_keys)
+    assert info.currbytes == sum(n for k, n in entries if k in expected_keys)
+    assert info.hits == len(touched)
+    for key, _ in entries:
+        assert (cache.get(key) is not None) == (key in expected_keys)
+
+
+def test_lru_cache_clear() -> None:
+    """clear() drops entries but keeps counters."""
+    cache = LRUCache()
+    cache.set("a", 1, nbytes=10)
+    cache.set("a", 2, nbytes=20)
+    assert cache.get("a") == 2
+    assert cache.info().currbytes == 20
+
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.info()._replace(maxsize=None) == (1, 1, 0, 0, 0, None, None)
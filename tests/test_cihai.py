@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import typing as t
 
+import pytest
+
 import cihai
+from cihai import extend
 from cihai.constants import UNIHAN_CONFIG
 from cihai.core import Cihai
 from cihai.data.unihan import bootstrap, constants as unihan_constants
@@ -65,6 +68,9 @@ def test_unihan_options(
         *unihan_constants.UNIHAN_FIELDS,
         "ucn",
         "char",
+        "codepoint",
+        "content_hash",
+        *bootstrap.NUMERIC_COLUMNS,
     }
     assert bootstrap.is_bootstrapped(app.sql.metadata)
 
@@ -83,3 +89,66 @@ def test_cihai_without_unihan() -> None:
         "app can be initialized without unihan"
     )
     assert not hasattr(app, "unihan")
+
+
+def test_lazy_cihai(unihan_cihai: Cihai) -> None:
+    """Lazy Cihai connects and adds datasets on first access, like eager Cihai."""
+    config: dict[str, object] = {
+        "database": {"url": unihan_cihai.sql.engine.url.render_as_string()},
+        "plugins": {
+            "unihan": {"variants": "cihai.data.unihan.dataset.UnihanVariants"},
+        },
+    }
+    eager = Cihai(config=config)
+    app = Cihai(config=config, lazy=True)
+    assert app.config == eager.config
+    assert "sql" not in vars(app)
+    assert "unihan" not in vars(app)
+
+    assert app.unihan.is_bootstrapped
+    assert app.sql is app.unihan.sql
+    assert (app.unihan.cache is None) == (eager.unihan.cache is None)
+    assert app.unihan.variants.sql is app.sql  # type: ignore[attr-defined]
+    assert set(vars(app.unihan)) == set(vars(eager.unihan))
+
+    char = app.unihan.lookup_char("㐀").first()
+    expected = eager.unihan.lookup_char("㐀").first()
+    assert char is not None
+    assert expected is not None
+    assert char.kDefinition == expected.kDefinition
+
+
+def test_lazy_cihai_without_unihan() -> None:
+    """Lazy Cihai without UNIHAN has no dataset to add."""
+    app = Cihai(unihan=False, lazy=True)
+    assert not hasattr(app, "unihan")
+    assert "sql" not in vars(app)
+
+
+def test_bootstrap_adds_datasets_before_plugins() -> None:
+    """Eager Cihai adds every dataset, then every plugin."""
+    added: list[str] = []
+
+    class Words(extend.Dataset):
+        def __init__(self) -> None:
+            added.append("words")
+
+    class Radicals(extend.Dataset):
+        def __init__(self) -> None:
+            added.append("radicals")
+
+    class Counts(extend.DatasetPlugin):
+        def __init__(self) -> None:
+            added.append("counts")
+
+    config: dict[str, object] = {
+        "database": {"url": "sqlite://"},
+        "datasets": {"words": Words, "radicals": Radicals},
+        "plugins": {"words": {"counts": Counts}},
+    }
+    app = Cihai(config=config, unihan=False)
+    assert added == ["words", "radicals", "counts"]
+    assert isinstance(app.words.counts, Counts)
+
+    with pytest.raises(AttributeError):
+        app.sounds  # noqa: B018
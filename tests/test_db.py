@@ -0,0 +1,322 @@
+"""Tests for cihai's database and its reflection cache."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import sqlite3
+import threading
+import time
+import typing as t
+
+import pytest
+import sqlalchemy
+
+from cihai import db, extend
+from cihai.core import Cihai
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def reflections(monkeypatch: pytest.MonkeyPatch) -> list[sqlalchemy.MetaData]:
+    """Record each reflection of a database."""
+    calls: list[sqlalchemy.MetaData] = []
+    reflect = sqlalchemy.MetaData.reflect
+
+    def counted(self: sqlalchemy.MetaData, *args: t.Any, **kwargs: t.Any) -> None:
+        calls.append(self)
+        reflect(self, *args, **kwargs)
+
+    monkeypatch.setattr(sqlalchemy.MetaData, "reflect", counted)
+    return calls
+
+
+def test_reflection_cached(
+    unihan_cihai: Cihai,
+    cache_path: pathlib.Path,
+    reflections: list[sqlalchemy.MetaData],
+) -> None:
+    """Cihai reuses the tables reflected last time while the schema holds."""
+    url = unihan_cihai.sql.engine.url.render_as_string()
+    assert list((cache_path / "reflection").iterdir())
+
+    c = Cihai(config={"database": {"url": url}})
+    assert not reflections
+    assert c.unihan.is_bootstrapped
+    row = c.unihan.lookup_char("㐀").first()
+    assert row is not None
+    assert row.kDefinition
+
+    c.sql.reflect_db()
+    assert len(reflections) == 1
+
+
+def test_reflection_cache_invalidated(
+    unihan_cihai: Cihai,
+    reflections: list[sqlalchemy.MetaData],
+) -> None:
+    """Schema changes made since the tables were cached are reflected."""
+    engine = unihan_cihai.sql.engine
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE added (id INTEGER PRIMARY KEY)")
+
+    url = engine.url.render_as_string()
+    c = Cihai(config={"database": {"url": url}})
+    assert len(reflections) == 1
+    assert "added" in c.sql.metadata.tables
+
+    Cihai(config={"database": {"url": url}})
+    assert len(reflections) == 1
+
+
+def test_reflection_cache_skips_dropped_tables(
+    tmp_path: pathlib.Path,
+    reflections: list[sqlalchemy.MetaData],
+) -> None:
+    """Tables dropped after a reflection are not cached as still present."""
+    url = f"sqlite:///{tmp_path / 'dropped.db'}"
+    c = Cihai(config={"database": {"url": url}})
+    with c.sql.engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE dropped (id INTEGER PRIMARY KEY)")
+    c.sql.reflect_db()
+    with c.sql.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE dropped")
+    c.sql.reflect_db()
+    assert "dropped" in c.sql.metadata.tables
+
+    assert "dropped" not in Cihai(config={"database": {"url": url}}).sql.metadata.tables
+
+
+class UncachedCase(t.NamedTuple):
+    """Database whose reflection is not cached."""
+
+    url: str
+    test_id: str
+
+
+UNCACHED_CASES = [
+    UncachedCase(url="sqlite://", test_id="in-memory"),
+    UncachedCase(url="sqlite:///:memory:", test_id="named-in-memory"),
+]
+
+
+@pytest.mark.parametrize(
+    list(UncachedCase._fields),
+    UNCACHED_CASES,
+    ids=[case.test_id for case in UNCACHED_CASES],
+)
+def test_reflection_not_cached(
+    cache_path: pathlib.Path,
+    reflections: list[sqlalchemy.MetaData],
+    url: str,
+    test_id: str,
+) -> None:
+    """Databases without a schema fingerprint are reflected every time."""
+    Cihai(config={"database": {"url": url}})
+    Cihai(config={"database": {"url": url}})
+    assert len(reflections) == 2
+    assert not (cache_path / "reflection").exists()
+
+
+def test_reflection_cache_unreadable(
+    unihan_cihai: Cihai,
+    cache_path: pathlib.Path,
+    reflections: list[sqlalchemy.MetaData],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A corrupt cache is reflected over, with a warning."""
+    engine = unihan_cihai.sql.engine
+    path = db.reflection_cache_path(unihan_cihai.config, engine)
+    assert path is not None
+    assert path.parent == cache_path / "reflection"
+    path.write_text("not json")
+
+    c = Cihai(config={"database": {"url": engine.url.render_as_string()}})
+    assert len(reflections) == 1
+    assert c.unihan.is_bootstrapped
+    assert "unreadable reflection cache" in caplog.text
+
+    fingerprint = db.schema_fingerprint(engine)
+    assert fingerprint is not None
+    assert db.load_reflection(path, fingerprint, engine.dialect) is not None
+
+
+def test_reflection_cache_is_data(
+    unihan_cihai: Cihai,
+    reflections: list[sqlalchemy.MetaData],
+) -> None:
+    """The cache is a JSON description of the schema, rebuilt as reflected."""
+    engine = unihan_cihai.sql.engine
+    path = db.reflection_cache_path(unihan_cihai.config, engine)
+    assert path is not None
+    assert path.suffix == ".json"
+    cached = json.loads(path.read_text())
+    assert {table["name"] for table in cached["tables"]} == set(
+        unihan_cihai.sql.metadata.tables,
+    )
+
+    c = Cihai(config={"database": {"url": engine.url.render_as_string()}})
+    assert not reflections
+    reflected = sqlalchemy.MetaData()
+    reflected.reflect(bind=engine, views=True)
+    assert db.describe_tables(c.sql.metadata, engine.dialect) == db.describe_tables(
+        reflected,
+        engine.dialect,
+    )
+
+
+def test_session_per_thread(unihan_cihai: Cihai) -> None:
+    """Lookups from many threads use a session each and agree with serial ones."""
+    chars = [row.char for row in unihan_cihai.unihan.with_fields(["kDefinition"])]
+    expected = {
+        char: row.kDefinition
+        for char in chars
+        if (row := unihan_cihai.unihan.lookup_char(char).first()) is not None
+    }
+    sql = unihan_cihai.sql
+    sessions = set()
+
+    def lookup(char: str) -> tuple[str, str | None]:
+        sessions.add(id(sql.session))
+        row = unihan_cihai.unihan.lookup_char(char).first()
+        definition = None if row is None else row.kDefinition
+        sql.remove_session()
+        return char, definition
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = dict(executor.map(lookup, chars * 5))
+
+    assert results == expected
+    assert len(sessions) > 1
+
+
+def test_lazy_cihai_across_threads(unihan_cihai: Cihai) -> None:
+    """Threads first using a lazy Cihai together share one database."""
+    url = unihan_cihai.sql.engine.url.render_as_string()
+    c = Cihai(config={"database": {"url": url}}, lazy=True)
+    barrier = threading.Barrier(4)
+
+    def first_use(_: int) -> tuple[int, int]:
+        barrier.wait()
+        return id(c.unihan), id(c.sql)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        assert len(set(executor.map(first_use, range(4)))) == 1
+
+
+class SlowDataset(extend.Dataset, extend.SQLAlchemyMixin):
+    """Dataset taking a while to construct."""
+
+    def __init__(self) -> None:
+        time.sleep(0.05)
+
+
+class Counts(extend.DatasetPlugin):
+    """Plugin of :class:`SlowDataset`."""
+
+
+def test_lazy_dataset_complete_across_threads() -> None:
+    """Threads first using a lazy dataset see it once complete, with plugins."""
+    c = Cihai(
+        config={
+            "database": {"url": "sqlite://"},
+            "datasets": {"slow": SlowDataset},
+            "plugins": {"slow": {"counts": Counts}},
+        },
+        unihan=False,
+        lazy=True,
+    )
+    barrier = threading.Barrier(8)
+
+    def first_use(_: int) -> int:
+        barrier.wait()
+        dataset = c.slow
+        assert dataset.sql is c.sql
+        assert isinstance(dataset.counts, Counts)
+        return id(dataset)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        assert len(set(executor.map(first_use, range(8)))) == 1
+
+
+def test_session_scope(unihan_cihai: Cihai) -> None:
+    """session_scope() yields a session of its own, closed afterwards."""
+    sql = unihan_cihai.sql
+    Unihan = sql.base.classes.Unihan
+    with sql.session_scope() as session:
+        assert session is not sql.session
+        row = session.query(Unihan).filter_by(char="㐀").one()
+        assert row in session
+    assert row not in session
+
+
+class EngineOptionsCase(t.NamedTuple):
+    """Pool options of the ``database`` config."""
+
+    database: dict[str, object]
+    expected_size: int
+    expected_overflow: int
+    expected_recycle: int
+    test_id: str
+
+
+ENGINE_OPTIONS_CASES = [
+    EngineOptionsCase(
+        database={},
+        expected_size=5,
+        expected_overflow=10,
+        expected_recycle=-1,
+        test_id="defaults",
+    ),
+    EngineOptionsCase(
+        database={"pool_size": 2, "max_overflow": 0, "pool_recycle": 3600},
+        expected_size=2,
+        expected_overflow=0,
+        expected_recycle=3600,
+        test_id="configured",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(EngineOptionsCase._fields),
+    ENGINE_OPTIONS_CASES,
+    ids=[case.test_id for case in ENGINE_OPTIONS_CASES],
+)
+def test_engine_options(
+    tmp_path: pathlib.Path,
+    database: dict[str, object],
+    expected_size: int,
+    expected_overflow: int,
+    expected_recycle: int,
+    test_id: str,
+) -> None:
+    """Pool options of the config are passed to the engine."""
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    c = Cihai(config={"database": {"url": url, **database}}, unihan=False)
+    pool = c.sql.engine.pool
+    assert isinstance(pool, sqlalchemy.QueuePool)
+    assert pool.size() == expected_size
+    assert pool._max_overflow == expected_overflow
+    assert pool._recycle == expected_recycle
+
+
+def test_check_same_thread(tmp_path: pathlib.Path) -> None:
+    """check_same_thread is passed to SQLite, and refused for other databases."""
+    url = f"sqlite:///{tmp_path / 'thread.db'}"
+    c = Cihai(config={"database": {"url": url, "check_same_thread": True}})
+    with (
+        c.sql.engine.connect() as conn,
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        dbapi_conn = conn.connection.driver_connection
+        assert dbapi_conn is not None
+        future = executor.submit(dbapi_conn.execute, "SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            future.result()
+
+    config = {"database": {"url": "postgresql://", "check_same_thread": False}}
+    with pytest.raises(ValueError, match="only supported by SQLite"):
+        db.engine_options(config)  # type: ignore[arg-type]